@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+# Longest first so ".tar.gz" wins over ".gz"-less matches like ".tar".
+ARCHIVE_SUFFIXES = (
+    ".tar.bz2",
+    ".tar.gz",
+    ".tar.xz",
+    ".tbz2",
+    ".tgz",
+    ".txz",
+    ".tar",
+    ".whl",
+    ".zip",
+)
+
+# Package metadata whose long_description is audited: the sdist's top-level
+# PKG-INFO and the wheel's .dist-info/METADATA.
+_METADATA = re.compile(r"^[^/]+/PKG-INFO$|^PKG-INFO$|^[^/]+\.dist-info/METADATA$")
+_README = re.compile(r"^readme(\.md|\.markdown)?$", re.IGNORECASE)
+
+
+class ArchiveError(Exception):
+    """An archive could not be read (truncated, corrupt, or not an archive at all)."""
+
+
+def is_archive(path: Path) -> bool:
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def member_name(archive: Path, member: str) -> str:
+    """Report filename for a member: ``dist/pkg-1.0.tar.gz!/pkg-1.0/README.md``."""
+    return f"{archive}!/{member}"
+
+
+def _wanted(member: str) -> bool:
+    base = member.rsplit("/", 1)[-1]
+    return (
+        bool(_README.match(base)) or base.lower().endswith(".md") or bool(_METADATA.match(member))
+    )
+
+
+def long_description(metadata: str) -> Optional[str]:
+    """The markdown long_description from PKG-INFO/METADATA text, if there is one.
+
+    Newer metadata carries it as the message body, older versions in a
+    folded ``Description`` header. Descriptions that are not declared as
+    ``text/markdown`` (reStructuredText is the default) are not returned.
+    """
+    from email.parser import HeaderParser
+
+    msg = HeaderParser().parsestr(metadata)
+    if not (msg.get("Description-Content-Type") or "").strip().lower().startswith("text/markdown"):
+        return None
+    body = msg.get_payload()
+    if isinstance(body, str) and body.strip():
+        return body
+    folded = msg.get("Description")
+    if not folded:
+        return None
+    first, *rest = str(folded).splitlines()
+    unfolded = [first] + [line[8:] if line.startswith(" " * 8) else line.lstrip() for line in rest]
+    return "\n".join(line[1:] if line.startswith("|") else line for line in unfolded) + "\n"
+
+
+def _text(member: str, data: bytes) -> Optional[str]:
+    text = data.decode("utf-8", errors="replace")
+    if _METADATA.match(member):
+        return long_description(text)
+    return text
+
+
+def iter_archive(path: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(report_name, content)`` for each auditable member of an archive.
+
+    Members are README files, ``*.md`` files and the markdown long_description
+    of the package metadata. Everything is read in memory from ``tarfile`` or
+    ``zipfile``; nothing is extracted to disk. Tar archives are read in one
+    sequential pass, so compressed sdists are only decompressed once.
+
+    A damaged archive raises ``ArchiveError``, possibly after yielding the
+    members that could still be read.
+    """
+    import tarfile
+    import zipfile
+    import zlib
+
+    try:
+        yield from _iter_members(path)
+    except (tarfile.TarError, zipfile.BadZipFile, zlib.error, OSError, EOFError) as e:
+        raise ArchiveError(f"cannot read {path}: {e}") from e
+
+
+def _iter_members(path: Path) -> Iterator[Tuple[str, str]]:
+    if path.name.lower().endswith((".whl", ".zip")):
+        import zipfile
+
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.is_dir() or not _wanted(info.filename):
+                    continue
+                text = _text(info.filename, zf.read(info))
+                if text is not None:
+                    yield member_name(path, info.filename), text
+        return
+
+    import tarfile
+
+    with tarfile.open(path, "r:*") as tf:
+        for member in tf:
+            if not member.isfile() or not _wanted(member.name):
+                continue
+            fh = tf.extractfile(member)
+            assert fh is not None
+            text = _text(member.name, fh.read())
+            if text is not None:
+                yield member_name(path, member.name), text
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import Issue
+
+DEFAULT_CACHE_DIR = ".readme-auditor-cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _issue_to_dict(issue: Issue) -> Dict[str, object]:
+    return {
+        "rule_id": issue.rule_id,
+        "severity": issue.severity,
+        "line": issue.line,
+        "text": issue.text,
+        "explanation": issue.explanation,
+        "suggestion": issue.suggestion,
+        "context": dict(issue.context) if issue.context else None,
+    }
+
+
+def _issue_from_dict(item: Dict[str, Any], filename: Optional[str] = None) -> Issue:
+    for key in ("rule_id", "severity", "explanation", "suggestion"):
+        item[key] = sys.intern(item[key])
+    return Issue(**item, filename=filename)
+
+
+class ResultCache:
+    """Content-addressed on-disk store of audit results.
+
+    Entries are keyed by a hash of the document content and a digest of
+    everything else that can change the findings (effective config, rule
+    versions). Each entry is one small JSON file, written to a temporary file
+    and moved into place with ``os.replace``, so concurrent processes never
+    observe partial entries. Hits refresh the entry's mtime and eviction drops
+    the least recently used entries once the directory exceeds ``max_bytes``.
+    """
+
+    def __init__(self, root: Path = Path(DEFAULT_CACHE_DIR), *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._written = 0
+
+    def key(self, content: str, digest: str) -> str:
+        h = hashlib.sha256(content.encode("utf-8"))
+        h.update(b"\0")
+        h.update(digest.encode("ascii"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str, filename: Optional[str] = None) -> Optional[List[Issue]]:
+        """Stored issues for ``key``, built with ``filename`` filled in; None on a miss."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            issues = [_issue_from_dict(item, filename) for item in data["issues"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with suppress(OSError):  # evicted by another process
+            os.utime(path)
+        return issues
+
+    def put(self, key: str, issues: List[Issue]) -> None:
+        path = self._path(key)
+        import tempfile  # only needed once something is written
+
+        payload = json.dumps({"issues": [_issue_to_dict(i) for i in issues]}, separators=(",", ":"))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            # A read-only or full disk must not fail the audit itself.
+            return
+        self._written += len(payload)
+        if self._written * 8 >= self.max_bytes:
+            self.prune()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries: List[Tuple[float, int, str]] = []
+        try:
+            shards = list(os.scandir(self.root))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            try:
+                with os.scandir(shard.path) as it:
+                    for entry in it:
+                        try:
+                            st = entry.stat()
+                        except OSError:  # pragma: no cover - removed concurrently
+                            continue
+                        entries.append((st.st_mtime, st.st_size, entry.path))
+            except OSError:  # pragma: no cover - removed concurrently
+                continue
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def prune(self) -> None:
+        """Evict least recently used entries until the cache fits in 90% of ``max_bytes``."""
+        self._written = 0
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 9 // 10
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            with suppress(OSError):  # another process got there first
+                os.unlink(path)
+            total -= size
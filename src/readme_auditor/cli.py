@@ -1,26 +1,61 @@
 from __future__ import annotations
 
+import itertools
 import json
 import os
+import sys
+from contextlib import suppress
 from pathlib import Path
-from typing import List, Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Set, TextIO, Tuple, Union
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from typer.core import TyperGroup
 
-from .config import load_config
-from .engine import AuditEngine
-from .formatters.human import HumanFormatter
+from .archives import ARCHIVE_SUFFIXES, is_archive
+from .cache import DEFAULT_CACHE_DIR, ResultCache
+from .config import config_to_dict, load_config
+from .engine import AuditEngine, merge_summaries
 from .formatters.json import JsonFormatter
-from .models import Severity
+from .formatters.ndjson import NdjsonFormatter
+from .models import AuditReport, AuditSummary, Config, Severity
+from .parallel import DEFAULT_READERS, audit_paths, write_in_order
+from .profiling import Profiler
+from .walker import IgnoreRules, iter_markdown, select_markdown
 
-app = typer.Typer(add_completion=False, help="Rule-based, explainable README auditor.")
+if TYPE_CHECKING:  # pragma: no cover
+    from .formatters.human import HumanFormatter
+    from .journal import Journal
+    from .table import IssueTable
 
+# Rich is only imported on the paths that render with it (human output,
+# --list-rules, --profile) so JSON/CI runs start faster.
 
-def _collect_targets(path: Path) -> List[Path]:
+DEFAULT_COMMAND = "audit"
+
+
+class _DefaultCommandGroup(TyperGroup):
+    """Route ``readme-auditor README.md ...`` to the ``audit`` command.
+
+    Subcommands (``serve``, ...) are matched by name; anything else is treated
+    as arguments to the default command, so the original CLI keeps working.
+    """
+
+    # ``ctx`` is a click.Context, which newer typer releases vendor instead of
+    # importing click, so there is no single import path for the annotation.
+    def parse_args(self, ctx: Any, args: List[str]) -> List[str]:
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [DEFAULT_COMMAND, *args]
+        return super().parse_args(ctx, args)
+
+
+app = typer.Typer(cls=_DefaultCommandGroup, add_completion=False, help="Rule-based, explainable README auditor.")
+
+
+def _collect_targets(path: Path, *, archives: bool = False) -> List[Path]:
     if path.is_file():
         return [path]
+    bundled = sorted(p for p in path.iterdir() if p.is_file() and is_archive(p)) if archives else []
     # directory: audit README files (common convention) and any *.md at root
     candidates: List[Path] = []
     for name in ("README.md", "readme.md", "README.MD", "Readme.md"):
@@ -28,12 +63,12 @@ def _collect_targets(path: Path) -> List[Path]:
         if p.exists() and p.is_file():
             candidates.append(p)
     if candidates:
-        return candidates
+        return candidates + bundled
     # fallback: top-level markdown files
     for p in sorted(path.glob("*.md")):
         if p.is_file():
             candidates.append(p)
-    return candidates
+    return candidates + bundled
 
 
 def _severity(value: str) -> Severity:
@@ -43,22 +78,128 @@ def _severity(value: str) -> Severity:
     return v  # type: ignore[return-value]
 
 
-@app.command()
+def _write_empty_outputs(fmt: str, output: Optional[Path], issues_csv: Optional[Path]) -> None:
+    """Outputs of a run that had nothing to audit, so later CI steps still find the files they asked for."""
+    summary = ""
+    if fmt == "ndjson":
+        empty = AuditSummary(total=0, errors=0, warnings=0, info=0)
+        summary = NdjsonFormatter().render_summary(empty, files=0, passed=True) + "\n"
+    if output is not None:
+        output.write_text(summary, encoding="utf-8")
+    elif summary:
+        sys.stdout.write(summary)
+    if issues_csv is not None:
+        from .table import IssueTable
+
+        with issues_csv.open("w", encoding="utf-8", newline="") as fh:
+            IssueTable().write_csv(fh)
+
+
+def _run_watch(engine: AuditEngine, targets: List[Path], fmt: str, cfg: Config, interval: float) -> None:
+    from .watch import FindingsDiff, Watcher
+
+    formatter: Union[HumanFormatter, JsonFormatter, NdjsonFormatter]
+    if fmt == "human":
+        from .formatters.human import HumanFormatter
+
+        formatter = HumanFormatter(color=cfg.color, show_suggestions=cfg.show_suggestions)
+    else:
+        formatter = NdjsonFormatter()
+    shown: Set[str] = set()
+
+    def emit(diff: FindingsDiff) -> None:
+        # Full report the first time a file is seen, only the changes afterwards.
+        if diff.filename not in shown:
+            shown.add(diff.filename)
+            formatter.print(diff.report)
+        elif fmt == "human":
+            s = diff.report.summary
+            typer.echo(f"{diff.filename}: +{len(diff.added)} new, -{len(diff.resolved)} resolved ({s.total} open)")
+            for i in diff.added:
+                typer.echo(f"  + {i.severity.upper()} {i.rule_id} (line {i.line}): {i.text}")
+            for i in diff.resolved:
+                typer.echo(f"  - {i.severity.upper()} {i.rule_id}: {i.text}")
+        else:
+            typer.echo(json.dumps(diff.as_json_dict(), separators=(",", ":")))
+
+    with suppress(KeyboardInterrupt):
+        Watcher(engine, targets, interval=interval).run(emit)
+
+
+@app.command(DEFAULT_COMMAND)
 def main(
     target: Path = typer.Argument(..., help="Path to README.md or a directory"),
-    format: str = typer.Option("human", "--format", help="human or json"),
+    format: str = typer.Option("human", "--format", help="human, json, or ndjson"),
     config: Optional[Path] = typer.Option(None, "--config", help="Path to auditor TOML config"),
     fail_on: str = typer.Option("error", "--fail-on", callback=lambda v: _severity(v), help="info, warning, or error"),
     output: Optional[Path] = typer.Option(None, "--output", help="Write report to file"),
     list_rules: bool = typer.Option(False, "--list-rules", help="List all available rules and exit"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Worker processes (default: CPU count)"),
+    recursive: bool = typer.Option(False, "--recursive", "-r", help="Audit README.md files in all subdirectories"),
+    exclude: Optional[List[str]] = typer.Option(
+        None, "--exclude", help="Gitignore-style glob to skip in --recursive mode (repeatable)"
+    ),
+    cache: bool = typer.Option(False, "--cache/--no-cache", help="Reuse results for unchanged files across runs"),
+    cache_dir: Path = typer.Option(Path(DEFAULT_CACHE_DIR), "--cache-dir", help="Result cache location"),
+    profile: bool = typer.Option(False, "--profile", help="Time each phase and rule; print a table to stderr"),
+    daemon: Optional[str] = typer.Option(
+        None, "--daemon", help="Send audits to a running 'readme-auditor serve' at this address; falls back to in-process"
+    ),
+    watch: bool = typer.Option(False, "--watch", help="Keep running and re-audit files when they change"),
+    interval: float = typer.Option(0.5, "--interval", min=0.05, help="Seconds between --watch polls"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only audit files changed since the merge base of this git ref and HEAD"
+    ),
+    staged: bool = typer.Option(False, "--staged", help="Only audit files staged in git (for pre-commit hooks)"),
+    archives: bool = typer.Option(
+        False, "--archives", help="Also audit READMEs inside .tar.gz/.zip/.whl archives found in a target directory"
+    ),
+    shard: Optional[str] = typer.Option(
+        None, "--shard", help="Audit only slice INDEX/COUNT (1-based) of the files, split by a stable path hash"
+    ),
+    journal: Optional[Path] = typer.Option(
+        None, "--journal", help="Append each finished file and its report to this log as the run goes"
+    ),
+    resume: bool = typer.Option(False, "--resume", help="Reuse reports from --journal for files that did not change"),
+    issues_csv: Optional[Path] = typer.Option(
+        None, "--issues-csv", help="Also write every finding as a CSV row (filename, line, rule_id, severity, text)"
+    ),
 ) -> None:
+    """Audit a README file, or the README/markdown files in a directory."""
+    shard_spec: Optional[Tuple[int, int]] = None
+    if shard is not None:
+        from .sharding import parse_shard
+
+        try:
+            shard_spec = parse_shard(shard)
+        except ValueError as e:
+            raise typer.BadParameter(str(e)) from e
+
+    if resume and journal is None:
+        raise typer.BadParameter("--resume needs --journal")
+    if journal is not None and (daemon is not None or watch):
+        raise typer.BadParameter("--journal cannot be combined with --daemon or --watch")
+    if daemon is not None:
+        from .daemon import parse_address
+
+        try:
+            parse_address(daemon)
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--daemon") from e
+
     cfg = load_config(str(config) if config else None)
     cfg.output_format = format.strip().lower()  # type: ignore[assignment]
     cfg.fail_on = _severity(fail_on)
 
-    engine = AuditEngine(cfg)
+    engine = AuditEngine(
+        cfg, cache=ResultCache(cache_dir) if cache else None, profile=profile, incremental=watch
+    )
+    profiler = Profiler() if profile else None
 
     if list_rules:
+        from rich.console import Console
+        from rich.table import Table
+
         con = Console()
         table = Table(title="Available Rules")
         table.add_column("rule_id", style="bold")
@@ -72,25 +213,225 @@ def main(
     if not target.exists():
         raise typer.BadParameter(f"Target does not exist: {target}")
 
-    targets = _collect_targets(target)
-    if not targets:
+    changed: Optional[Set[Path]] = None
+    if since is not None or staged:
+        from .vcs import GitError, changed_paths
+
+        try:
+            changed = changed_paths(target, since=since, staged=staged)
+        except GitError as e:
+            raise typer.BadParameter(str(e)) from e
+
+    workers = jobs or os.cpu_count() or 1
+    readers = DEFAULT_READERS
+    collected: Iterable[Path]
+    suffixes = ARCHIVE_SUFFIXES if archives else ()
+    if recursive and target.is_dir():
+        ignore = IgnoreRules.from_file(target / ".gitignore", exclude or [])
+        if changed is not None:
+            # Apply the walker's filters to the changed files instead of walking the tree.
+            collected = select_markdown(target, changed, ignore=ignore, suffixes=suffixes)
+        else:
+            # Stream files into the engine as the walker finds them.
+            collected = iter_markdown(target, ignore=ignore, suffixes=suffixes)
+        if shard_spec is not None:
+            from .sharding import select_shard
+
+            collected = select_shard(collected, target, *shard_spec)
+    else:
+        collected = _collect_targets(target, archives=archives)
+        if changed is not None:
+            collected = [p for p in collected if p.resolve() in changed]
+        if shard_spec is not None:
+            from .sharding import select_shard
+
+            collected = list(select_shard(collected, target, *shard_spec))
+        workers = min(workers, len(collected))
+        readers = min(readers, len(collected))
+
+    pending = iter(collected)
+    first = next(pending, None)
+    if first is None:
+        # Selecting by change or shard may legitimately leave nothing to do.
+        if changed is not None:
+            typer.echo("No changed README or markdown files to audit.", err=True)
+            _write_empty_outputs(cfg.output_format, output, issues_csv)
+            raise typer.Exit(code=0)
+        if shard_spec is not None:
+            typer.echo("No README or markdown files in this shard.", err=True)
+            _write_empty_outputs(cfg.output_format, output, issues_csv)
+            raise typer.Exit(code=0)
         raise typer.BadParameter(f"No README or markdown files found in: {target}")
+    targets = itertools.chain([first], pending)
+
+    if watch:
+        if output is not None:
+            raise typer.BadParameter("--watch prints to the terminal and cannot be combined with --output")
+        _run_watch(engine, list(targets), cfg.output_format, cfg, interval)
+        raise typer.Exit(code=0)
+
+    formatter: Union[HumanFormatter, JsonFormatter, NdjsonFormatter]
+    stream: Optional[TextIO] = None
+    if cfg.output_format == "human":
+        from .formatters.human import HumanFormatter
 
-    formatter = HumanFormatter(color=cfg.color, show_suggestions=cfg.show_suggestions) if cfg.output_format == "human" else JsonFormatter()
+        formatter = HumanFormatter(color=cfg.color, show_suggestions=cfg.show_suggestions)
+    elif cfg.output_format == "ndjson":
+        # Stream one line per report as soon as it is ready; nothing is buffered.
+        formatter = NdjsonFormatter()
+        stream = output.open("w", encoding="utf-8") if output is not None else sys.stdout
+    else:
+        formatter = JsonFormatter()
 
     overall_pass = True
+    files = 0
+    totals = AuditSummary(total=0, errors=0, warnings=0, info=0)
     rendered_outputs: List[str] = []
-    for f in targets:
-        content = f.read_text(encoding="utf-8")
-        report = engine.audit_content(filename=str(f), content=content)
+    reports: Iterable[AuditReport]
+    run_journal: Optional[Journal] = None
+    if daemon is not None:
+        from .daemon import DaemonClient, audit_paths_via_daemon
+
+        reports = audit_paths_via_daemon(DaemonClient(daemon), engine, targets, config_to_dict(cfg))
+    else:
+        if journal is not None:
+            from .journal import Journal
+
+            run_journal = Journal(journal, resume=resume, settings=engine.settings_key())
+        reports = audit_paths(engine, targets, jobs=workers, readers=readers, journal=run_journal)
+
+    issue_table: Optional[IssueTable] = None
+    if issues_csv is not None:
+        from .table import IssueTable
+
+        issue_table = IssueTable()
+
+    def emit(report: AuditReport) -> None:
+        # Runs on the writer thread: the only place run totals are updated.
+        nonlocal overall_pass, files, totals
         overall_pass = overall_pass and report.passed
+        files += 1
+        totals = merge_summaries((totals, report.summary))
+        if issue_table is not None:
+            issue_table.add_report(report)
+        render_start = perf_counter()
         rendered = formatter.render(report)
-        rendered_outputs.append(rendered)
-        if output is None:
+        if stream is not None:
+            stream.write(rendered + "\n")
+            stream.flush()
+        elif output is not None:
+            rendered_outputs.append(rendered)
+        else:
             formatter.print(report)
+        if profiler is not None:
+            profiler.add_report(report)
+            profiler.add("render", perf_counter() - render_start, filename=report.filename)
 
-    if output is not None:
+    try:
+        write_in_order(reports, emit)
+
+        if stream is not None and isinstance(formatter, NdjsonFormatter):
+            stream.write(formatter.render_summary(totals, files=files, passed=overall_pass) + "\n")
+            stream.flush()
+    finally:
+        if stream is not None and output is not None:
+            stream.close()
+        if run_journal is not None:
+            run_journal.close()
+
+    if output is not None and stream is None:
         joined = "\n\n".join(rendered_outputs)
         output.write_text(joined, encoding="utf-8")
 
+    if issue_table is not None and issues_csv is not None:
+        with issues_csv.open("w", encoding="utf-8", newline="") as fh:
+            issue_table.write_csv(fh)
+
+    if engine.cache is not None:
+        engine.cache.prune()
+    if engine.rule_stats is not None:
+        engine.rule_stats.save()
+
+    if profiler is not None:
+        from rich.console import Console
+
+        Console(stderr=True).print(profiler.table())
+
     raise typer.Exit(code=0 if overall_pass else 1)
+
+
+@app.command("serve")
+def serve_command(
+    address: Optional[str] = typer.Option(
+        None, "--address", help="host:port, port, or unix:/path/to.sock (default: 127.0.0.1:8765)"
+    ),
+    config: Optional[Path] = typer.Option(None, "--config", help="Default config for requests that do not send one"),
+) -> None:
+    """Keep a warm engine running and answer audit requests over a local socket."""
+    from .daemon import DEFAULT_ADDRESS, serve
+
+    cfg = load_config(str(config) if config else None)
+    address = address or DEFAULT_ADDRESS
+    typer.echo(f"readme-auditor serving on {address}", err=True)
+    try:
+        serve(address, cfg)
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        raise typer.BadParameter(f"cannot listen on {address}: {e}", param_hint="--address") from e
+
+
+@app.command("history")
+def history_command(
+    repo: Path = typer.Argument(Path("."), help="Local git repository"),
+    path: str = typer.Option("README.md", "--path", help="File to audit, relative to the repository root"),
+    rev_range: Optional[str] = typer.Option(None, "--rev-range", help="Commits to audit, e.g. v1.0..main (default: HEAD)"),
+    config: Optional[Path] = typer.Option(None, "--config", help="Path to TOML config file"),
+    output: Optional[Path] = typer.Option(None, "--output", help="Write records to a file instead of stdout"),
+) -> None:
+    """Audit a file at every commit of a git history, one NDJSON record per commit."""
+    from .history import audit_history
+    from .vcs import GitError
+
+    cfg = load_config(str(config) if config else None)
+    # Consecutive versions of the same file usually differ in a section or two.
+    engine = AuditEngine(cfg, incremental=True)
+    stream = output.open("w", encoding="utf-8") if output is not None else sys.stdout
+    try:
+        for record in audit_history(engine, repo, path=path, rev_range=rev_range):
+            stream.write(json.dumps(record.as_json_dict(), separators=(",", ":")) + "\n")
+            stream.flush()
+    except GitError as e:
+        raise typer.BadParameter(str(e)) from e
+    finally:
+        if output is not None:
+            stream.close()
+
+
+@app.command("merge")
+def merge_command(
+    inputs: List[Path] = typer.Argument(..., help="Outputs of sharded runs (--format ndjson or json)"),
+    format: str = typer.Option("human", "--format", help="human, json, or ndjson"),
+) -> None:
+    """Combine the outputs of --shard runs into one summary and exit code."""
+    from .sharding import merge_outputs
+
+    try:
+        summary, files, passed = merge_outputs(inputs)
+    except OSError as e:
+        raise typer.BadParameter(f"Cannot read shard output: {e}") from e
+    except (ValueError, KeyError, TypeError) as e:
+        raise typer.BadParameter(f"Not an NDJSON or JSON audit output: {e}") from e
+
+    fmt = format.strip().lower()
+    if fmt == "ndjson":
+        typer.echo(NdjsonFormatter().render_summary(summary, files=files, passed=passed))
+    elif fmt == "json":
+        typer.echo(json.dumps({"files": files, "summary": summary.as_dict(), "passed": passed}, indent=2))
+    else:
+        status = "passed" if passed else "failed"
+        typer.echo(
+            f"{files} files, {summary.total} issues "
+            f"({summary.errors} errors, {summary.warnings} warnings, {summary.info} info): {status}"
+        )
+    raise typer.Exit(code=0 if passed else 1)
@@ -23,14 +23,18 @@ def _parse_severity(value: str, *, field_name: str) -> Severity:
 
 
 def load_config(path: Optional[str]) -> Config:
-    cfg = Config()
     if not path:
-        return cfg
+        return Config()
     if not os.path.exists(path):
         raise FileNotFoundError(f"Config file not found: {path}")
 
     data = tomllib.loads(open(path, "rb").read().decode("utf-8"))
+    return config_from_dict(data)
+
 
+def config_from_dict(data: Dict[str, Any]) -> Config:
+    """Build a Config from the TOML document structure ([general], [output], [rules.*])."""
+    cfg = Config()
     general = data.get("general", {})
     if "severity_threshold" in general:
         cfg.severity_threshold = _parse_severity(general["severity_threshold"], field_name="severity_threshold")
@@ -40,8 +44,8 @@ def load_config(path: Optional[str]) -> Config:
     output = data.get("output", {})
     if "format" in output:
         fmt = str(output["format"]).strip().lower()
-        if fmt not in ("human", "json"):
-            raise ValueError("output.format must be 'human' or 'json'")
+        if fmt not in ("human", "json", "ndjson"):
+            raise ValueError("output.format must be 'human', 'json' or 'ndjson'")
         cfg.output_format = fmt  # type: ignore[assignment]
     if "color" in output:
         cfg.color = bool(output["color"])
@@ -66,6 +70,22 @@ def load_config(path: Optional[str]) -> Config:
     return cfg
 
 
+def config_to_dict(cfg: Config) -> Dict[str, Any]:
+    """Inverse of ``config_from_dict``: the TOML document structure for ``cfg``."""
+    rules: Dict[str, Dict[str, Any]] = {}
+    for rule_id, rc in cfg.rules.items():
+        entry: Dict[str, Any] = {"enabled": rc.enabled}
+        if rc.severity is not None:
+            entry["severity"] = rc.severity
+        entry.update(rc.options)
+        rules[rule_id] = entry
+    return {
+        "general": {"severity_threshold": cfg.severity_threshold, "max_issues": cfg.max_issues, "fail_on": cfg.fail_on},
+        "output": {"format": cfg.output_format, "color": cfg.color, "show_suggestions": cfg.show_suggestions},
+        "rules": rules,
+    }
+
+
 def config_as_dict(cfg: Config) -> Dict[str, Any]:
     d = asdict(cfg)
     # dataclasses serialize RuleConfig objects already, fine for debugging
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .config import config_from_dict
+from .engine import AuditEngine
+from .models import AuditReport, Config
+from .parallel import prefetch
+from .parser import warm_up
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+_MAX_ENGINES = 8
+
+Address = Union[str, Tuple[str, int]]
+
+
+class DaemonError(RuntimeError):
+    """The daemon answered, but could not audit the request."""
+
+
+def parse_address(address: str) -> Address:
+    """``unix:/path/to.sock``, ``host:port`` or a bare ``port`` (localhost)."""
+    if address.startswith("unix:"):
+        return address[len("unix:") :]
+    host, _, port = address.rpartition(":")
+    try:
+        number = int(port)
+    except ValueError:
+        raise ValueError(f"expected host:port, port or unix:/path, got {address!r}") from None
+    return (host or "127.0.0.1", number)
+
+
+class _EnginePool:
+    """Warm engines keyed by the effective config, least recently used evicted first."""
+
+    def __init__(self, default: Config):
+        self._default = default
+        self._engines: OrderedDict[str, AuditEngine] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, config: Optional[Dict[str, Any]]) -> AuditEngine:
+        key = json.dumps(config, sort_keys=True) if config else ""
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = AuditEngine(
+                    config_from_dict(config) if config else self._default, incremental=True
+                )
+                self._engines[key] = engine
+                if len(self._engines) > _MAX_ENGINES:
+                    self._engines.popitem(last=False)
+            else:
+                self._engines.move_to_end(key)
+            return engine
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    # One JSON request per line, one JSON response per line; a connection may
+    # carry any number of requests.
+    server: Any
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            try:
+                request = json.loads(raw)
+                engine = self.server.engines.get(request.get("config"))
+                report = engine.audit_content(
+                    filename=str(request["filename"]), content=str(request["content"])
+                )
+                response: Dict[str, object] = report.as_json_dict()
+            except Exception as e:  # report bad requests back instead of dropping the connection
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    engines: _EnginePool
+
+
+if sys.platform != "win32":
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        engines: _EnginePool
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket left behind by a daemon that is gone; refuse to touch anything else."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket; refusing to replace it")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)  # nobody is listening: stale socket from a previous run
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"a daemon is already listening on {path}")
+
+
+def make_server(address: str, cfg: Config) -> socketserver.BaseServer:
+    """Bind (but do not start) an audit daemon with a warm default engine.
+
+    Raises ``OSError`` when the address is taken: a busy port, a Unix socket
+    another daemon is listening on, or a path that is not a socket.
+    """
+    addr = parse_address(address)
+    server: Union[_TCPServer, _UnixServer]
+    if isinstance(addr, str):
+        _remove_stale_socket(addr)
+        server = _UnixServer(addr, _Handler)
+    else:
+        server = _TCPServer(addr, _Handler)
+    server.engines = _EnginePool(cfg)
+    server.engines.get(None)
+    warm_up()
+    return server
+
+
+def serve(address: str, cfg: Config) -> None:
+    server = make_server(address, cfg)
+    addr = parse_address(address)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if isinstance(addr, str) and os.path.exists(addr):
+            os.unlink(addr)
+
+
+class DaemonClient:
+    """Thin client for a running ``readme-auditor serve``.
+
+    Connection failures surface as ``OSError`` and error replies as
+    ``DaemonError`` so callers can fall back to auditing in-process.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, *, timeout: float = 30.0):
+        self.address = parse_address(address)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader: Any = None
+
+    def _connect(self) -> None:
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def audit(
+        self, *, filename: str, content: str, config: Optional[Dict[str, Any]] = None
+    ) -> AuditReport:
+        if self._sock is None:
+            self._connect()
+        assert self._sock is not None
+        request = {"filename": filename, "content": content, "config": config}
+        self._sock.sendall(json.dumps(request, separators=(",", ":")).encode("utf-8") + b"\n")
+        line = self._reader.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("daemon closed the connection")
+        data = json.loads(line)
+        if "error" in data:
+            raise DaemonError(data["error"])
+        return AuditReport.from_json_dict(data)
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+def audit_paths_via_daemon(
+    client: DaemonClient,
+    engine: AuditEngine,
+    paths: Iterable[Path],
+    config: Optional[Dict[str, Any]],
+) -> Iterator[AuditReport]:
+    """Audit through the daemon, switching to ``engine`` for good if it is unreachable or misbehaves.
+
+    Besides connection errors, an error reply (say, a config the daemon's
+    version does not understand) or a garbled response also falls back.
+    """
+    use_daemon = True
+    try:
+        for filename, content, seconds in prefetch(paths, readers=1):
+            if use_daemon:
+                try:
+                    yield client.audit(filename=filename, content=content, config=config)
+                    continue
+                except (OSError, DaemonError, ValueError):
+                    use_daemon = False
+            yield engine.audit_prefetched(filename, content, seconds)
+    finally:
+        client.close()
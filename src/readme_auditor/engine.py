@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 import datetime as _dt
+import hashlib
+import json
+from collections import Counter
 from dataclasses import replace
-from typing import Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 
+from . import __version__
+from .cache import ResultCache
+from .incremental import FileState, IncrementalState
 from .models import AuditReport, AuditSummary, Config, Issue, Severity
-from .parser import parse_markdown
-from .rules import list_rules
+from .parser import ParsedDocument, parse_markdown
+from .profiling import NULL_TIMER, PhaseTimer, rounded
+from .rule_stats import RULE_STATS_FILE, RuleStats
+from .rules import list_rules, load_rule, rule_ids
+from .rules._utils import LineScanner
 from .rules.base import Rule
 
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+DEFAULT_MAX_IN_FLIGHT = 8
 
 _SEV_ORDER: Dict[Severity, int] = {"info": 0, "warning": 1, "error": 2}
 
@@ -18,41 +33,231 @@ def severity_at_least(a: Severity, b: Severity) -> bool:
 
 
 def summarize(issues: List[Issue]) -> AuditSummary:
-    errors = sum(1 for i in issues if i.severity == "error")
-    warnings = sum(1 for i in issues if i.severity == "warning")
-    info = sum(1 for i in issues if i.severity == "info")
-    return AuditSummary(total=len(issues), errors=errors, warnings=warnings, info=info)
+    counts = Counter(i.severity for i in issues)
+    return AuditSummary(total=len(issues), errors=counts["error"], warnings=counts["warning"], info=counts["info"])
+
+
+def merge_summaries(summaries: Iterable[AuditSummary]) -> AuditSummary:
+    total = errors = warnings = info = 0
+    for s in summaries:
+        total += s.total
+        errors += s.errors
+        warnings += s.warnings
+        info += s.info
+    return AuditSummary(total=total, errors=errors, warnings=warnings, info=info)
+
+
+def _max_severity(rule: Rule) -> int:
+    return max(_SEV_ORDER[s] for s in (rule.severity, *rule.extra_severities))
+
+
+def _with_filename(issue: Issue, filename: str) -> Issue:
+    # Issues are frozen and hashable, and a rule may hand out the same object
+    # to every caller (or thread), so the filename goes on a copy. Cache hits
+    # are built with the filename and skip this.
+    return replace(issue, filename=filename)
 
 
 class AuditEngine:
-    def __init__(self, cfg: Config):
+    def __init__(
+        self,
+        cfg: Config,
+        *,
+        cache: Optional[ResultCache] = None,
+        profile: bool = False,
+        incremental: bool = False,
+    ):
+        self.cache = cache
+        self.profile = profile
+        # Opt-in: remembers per-file results so re-audits of an edited file only
+        # rerun the rules whose sections or lines changed.
+        self.incremental: Optional[IncrementalState] = IncrementalState() if incremental else None
+        # Per-rule cost and yield, kept with the cache, decide the order rules
+        # run in so ``max_issues`` is reached early; output order is unchanged.
+        self.rule_stats: Optional[RuleStats] = RuleStats(cache.root / RULE_STATS_FILE) if cache is not None else None
         self.cfg = cfg
-        self._rule_types = list_rules()
+
+    @property
+    def cfg(self) -> Config:
+        return self._cfg
+
+    @cfg.setter
+    def cfg(self, cfg: Config) -> None:
+        # Rules are instantiated (options parsed, patterns compiled, severity
+        # overrides resolved) once per config, not once per audited file.
+        self._cfg = cfg
+        self.reload()
+
+    def reload(self) -> None:
+        """Rebuild the rule plan after mutating ``cfg.rules``, ``cfg.severity_threshold`` or ``cfg.fail_on`` in place."""
+        self._plan = self._instantiate_rules()
+        # Rules that can fail the run go first, in rule-id order, whatever the
+        # stats say: under ``max_issues`` the learned order then only decides
+        # which of the lesser findings are listed, never whether a file passes.
+        fail_on = _SEV_ORDER[self._cfg.fail_on]
+        self._gating = [(i, r) for i, r in enumerate(self._plan) if _max_severity(r) >= fail_on]
+        self._rest = [(i, r) for i, r in enumerate(self._plan) if _max_severity(r) < fail_on]
+        # Line-oriented rules share one pass over the document.
+        self._scanner = LineScanner({r.id: r.line_pattern for r in self._plan if r.line_pattern is not None})
+        self._digest = self._config_digest()
+        if self.incremental is not None:
+            self.incremental.clear()
+
+    def _config_digest(self) -> str:
+        """Hash of everything besides the content that determines the reported issues."""
+        payload = {
+            "version": __version__,
+            "severity_threshold": self._cfg.severity_threshold,
+            "max_issues": self._cfg.max_issues,
+            # Decides which rules run first, so which findings survive the cap.
+            "fail_on": self._cfg.fail_on,
+            "rules": [[r.id, r.version, r.severity, r.options] for r in self._plan],
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+
+    def settings_key(self) -> str:
+        """Everything besides the content that determines a report, ``fail_on`` included."""
+        return f"{self._digest}:{self._cfg.fail_on}"
 
     def available_rules(self) -> List[Tuple[str, str, str]]:
         out: List[Tuple[str, str, str]] = []
-        for rid, cls in sorted(self._rule_types.items()):
+        for rid, cls in sorted(list_rules().items()):
             meta = cls.meta
             out.append((meta.rule_id, meta.name, meta.severity))
         return out
 
     def _instantiate_rules(self) -> List[Rule]:
         rules: List[Rule] = []
-        for rid, cls in sorted(self._rule_types.items()):
+        threshold = _SEV_ORDER[self.cfg.severity_threshold]
+        for rid in sorted(rule_ids()):
             rc = self.cfg.rules.get(rid)
             if rc and not rc.enabled:
                 continue
+            cls = load_rule(rid)
             severity_override = rc.severity if (rc and rc.severity) else None
             options = rc.options if rc else {}
-            rules.append(cls(severity_override=severity_override, options=options))
+            rule = cls(severity_override=severity_override, options=options)
+            # Threshold pushdown: a rule whose findings would all be filtered
+            # out is not run at all.
+            if _max_severity(rule) < threshold:
+                continue
+            rules.append(rule)
         return rules
 
+    def _timer(self) -> PhaseTimer:
+        return PhaseTimer() if self.profile else NULL_TIMER
+
     def audit_content(self, *, filename: str, content: str) -> AuditReport:
-        context = parse_markdown(content)
-        issues: List[Issue] = []
-        for rule in self._instantiate_rules():
+        return self._audit(filename, content, self._timer())
+
+    def audit_file(self, path: Path) -> AuditReport:
+        timer = self._timer()
+        with timer("read"):
+            content = path.read_text(encoding="utf-8")
+        return self._audit(str(path), content, timer)
+
+    def audit_prefetched(self, filename: str, content: str, read_seconds: float = 0.0) -> AuditReport:
+        """``audit_content`` for content read elsewhere (a reader thread, an archive member)."""
+        timer = self._timer()
+        if self.profile:
+            timer.add("read", read_seconds)
+        return self._audit(filename, content, timer)
+
+    async def audit_paths_async(
+        self,
+        paths: Iterable[Path],
+        *,
+        executor: Optional[Executor] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> AsyncIterator[AuditReport]:
+        """Audit ``paths`` from asyncio code and yield reports as they complete.
+
+        Parsing and rules run on ``executor`` (the loop's default thread pool
+        when None). With a ``ProcessPoolExecutor`` files are read on the default
+        thread pool and only their content is shipped to the workers. At most
+        ``max_in_flight`` files are pending at once, so ``paths`` may be lazy.
+        """
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        from .parallel import _audit_content
+
+        loop = asyncio.get_running_loop()
+        in_process = isinstance(executor, ProcessPoolExecutor)
+
+        async def one(path: Path) -> AuditReport:
+            if not in_process:
+                return await loop.run_in_executor(executor, self.audit_file, path)
+            content = await loop.run_in_executor(None, path.read_text, "utf-8")
+            return await loop.run_in_executor(
+                executor, _audit_content, self.cfg, self.cache, self.profile, str(path), content
+            )
+
+        pending: Set[asyncio.Task[AuditReport]] = set()
+        remaining = iter(paths)
+        try:
+            while True:
+                for path in remaining:
+                    pending.add(asyncio.ensure_future(one(path)))
+                    if len(pending) >= max(1, max_in_flight):
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _audit(self, filename: str, content: str, timer: PhaseTimer) -> AuditReport:
+        key: Optional[str] = None
+        if self.cache is not None:
+            with timer("cache"):
+                key = self.cache.key(content, self._digest)
+                cached = self.cache.get(key, filename)
+            if cached is not None:
+                return self._report(filename, cached, timer)
+
+        issues = self._run_rules(filename, content, timer)
+        if self.cache is not None and key is not None:
+            with timer("cache"):
+                self.cache.put(key, issues)
+        return self._report(filename, issues, timer)
+
+    def _run_rules(self, filename: str, content: str, timer: PhaseTimer) -> List[Issue]:
+        with timer("parse"):
+            context = parse_markdown(content)
+            if self.profile or self.rule_stats is not None:
+                # Views are lazy; force the token walk so it is billed to parsing
+                # rather than to whichever rule happens to touch it first (which
+                # would also skew that rule's measured cost).
+                _ = context.headings
+        if self._scanner:
+            with timer("scan"):
+                context["line_hits"] = self._scanner.scan(context["lines"])  # type: ignore[arg-type]
+        if self.incremental is None:
+            return self._check_rules(filename, content, context, timer, None)
+        with self.incremental.file(filename, content) as state:
+            return self._check_rules(filename, content, context, timer, state)
+
+    def _check_rules(
+        self,
+        filename: str,
+        content: str,
+        context: ParsedDocument,
+        timer: PhaseTimer,
+        state: Optional[FileState],
+    ) -> List[Issue]:
+        stats = self.rule_stats
+        plan = self._gating + (stats.order(self._rest) if stats is not None else self._rest)
+        kept: List[Tuple[int, List[Issue]]] = []
+        count = 0
+        for position, rule in plan:
+            start = perf_counter()
             try:
-                found = rule.check(content, context)
+                with timer(f"rule:{rule.id}"):
+                    found = state.check(rule, content, context) if state is not None else rule.check(content, context)
             except Exception as e:  # pragma: no cover
                 # Defensive: rule bugs should not crash CI
                 found = [
@@ -66,17 +271,33 @@ class AuditEngine:
                         filename=filename,
                     )
                 ]
-            for iss in found:
-                issues.append(replace(iss, filename=filename))
+            elapsed = perf_counter() - start
+            with timer("filter"):
+                visible = [
+                    _with_filename(iss, filename)
+                    for iss in found
+                    if severity_at_least(iss.severity, self.cfg.severity_threshold)
+                ]
+            # Incremental re-checks mostly reuse earlier results and would make
+            # rules look cheaper than they are.
+            if stats is not None and state is None:
+                stats.record(rule.id, elapsed, len(visible))
+            kept.append((position, visible))
+            count += len(visible)
 
-            # apply max issues early for performance
-            if len(issues) >= self.cfg.max_issues:
-                issues = issues[: self.cfg.max_issues]
+            # max_issues counts visible issues only; stop as soon as it is reached
+            if count >= self.cfg.max_issues:
+                del visible[len(visible) - (count - self.cfg.max_issues) :]
                 break
+        # Back to rule-id order, whatever order the rules ran in.
+        kept.sort(key=lambda pair: pair[0])
+        return [iss for _, visible in kept for iss in visible]
 
-        # Apply severity threshold filter
-        issues = [i for i in issues if severity_at_least(i.severity, self.cfg.severity_threshold)]
+    def _report(self, filename: str, issues: List[Issue], timer: PhaseTimer = NULL_TIMER) -> AuditReport:
         summary = summarize(issues)
         passed = not any(severity_at_least(i.severity, self.cfg.fail_on) for i in issues)
         ts = _dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-        return AuditReport(filename=filename, timestamp_utc=ts, issues=issues, summary=summary, passed=passed)
+        timings = rounded(timer.timings) if self.profile else None
+        return AuditReport(
+            filename=filename, timestamp_utc=ts, issues=issues, summary=summary, passed=passed, timings=timings
+        )
@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from .human import HumanFormatter
+from typing import TYPE_CHECKING
+
 from .json import JsonFormatter
+from .ndjson import NdjsonFormatter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .human import HumanFormatter
+
+__all__ = ["HumanFormatter", "JsonFormatter", "NdjsonFormatter"]
+
+
+def __getattr__(name: str) -> object:
+    # HumanFormatter pulls in Rich; only import it when asked for.
+    if name == "HumanFormatter":
+        from .human import HumanFormatter
 
-__all__ = ["HumanFormatter", "JsonFormatter"]
+        return HumanFormatter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+from typing import Dict
+
+from ..models import AuditReport, AuditSummary
+
+
+class NdjsonFormatter:
+    """One compact JSON object per line: a ``report`` record per file, then a ``summary``."""
+
+    def render(self, report: AuditReport) -> str:
+        record: Dict[str, object] = {"type": "report"}
+        record.update(report.as_json_dict())
+        return json.dumps(record, separators=(",", ":"))
+
+    def render_summary(self, summary: AuditSummary, *, files: int, passed: bool) -> str:
+        record = {"type": "summary", "files": files, "summary": summary.as_dict(), "passed": passed}
+        return json.dumps(record, separators=(",", ":"))
+
+    def print(self, report: AuditReport) -> None:
+        print(self.render(report), flush=True)
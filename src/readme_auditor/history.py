@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import datetime as _dt
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .engine import AuditEngine
+from .models import AuditReport
+from .vcs import CatFile, rev_list
+
+
+@dataclass(frozen=True)
+class CommitAudit:
+    """The audit of one file as of one commit; ``report`` is None where the file did not exist."""
+
+    commit: str
+    timestamp: int
+    path: str
+    blob: Optional[str]
+    report: Optional[AuditReport]
+
+    def as_json_dict(self) -> Dict[str, object]:
+        when = _dt.datetime.fromtimestamp(self.timestamp, tz=_dt.timezone.utc).replace(tzinfo=None)
+        return {
+            "type": "commit",
+            "commit": self.commit,
+            "committed_utc": when.isoformat() + "Z",
+            "path": self.path,
+            "blob": self.blob,
+            "report": self.report.as_json_dict() if self.report is not None else None,
+        }
+
+
+def audit_history(
+    engine: AuditEngine, repo: Path, *, path: str = "README.md", rev_range: Optional[str] = None
+) -> Iterator[CommitAudit]:
+    """Audit ``path`` at every commit of ``rev_range`` (default: HEAD), oldest first.
+
+    Nothing is checked out. ``git cat-file --batch-check`` maps each
+    ``<commit>:<path>`` to a blob id and a single ``git cat-file --batch``
+    process streams the content of each distinct blob, so a README that did
+    not change between commits is read and audited once.
+    """
+    path = path[2:] if path.startswith("./") else path
+    reports: Dict[str, AuditReport] = {}
+    with CatFile(repo, contents=False) as check, CatFile(repo) as blobs:
+        for commit, timestamp in rev_list(repo, rev_range):
+            found = check.info(f"{commit}:{path}")
+            if found is None or found[1] != "blob":
+                yield CommitAudit(commit, timestamp, path, None, None)
+                continue
+            oid = found[0]
+            report = reports.get(oid)
+            if report is None:
+                data = blobs.read(oid)
+                assert data is not None, f"blob {oid} vanished"
+                content = data.decode("utf-8", errors="replace")
+                report = reports[oid] = engine.audit_content(filename=path, content=content)
+            yield CommitAudit(commit, timestamp, path, oid, report)
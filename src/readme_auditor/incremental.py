@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .models import Issue
+from .parser import find_section
+from .rules.base import Rule
+
+DEFAULT_MAX_FILES = 256
+
+# (key, start_line, end_line) of one slice of the document.
+Chunk = Tuple[bytes, int, int]
+
+
+def _digest(lines: List[str]) -> bytes:
+    return hashlib.blake2b("\n".join(lines).encode("utf-8"), digest_size=16).digest()
+
+
+def _shift(issues: List[Issue], delta: int) -> List[Issue]:
+    if not delta:
+        return list(issues)
+    return [replace(i, line=i.line + delta) if i.line is not None else i for i in issues]
+
+
+class _Overlay(Mapping[str, object]):
+    """Read-only view of a parsed document with some keys replaced."""
+
+    def __init__(self, base: Mapping[str, object], overrides: Dict[str, object]):
+        self._base = base
+        self._overrides = overrides
+
+    def __getitem__(self, key: str) -> object:
+        if key in self._overrides:
+            return self._overrides[key]
+        return self._base[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._overrides
+        yield from (k for k in self._base if k not in self._overrides)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class FileState:
+    """What each rule reported for one file last time, and the inputs it depended on."""
+
+    def __init__(self) -> None:
+        # Held for a whole audit of the file: ``begin`` and every ``check``.
+        self.lock = threading.Lock()
+        self.content_key: Optional[bytes] = None
+        self.rules: Dict[str, object] = {}
+        self.reused = 0
+        self._chunks: Optional[List[Chunk]] = None
+
+    def begin(self, content: str) -> None:
+        self.content_key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        self._chunks = None
+
+    def check(self, rule: Rule, content: str, context: Mapping[str, object]) -> List[Issue]:
+        if rule.scope == "section":
+            return self._check_section(rule, content, context)
+        if rule.scope == "line" and isinstance(context.get("line_hits"), dict):
+            return self._check_lines(rule, content, context)
+        prev = self.rules.get(rule.id)
+        if isinstance(prev, tuple) and prev[0] == self.content_key:
+            self.reused += 1
+            return list(prev[1])
+        found = rule.check(content, context)  # type: ignore[arg-type]
+        self.rules[rule.id] = (self.content_key, found)
+        return found
+
+    def _check_section(
+        self, rule: Rule, content: str, context: Mapping[str, object]
+    ) -> List[Issue]:
+        # Findings are kept with the section start they were computed at and
+        # moved along with the section when lines above it are added or removed.
+        section = find_section(context, list(rule.section_keywords))
+        key: object = None
+        start = 0
+        if section is not None:
+            heading, start, end = section
+            lines: List[str] = context["lines"]  # type: ignore[assignment]
+            key = (heading.level, _digest(lines[start - 1 : end]))
+        prev = self.rules.get(rule.id)
+        if isinstance(prev, tuple) and prev[0] == key:
+            self.reused += 1
+            return _shift(prev[2], start - prev[1])
+        found = rule.check(content, context)  # type: ignore[arg-type]
+        self.rules[rule.id] = (key, start, found)
+        return found
+
+    def _chunks_of(self, context: Mapping[str, object]) -> List[Chunk]:
+        # The document split at every section heading, the preamble included.
+        # Keys cover one line past the chunk because line rules may look at the
+        # line after a hit, and the length so a chunk's lookahead line and the
+        # last line of the document are not confused.
+        if self._chunks is None:
+            lines: List[str] = context["lines"]  # type: ignore[assignment]
+            starts = sorted({1} | {s for _, s, _ in context["section_ranges"]})  # type: ignore[attr-defined]
+            chunks: List[Chunk] = []
+            for idx, start in enumerate(starts):
+                if start > len(lines):
+                    break
+                end = starts[idx + 1] - 1 if idx + 1 < len(starts) else len(lines)
+                key = _digest([str(end - start + 1)] + lines[start - 1 : end + 1])
+                chunks.append((key, start, end))
+            self._chunks = chunks
+        return self._chunks
+
+    def _check_lines(self, rule: Rule, content: str, context: Mapping[str, object]) -> List[Issue]:
+        chunks = self._chunks_of(context)
+        prev = self.rules.get(rule.id)
+        known: Dict[bytes, Tuple[int, List[Issue]]] = prev if isinstance(prev, dict) else {}
+
+        issues: List[Issue] = []
+        dirty: List[int] = []
+        for idx, (key, start, _) in enumerate(chunks):
+            seen = known.get(key)
+            if seen is None:
+                dirty.append(idx)
+            else:
+                self.reused += 1
+                issues.extend(_shift(seen[1], start - seen[0]))
+
+        starts = [start for _, start, _ in chunks]
+        if dirty:
+            wanted = set(dirty)
+            hits = context["line_hits"][rule.id]  # type: ignore[index]
+            hits = [h for h in hits if bisect_right(starts, h[0]) - 1 in wanted]
+            overlay = _Overlay(context, {"line_hits": {rule.id: hits}})
+            issues.extend(rule.check(content, overlay))  # type: ignore[arg-type]
+            issues.sort(key=lambda i: i.line or 0)
+
+        # Identical chunks have identical findings, so remembering the first is enough.
+        by_chunk: Dict[bytes, Tuple[int, List[Issue]]] = {}
+        for key, start, _ in chunks:
+            by_chunk.setdefault(key, (start, []))
+        for iss in issues:
+            key, start, _ = chunks[bisect_right(starts, iss.line or 1) - 1]
+            if by_chunk[key][0] == start:
+                by_chunk[key][1].append(iss)
+        self.rules[rule.id] = by_chunk
+        return issues
+
+
+class IncrementalState:
+    """Previous results per filename, least recently audited files evicted first.
+
+    Lets an engine that re-audits the same files over and over (watch mode, the
+    daemon) rerun only the rules whose inputs changed, as declared by each
+    rule's ``scope``. Safe to share between threads: concurrent audits of the
+    same filename take turns, other files proceed in parallel.
+    """
+
+    def __init__(self, max_files: int = DEFAULT_MAX_FILES):
+        self.max_files = max_files
+        self._files: OrderedDict[str, FileState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @contextmanager
+    def file(self, filename: str, content: str) -> Iterator[FileState]:
+        """The state of ``filename``, set up for ``content`` and held until the block exits."""
+        with self._lock:
+            state = self._files.get(filename)
+            if state is None:
+                state = self._files[filename] = FileState()
+                if len(self._files) > self.max_files:
+                    self._files.popitem(last=False)
+            else:
+                self._files.move_to_end(filename)
+        with state.lock:
+            state.begin(content)
+            yield state
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .models import AuditReport
+
+
+class Journal:
+    """Append-only NDJSON log of finished files, used to resume interrupted runs.
+
+    Each line records a report filename, the sha256 of the content that was
+    audited, the ``settings`` the report was made with (see
+    ``AuditEngine.settings_key``) and the report itself, and is flushed as
+    soon as the file is done. On resume, a file whose content hash still
+    matches its journal entry gets the stored report instead of being
+    audited again; entries made with other settings are ignored. A torn last
+    line (the process died mid-write) is ignored.
+    """
+
+    def __init__(self, path: Path, *, resume: bool = False, settings: str = ""):
+        self.path = path
+        self.settings = settings
+        self._done: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        torn = False
+        if resume:
+            self._done, torn = self._load(path, settings)
+        self._fh = path.open("a" if resume else "w", encoding="utf-8")
+        if torn:
+            self._fh.write("\n")
+
+    @staticmethod
+    def _load(path: Path, settings: str = "") -> Tuple[Dict[str, Tuple[str, Dict[str, Any]]], bool]:
+        """Entries made with ``settings`` by filename, and whether the file ends in a partial line."""
+        done: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        if not path.is_file():
+            return done, False
+        line = "\n"
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                    if record.get("settings", "") != settings:
+                        continue
+                    done[str(record["path"])] = (str(record["sha256"]), record["report"])
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+        return done, not line.endswith("\n")
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    @staticmethod
+    def digest(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def lookup(self, filename: str, sha256: str) -> Optional[AuditReport]:
+        entry = self._done.get(filename)
+        if entry is None or entry[0] != sha256:
+            return None
+        return AuditReport.from_json_dict(entry[1])
+
+    def record(self, filename: str, sha256: str, report: AuditReport) -> None:
+        line = {
+            "path": filename,
+            "sha256": sha256,
+            "settings": self.settings,
+            "report": report.as_json_dict(),
+        }
+        self._fh.write(json.dumps(line, separators=(",", ":")) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
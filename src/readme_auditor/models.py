@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 Severity = Literal["info", "warning", "error"]
 
+# Slotted issues drop the per-instance __dict__. Frozen slotted dataclasses
+# only pickle reliably (issues travel back from worker processes) from 3.11.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 11) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class Issue:
     rule_id: str
     severity: Severity
     line: Optional[int]
     text: str
+    # Per-rule boilerplate: rules pass shared (literal or interned) strings,
+    # and deserializers intern them, so instances do not carry copies.
     explanation: str
     suggestion: str
     filename: Optional[str] = None
-    context: Dict[str, str] = field(default_factory=dict)
+    context: Optional[Dict[str, str]] = None
 
 
 @dataclass(frozen=True)
@@ -50,9 +57,11 @@ class AuditReport:
     issues: List[Issue]
     summary: AuditSummary
     passed: bool
+    # Per-phase {"seconds", "calls"} for this file; only set when profiling.
+    timings: Optional[Dict[str, Dict[str, float]]] = None
 
     def as_json_dict(self) -> Dict[str, object]:
-        return {
+        out: Dict[str, object] = {
             "filename": self.filename,
             "timestamp": self.timestamp_utc,
             "issues": [
@@ -69,6 +78,34 @@ class AuditReport:
             "summary": self.summary.as_dict(),
             "passed": self.passed,
         }
+        if self.timings is not None:
+            out["timings"] = self.timings
+        return out
+
+    @classmethod
+    def from_json_dict(cls, data: Dict[str, Any]) -> AuditReport:
+        """Rebuild a report from ``as_json_dict`` output (e.g. received over the wire)."""
+        filename = str(data["filename"])
+        issues = [
+            Issue(
+                rule_id=sys.intern(i["rule_id"]),
+                severity=sys.intern(i["severity"]),  # type: ignore[arg-type]
+                line=i["line"],
+                text=i["text"],
+                explanation=sys.intern(i["explanation"]),
+                suggestion=sys.intern(i["suggestion"]),
+                filename=filename,
+            )
+            for i in data["issues"]
+        ]
+        return cls(
+            filename=filename,
+            timestamp_utc=str(data["timestamp"]),
+            issues=issues,
+            summary=AuditSummary(**data["summary"]),
+            passed=bool(data["passed"]),
+            timings=data.get("timings"),
+        )
 
 
 @dataclass
@@ -82,7 +119,7 @@ class RuleConfig:
 class Config:
     severity_threshold: Severity = "warning"
     max_issues: int = 50
-    output_format: Literal["human", "json"] = "human"
+    output_format: Literal["human", "json", "ndjson"] = "human"
     color: bool = True
     show_suggestions: bool = True
     fail_on: Severity = "error"
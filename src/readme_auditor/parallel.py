@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import sys
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from .archives import ArchiveError, is_archive, iter_archive
+from .cache import ResultCache
+from .engine import AuditEngine
+from .journal import Journal
+from .models import AuditReport, Config
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
+DEFAULT_READERS = 4
+DEFAULT_DEPTH = 32
+
+# (report filename, content, seconds spent reading it)
+Document = Tuple[str, str, float]
+
+# Each worker process keeps one warm engine (rule plan and scanner built once).
+_ENGINE: Optional[AuditEngine] = None
+
+
+def _init_worker(cfg: Config, cache: Optional[ResultCache] = None, profile: bool = False) -> None:
+    global _ENGINE
+    _ENGINE = AuditEngine(cfg, cache=cache, profile=profile)
+    if _ENGINE.rule_stats is not None:
+        from multiprocessing.util import Finalize
+
+        # Workers are never told the run is over; save what is left when the
+        # pool shuts them down.
+        Finalize(None, _ENGINE.rule_stats.save, exitpriority=10)
+
+
+def _audit_prefetched(filename: str, content: str, read_seconds: float) -> AuditReport:
+    assert _ENGINE is not None, "worker not initialized"
+    return _ENGINE.audit_prefetched(filename, content, read_seconds)
+
+
+def _audit_content(
+    cfg: Config, cache: Optional[ResultCache], profile: bool, filename: str, content: str
+) -> AuditReport:
+    # Entry point for executors the caller owns (no initializer): the engine is
+    # built on first use and rebuilt only when a different config comes in.
+    global _ENGINE
+    if _ENGINE is None or _ENGINE.cfg != cfg or _ENGINE.profile != profile:
+        _init_worker(cfg, cache, profile)
+    assert _ENGINE is not None
+    _ENGINE.cache = cache
+    return _ENGINE.audit_content(filename=filename, content=content)
+
+
+def _read(path: Path) -> List[Document]:
+    start = perf_counter()
+    if is_archive(path):
+        # Archives are opened and decompressed on the reader threads too;
+        # each auditable member becomes a document of its own.
+        members: List[Tuple[str, str]] = []
+        try:
+            for member in iter_archive(path):
+                members.append(member)
+        except ArchiveError as e:
+            # One damaged download must not abort a run over a whole mirror;
+            # whatever members were readable are still audited.
+            sys.stderr.write(f"readme-auditor: warning: {e}\n")
+        share = (perf_counter() - start) / max(1, len(members))
+        return [(name, content, share) for name, content in members]
+    content = path.read_text(encoding="utf-8")
+    return [(str(path), content, perf_counter() - start)]
+
+
+def prefetch(
+    paths: Iterable[Path], *, readers: int = DEFAULT_READERS, depth: int = DEFAULT_DEPTH
+) -> Iterator[Document]:
+    """Yield ``(filename, content, read_seconds)`` in input order, read ahead on ``readers`` threads.
+
+    At most ``depth`` paths are read ahead of the consumer. With one reader
+    files are read inline, which is cheapest for a handful of local files.
+    """
+    if readers <= 1:
+        for p in paths:
+            yield from _read(p)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=readers, thread_name_prefix="readme-auditor-read") as pool:
+        window: Deque[Future[List[Document]]] = deque()
+        try:
+            for p in paths:
+                window.append(pool.submit(_read, p))
+                if len(window) >= depth:
+                    yield from window.popleft().result()
+            while window:
+                yield from window.popleft().result()
+        finally:
+            for fut in window:
+                fut.cancel()
+
+
+def audit_paths(
+    engine: AuditEngine,
+    paths: Iterable[Path],
+    *,
+    jobs: int = 1,
+    readers: int = DEFAULT_READERS,
+    journal: Optional[Journal] = None,
+) -> Iterator[AuditReport]:
+    """Audit ``paths`` and yield reports in input order.
+
+    Files are read ahead on ``readers`` threads (see ``prefetch``) so disk
+    or network reads overlap with auditing; archives are expanded into one
+    report per auditable member there as well. With ``jobs > 1`` the content
+    is audited on a process pool. At most a few files per stage are in flight,
+    so ``paths`` may be a lazy iterable and memory stays bounded regardless
+    of how many files there are.
+
+    With a ``journal``, files it already holds (same content) are not audited
+    again and every newly audited file is recorded in it.
+    """
+    contents = prefetch(paths, readers=readers, depth=max(DEFAULT_DEPTH, jobs * 4))
+    if jobs <= 1:
+        for filename, content, seconds in contents:
+            if journal is None:
+                yield engine.audit_prefetched(filename, content, seconds)
+                continue
+            digest = journal.digest(content)
+            report = journal.lookup(filename, digest)
+            if report is None:
+                report = engine.audit_prefetched(filename, content, seconds)
+                journal.record(filename, digest, report)
+            yield report
+        return
+
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    def finish(item: Tuple[str, Optional[str], Future[AuditReport]]) -> AuditReport:
+        filename, sha, fut = item
+        report = fut.result()
+        if journal is not None and sha is not None:
+            journal.record(filename, sha, report)
+        return report
+
+    window_size = jobs * 4
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(engine.cfg, engine.cache, engine.profile),
+    ) as pool:
+        window: Deque[Tuple[str, Optional[str], Future[AuditReport]]] = deque()
+        for filename, content, seconds in contents:
+            sha: Optional[str] = None
+            stored: Optional[AuditReport] = None
+            if journal is not None:
+                sha = journal.digest(content)
+                stored = journal.lookup(filename, sha)
+            if stored is not None:
+                # Keep input order: journaled reports wait their turn in the window.
+                done: Future[AuditReport] = Future()
+                done.set_result(stored)
+                window.append((filename, None, done))
+            else:
+                window.append(
+                    (filename, sha, pool.submit(_audit_prefetched, filename, content, seconds))
+                )
+            if len(window) >= window_size:
+                yield finish(window.popleft())
+        while window:
+            yield finish(window.popleft())
+
+
+_DONE = object()
+
+
+def write_in_order(
+    reports: Iterable[AuditReport],
+    emit: Callable[[AuditReport], None],
+    *,
+    depth: int = DEFAULT_DEPTH,
+) -> None:
+    """Call ``emit`` for each report on a single writer thread.
+
+    Rendering and terminal or file output then overlap with reading and
+    auditing the next files. The hand-off queue holds at most ``depth``
+    reports; an exception raised by ``emit`` stops the run and is re-raised
+    here.
+    """
+    import queue
+    import threading
+
+    handoff: queue.Queue[object] = queue.Queue(maxsize=depth)
+    failed: List[BaseException] = []
+
+    def writer() -> None:
+        while True:
+            item = handoff.get()
+            if item is _DONE:
+                return
+            if failed:
+                continue  # keep draining so the producer never blocks
+            try:
+                emit(item)  # type: ignore[arg-type]
+            except BaseException as e:
+                failed.append(e)
+
+    thread = threading.Thread(target=writer, name="readme-auditor-write", daemon=True)
+    thread.start()
+    try:
+        for report in reports:
+            if failed:
+                break
+            handoff.put(report)
+    finally:
+        handoff.put(_DONE)
+        thread.join()
+    if failed:
+        raise failed[0]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple, cast
 
-from markdown_it import MarkdownIt
+if TYPE_CHECKING:  # pragma: no cover
+    from markdown_it import MarkdownIt
+    from markdown_it.token import Token
 
 
 @dataclass(frozen=True)
@@ -30,63 +33,324 @@ def normalize_heading(text: str) -> str:
     return _NORMALIZE_RE.sub(" ", text).strip()
 
 
-def parse_markdown(content: str) -> Dict[str, object]:
-    """Parse Markdown and return a context dict used by rules.
+@dataclass(frozen=True)
+class Link:
+    href: str
+    line: int  # 1-based
 
-    Uses markdown-it-py for reliable tokenization and line mappings.
-    Core engine and rules should treat this as an input contract.
+
+_SECTION_MIN_LEVEL = 2
+_SECTION_SEP = "\n"
+_MD: Optional[MarkdownIt] = None
+
+
+def _markdown() -> MarkdownIt:
+    # Building a MarkdownIt instance compiles its rule chains; do it once per process.
+    global _MD
+    if _MD is None:
+        from markdown_it import MarkdownIt
+
+        _MD = MarkdownIt("commonmark").enable("strikethrough")
+    return _MD
+
+
+Section = Tuple[Heading, int, int]
+
+
+class SectionIndex:
+    """Sections with headings normalized once and memoized keyword lookups.
+
+    Normalized headings are joined into one newline-separated haystack per
+    minimum level, so "first section whose heading contains any of these
+    keywords" is a ``str.find`` per keyword plus a bisect over the offsets of
+    each heading in the haystack. Results are memoized per keyword.
+    """
+
+    __slots__ = ("sections", "normalized", "_haystacks", "_memo")
+
+    def __init__(self, sections: List[Section]):
+        self.sections = sections
+        self.normalized = [normalize_heading(h.text) for h, _, _ in sections]
+        self._haystacks: Dict[int, Tuple[str, List[int], List[int]]] = {}
+        self._memo: Dict[Tuple[str, int], Optional[int]] = {}
+
+    def _haystack(self, min_level: int) -> Tuple[str, List[int], List[int]]:
+        hay = self._haystacks.get(min_level)
+        if hay is None:
+            offsets: List[int] = []
+            positions: List[int] = []
+            parts: List[str] = []
+            pos = 0
+            for idx, ((h, _, _), norm) in enumerate(zip(self.sections, self.normalized)):
+                if h.level < min_level:
+                    continue
+                offsets.append(pos)
+                positions.append(idx)
+                parts.append(norm)
+                pos += len(norm) + len(_SECTION_SEP)
+            hay = (_SECTION_SEP.join(parts), offsets, positions)
+            self._haystacks[min_level] = hay
+        return hay
+
+    def first(self, keyword: str, *, min_level: int = _SECTION_MIN_LEVEL) -> Optional[int]:
+        """Position of the first section whose normalized heading contains ``keyword``."""
+        memo_key = (keyword, min_level)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+        joined, offsets, positions = self._haystack(min_level)
+        found: Optional[int] = None
+        at = joined.find(keyword) if offsets else -1
+        if at >= 0:
+            found = positions[bisect_right(offsets, at) - 1]
+        self._memo[memo_key] = found
+        return found
+
+    def has(self, keyword: str, *, min_level: int = _SECTION_MIN_LEVEL) -> bool:
+        return self.first(keyword, min_level=min_level) is not None
+
+    def find(self, keywords: List[str], *, min_level: int = _SECTION_MIN_LEVEL) -> Optional[Section]:
+        hits = [i for i in (self.first(kw, min_level=min_level) for kw in keywords) if i is not None]
+        return self.sections[min(hits)] if hits else None
+
+
+class CodeBlockIndex:
+    """Fenced code blocks sorted by line, answering range queries by bisection.
+
+    Fences never overlap, so both start and end lines are increasing in
+    document order and "blocks fully inside [a, b]" is a contiguous slice.
+    """
+
+    __slots__ = ("blocks", "_starts", "_ends")
+
+    def __init__(self, blocks: List[CodeBlock]):
+        self.blocks = blocks
+        self._starts = [cb.start_line for cb in blocks]
+        self._ends = [cb.end_line for cb in blocks]
+
+    def _span(self, start: int, end: int) -> Tuple[int, int]:
+        return bisect_left(self._starts, start), bisect_right(self._ends, end)
+
+    def within(self, start: int, end: int) -> List[CodeBlock]:
+        """Blocks that lie entirely within lines ``[start, end]`` (1-based, inclusive)."""
+        lo, hi = self._span(start, end)
+        return self.blocks[lo:hi]
+
+    def any_within(self, start: int, end: int) -> bool:
+        lo, hi = self._span(start, end)
+        return lo < hi
+
+    def block_at(self, line: int) -> Optional[CodeBlock]:
+        """The block whose fence covers ``line``, if any."""
+        idx = bisect_right(self._starts, line) - 1
+        if idx >= 0 and self._ends[idx] >= line:
+            return self.blocks[idx]
+        return None
+
+    def in_fence(self, line: int) -> bool:
+        return self.block_at(line) is not None
+
+
+def warm_up() -> None:
+    """Import and build the Markdown parser ahead of the first audit (long-lived processes)."""
+    _markdown().parse("")
+
+
+class ParsedDocument(Mapping[str, object]):
+    """Parsed view of a Markdown document, computed lazily.
+
+    Each view (tokens, lines, headings, ...) is built on first access and
+    memoized, so rules only pay for what they use. The mapping interface keeps
+    ``context["lines"]`` style access working; extra keys attached by the
+    engine (e.g. ``line_hits``) live alongside the views.
     """
-    md = MarkdownIt("commonmark").enable("strikethrough")
-    tokens = md.parse(content)
-
-    lines = content.splitlines()
-    headings: List[Heading] = []
-    code_blocks: List[CodeBlock] = []
-
-    i = 0
-    while i < len(tokens):
-        tok = tokens[i]
-        if tok.type == "heading_open":
-            level = int(tok.tag[1:]) if tok.tag.startswith("h") else 0
-            # map is [start_line, end_line) 0-based
-            start_line = (tok.map[0] + 1) if tok.map else 1
-            inline = tokens[i + 1] if i + 1 < len(tokens) else None
-            text = inline.content if inline and inline.type == "inline" else ""
-            headings.append(Heading(level=level, text=text, line=start_line))
+
+    __slots__ = (
+        "content",
+        "_tokens",
+        "_lines",
+        "_headings",
+        "_code_blocks",
+        "_section_ranges",
+        "_lowered",
+        "_links",
+        "_section_index",
+        "_code_index",
+        "_extra",
+    )
+
+    VIEWS = (
+        "tokens",
+        "lines",
+        "headings",
+        "code_blocks",
+        "code_index",
+        "section_ranges",
+        "section_index",
+        "lowered",
+        "links",
+    )
+
+    def __init__(self, content: str):
+        self.content = content
+        self._tokens: Optional[List[Token]] = None
+        self._lines: Optional[List[str]] = None
+        self._headings: Optional[List[Heading]] = None
+        self._code_blocks: Optional[List[CodeBlock]] = None
+        self._section_ranges: Optional[List[Tuple[Heading, int, int]]] = None
+        self._lowered: Optional[str] = None
+        self._links: Optional[List[Link]] = None
+        self._section_index: Optional[SectionIndex] = None
+        self._code_index: Optional[CodeBlockIndex] = None
+        self._extra: Optional[Dict[str, object]] = None
+
+    # -- mapping interface -------------------------------------------------
+
+    def __getitem__(self, key: str) -> object:
+        if key in self.VIEWS:
+            return getattr(self, key)
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: object) -> None:
+        if key in self.VIEWS:
+            raise KeyError(f"{key!r} is a computed view and cannot be replaced")
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.VIEWS
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self.VIEWS) + (len(self._extra) if self._extra else 0)
+
+    # -- views ---------------------------------------------------------------
+
+    @property
+    def tokens(self) -> List[Token]:
+        """markdown-it-py block token stream (reliable tokenization and line mappings)."""
+        if self._tokens is None:
+            self._tokens = _markdown().parse(self.content)
+        return self._tokens
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.content.splitlines()
+        return self._lines
+
+    @property
+    def lowered(self) -> str:
+        if self._lowered is None:
+            self._lowered = self.content.lower()
+        return self._lowered
+
+    @property
+    def headings(self) -> List[Heading]:
+        if self._headings is None:
+            self._scan_blocks()
+        return self._headings  # type: ignore[return-value]
+
+    @property
+    def code_blocks(self) -> List[CodeBlock]:
+        if self._code_blocks is None:
+            self._scan_blocks()
+        return self._code_blocks  # type: ignore[return-value]
+
+    @property
+    def code_index(self) -> CodeBlockIndex:
+        if self._code_index is None:
+            self._code_index = CodeBlockIndex(self.code_blocks)
+        return self._code_index
+
+    @property
+    def section_ranges(self) -> List[Tuple[Heading, int, int]]:
+        """Sections for headings (only ## and deeper are considered sections for this tool).
+
+        Each section is (heading, start_line, end_line) in 1-based inclusive start, inclusive end.
+        """
+        if self._section_ranges is None:
+            n_lines = len(self.lines)
+            relevant = [h for h in self.headings if h.level >= _SECTION_MIN_LEVEL]
+            ranges: List[Tuple[Heading, int, int]] = []
+            # sort by line already
+            for idx, h in enumerate(relevant):
+                end = n_lines
+                if idx + 1 < len(relevant):
+                    end = max(1, relevant[idx + 1].line - 1)
+                ranges.append((h, h.line, end))
+            self._section_ranges = ranges
+        return self._section_ranges
+
+    @property
+    def section_index(self) -> SectionIndex:
+        if self._section_index is None:
+            self._section_index = SectionIndex(self.section_ranges)
+        return self._section_index
+
+    @property
+    def links(self) -> List[Link]:
+        if self._links is None:
+            links: List[Link] = []
+            for tok in self.tokens:
+                if tok.type != "inline" or not tok.children:
+                    continue
+                line = (tok.map[0] + 1) if tok.map else 1
+                for child in tok.children:
+                    if child.type == "link_open":
+                        links.append(Link(href=str(child.attrs.get("href", "")), line=line))
+            self._links = links
+        return self._links
+
+    def _scan_blocks(self) -> None:
+        tokens = self.tokens
+        headings: List[Heading] = []
+        code_blocks: List[CodeBlock] = []
+
+        i = 0
+        while i < len(tokens):
+            tok = tokens[i]
+            if tok.type == "heading_open":
+                level = int(tok.tag[1:]) if tok.tag.startswith("h") else 0
+                # map is [start_line, end_line) 0-based
+                start_line = (tok.map[0] + 1) if tok.map else 1
+                inline = tokens[i + 1] if i + 1 < len(tokens) else None
+                text = inline.content if inline and inline.type == "inline" else ""
+                headings.append(Heading(level=level, text=text, line=start_line))
+                i += 1
+            elif tok.type == "fence":
+                start_line = (tok.map[0] + 1) if tok.map else 1
+                end_line = (tok.map[1]) if tok.map else start_line
+                code_blocks.append(CodeBlock(info=tok.info or "", content=tok.content or "", start_line=start_line, end_line=end_line))
             i += 1
-        elif tok.type == "fence":
-            start_line = (tok.map[0] + 1) if tok.map else 1
-            end_line = (tok.map[1]) if tok.map else start_line
-            code_blocks.append(CodeBlock(info=tok.info or "", content=tok.content or "", start_line=start_line, end_line=end_line))
-        i += 1
-
-    # Build section ranges for headings (only ## and deeper are considered sections for this tool).
-    # Each section is (heading, start_line, end_line) in 1-based inclusive start, inclusive end.
-    section_ranges: List[Tuple[Heading, int, int]] = []
-    relevant = [h for h in headings if h.level >= 2]
-    # sort by line already
-    for idx, h in enumerate(relevant):
-        start = h.line
-        end = len(lines)
-        if idx + 1 < len(relevant):
-            end = max(1, relevant[idx + 1].line - 1)
-        section_ranges.append((h, start, end))
-
-    return {
-        "lines": lines,
-        "headings": headings,
-        "code_blocks": code_blocks,
-        "section_ranges": section_ranges,
-    }
+
+        self._headings = headings
+        self._code_blocks = code_blocks
+
+
+def parse_markdown(content: str) -> ParsedDocument:
+    """Parse Markdown and return the context used by rules.
+
+    Uses markdown-it-py for reliable tokenization and line mappings.
+    Core engine and rules should treat this as an input contract; views are
+    computed on first access.
+    """
+    return ParsedDocument(content)
 
 
 def find_section(
-    context: Dict[str, object],
+    context: Mapping[str, object],
     keywords: List[str],
     *,
     min_level: int = 2,
 ) -> Optional[Tuple[Heading, int, int]]:
     """Find the first section whose normalized heading contains any keyword."""
+    index = context.get("section_index")
+    if isinstance(index, SectionIndex):
+        return index.find(keywords, min_level=min_level)
     section_ranges = context.get("section_ranges", [])
     for h, start, end in section_ranges:
         if h.level < min_level:
@@ -98,5 +362,13 @@ def find_section(
     return None
 
 
-def iter_sections(context: Dict[str, object]) -> List[Tuple[Heading, int, int]]:
+def code_index_of(context: Mapping[str, object]) -> CodeBlockIndex:
+    """The context's ``code_index``, built from ``code_blocks`` for plain dict contexts."""
+    index = context.get("code_index")
+    if isinstance(index, CodeBlockIndex):
+        return index
+    return CodeBlockIndex(cast(List[CodeBlock], context.get("code_blocks", [])))
+
+
+def iter_sections(context: Mapping[str, object]) -> List[Tuple[Heading, int, int]]:
     return list(context.get("section_ranges", []))
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import TYPE_CHECKING, ContextManager, Dict, Iterator, List, Tuple
+
+from .models import AuditReport
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.table import Table
+
+Timings = Dict[str, Dict[str, float]]
+
+_NULL = nullcontext()
+
+
+class PhaseTimer:
+    """Wall time and call count per phase for one audited file."""
+
+    __slots__ = ("timings",)
+
+    def __init__(self) -> None:
+        self.timings: Timings = {}
+
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        entry = self.timings.get(phase)
+        if entry is None:
+            entry = self.timings[phase] = {"seconds": 0.0, "calls": 0}
+        entry["seconds"] += seconds
+        entry["calls"] += calls
+
+    @contextmanager
+    def _measure(self, phase: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - start)
+
+    def __call__(self, phase: str) -> ContextManager[None]:
+        return self._measure(phase)
+
+
+class NullTimer(PhaseTimer):
+    """Stand-in used when profiling is off: no clocks are read, nothing is stored."""
+
+    __slots__ = ()
+
+    def __call__(self, phase: str) -> ContextManager[None]:
+        return _NULL
+
+
+NULL_TIMER = NullTimer()
+
+
+class Profiler:
+    """Aggregates per-file phase timings across a run.
+
+    Per-file timings arrive on ``AuditReport.timings`` (so they survive the trip
+    back from worker processes); phases measured outside the engine, such as
+    rendering, are added directly.
+    """
+
+    def __init__(self) -> None:
+        self.files = 0
+        self._totals: Dict[str, List[float]] = {}
+        self._slowest: Dict[str, Tuple[float, str]] = {}
+
+    def add(self, phase: str, seconds: float, *, calls: int = 1, filename: str = "") -> None:
+        total = self._totals.setdefault(phase, [0.0, 0])
+        total[0] += seconds
+        total[1] += calls
+        if seconds > self._slowest.get(phase, (-1.0, ""))[0]:
+            self._slowest[phase] = (seconds, filename)
+
+    def add_report(self, report: AuditReport) -> None:
+        self.files += 1
+        for phase, entry in (report.timings or {}).items():
+            self.add(phase, entry["seconds"], calls=int(entry["calls"]), filename=report.filename)
+
+    def rows(self) -> List[Tuple[str, int, float, float, float, str]]:
+        """(phase, calls, total s, mean s, max s, slowest file), slowest phase first."""
+        out = []
+        for phase, (seconds, calls) in self._totals.items():
+            worst, worst_file = self._slowest[phase]
+            out.append(
+                (phase, int(calls), seconds, seconds / calls if calls else 0.0, worst, worst_file)
+            )
+        out.sort(key=lambda r: r[2], reverse=True)
+        return out
+
+    def table(self) -> Table:
+        from rich.table import Table
+
+        table = Table(title=f"Profile ({self.files} files)")
+        table.add_column("phase", style="bold")
+        table.add_column("calls", justify="right")
+        table.add_column("total ms", justify="right")
+        table.add_column("mean ms", justify="right")
+        table.add_column("max ms", justify="right")
+        table.add_column("slowest file")
+        for phase, calls, total, mean, worst, worst_file in self.rows():
+            table.add_row(
+                phase,
+                str(calls),
+                f"{total * 1e3:.2f}",
+                f"{mean * 1e3:.3f}",
+                f"{worst * 1e3:.3f}",
+                worst_file,
+            )
+        return table
+
+
+def rounded(timings: Timings) -> Timings:
+    return {
+        phase: {"seconds": round(e["seconds"], 6), "calls": int(e["calls"])}
+        for phase, e in timings.items()
+    }
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .rules.base import Rule
+
+# Lives in the result cache directory, next to (not inside) the entry shards,
+# so cache pruning never evicts it.
+RULE_STATS_FILE = "rule_stats.json"
+
+# Measurements are merged into the file every this many rule runs, so long
+# runs share what they learn before they end (workers also save on exit).
+FLUSH_EVERY = 1024
+
+# [runs, seconds spent in check, visible findings]
+_Totals = List[float]
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``path`` (created if missing) for the block.
+
+    Where ``fcntl`` is not available (Windows) the block runs unlocked.
+    """
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        yield
+        return
+    with open(path, "a", encoding="utf-8") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+class RuleStats:
+    """Average cost and yield of each rule, persisted next to the result cache.
+
+    ``order`` puts the rules that have produced the most findings per second of
+    ``check`` first, so the ``max_issues`` cap is reached after as little work
+    as possible. Rules without measurements go first so they get measured.
+    Several processes may share one file: ``save`` adds what this process
+    measured since its last save to the totals on disk, under a lock file
+    next to it (where ``flock`` exists) so concurrent saves do not lose
+    each other's measurements.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._totals: Dict[str, _Totals] = self._load(path) if path is not None else {}
+        self._pending: Dict[str, _Totals] = {}
+        self._unsaved = 0
+
+    @staticmethod
+    def _load(path: Path) -> Dict[str, _Totals]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return {
+                str(rid): [float(runs), float(secs), float(found)]
+                for rid, (runs, secs, found) in data.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def record(self, rule_id: str, seconds: float, found: int) -> None:
+        for table in (self._totals, self._pending):
+            totals = table.get(rule_id)
+            if totals is None:
+                totals = table[rule_id] = [0.0, 0.0, 0.0]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += found
+        self._unsaved += 1
+        if self.path is not None and self._unsaved >= FLUSH_EVERY:
+            self.save()
+
+    def average(self, rule_id: str) -> Optional[Tuple[float, float]]:
+        """``(seconds, findings)`` per run of ``rule_id``, or None before its first run."""
+        totals = self._totals.get(rule_id)
+        if totals is None:
+            return None
+        runs, secs, found = totals
+        return secs / runs, found / runs
+
+    def _yield(self, rule: Rule) -> float:
+        average = self.average(rule.id)
+        if average is None:
+            return math.inf
+        secs, found = average
+        return found / max(secs, 1e-9)
+
+    def order(self, plan: Sequence[Tuple[int, Rule]]) -> List[Tuple[int, Rule]]:
+        """``plan``'s ``(position, rule)`` pairs, highest findings per second first; ties keep ``plan`` order."""
+        return sorted(plan, key=lambda pair: -self._yield(pair[1]))
+
+    def save(self) -> None:
+        """Merge this process's new measurements into the file; a no-op without a path."""
+        self._unsaved = 0
+        if self.path is None or not self._pending:
+            return
+        import tempfile
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _locked(self.path.with_suffix(".lock")):
+                totals = self._load(self.path)
+                for rid, (runs, secs, found) in self._pending.items():
+                    entry = totals.setdefault(rid, [0.0, 0.0, 0.0])
+                    entry[0] += runs
+                    entry[1] += secs
+                    entry[2] += found
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(totals, fh, separators=(",", ":"), sort_keys=True)
+                os.replace(tmp, self.path)
+        except OSError:
+            # Like the cache itself: a read-only disk must not fail the audit.
+            return
+        self._totals = totals
+        self._pending = {}
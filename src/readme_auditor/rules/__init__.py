@@ -1,32 +1,49 @@
 from __future__ import annotations
 
-from typing import Dict, Type
-
-from .assumed_knowledge import AssumedPriorKnowledgeRule
-from .base import Rule
-from .link_only_setup import LinkOnlySetupRule
-from .missing_limitations import MissingLimitationsRule
-from .missing_sections import MissingRequiredSectionsRule
-from .no_examples import NoExamplesRule
-from .no_troubleshooting import NoTroubleshootingRule
-from .overpromising import OverpromisingScopeRule
-from .unclear_audience import UnclearAudienceRule
-from .unfalsifiable import UnfalsifiableClaimsRule
-from .vague_claims import VagueClaimsRule
-
-RULES: Dict[str, Type[Rule]] = {
-    "vague_claims": VagueClaimsRule,
-    "missing_sections": MissingRequiredSectionsRule,
-    "unfalsifiable": UnfalsifiableClaimsRule,
-    "link_only_setup": LinkOnlySetupRule,
-    "assumed_knowledge": AssumedPriorKnowledgeRule,
-    "no_examples": NoExamplesRule,
-    "overpromising": OverpromisingScopeRule,
-    "unclear_audience": UnclearAudienceRule,
-    "no_troubleshooting": NoTroubleshootingRule,
-    "missing_limitations": MissingLimitationsRule,
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Tuple, Type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import Rule
+
+# rule_id -> (module, class). Rule modules are imported on first use, so
+# rules disabled in config add nothing to startup time.
+_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "vague_claims": ("vague_claims", "VagueClaimsRule"),
+    "missing_sections": ("missing_sections", "MissingRequiredSectionsRule"),
+    "unfalsifiable": ("unfalsifiable", "UnfalsifiableClaimsRule"),
+    "link_only_setup": ("link_only_setup", "LinkOnlySetupRule"),
+    "assumed_knowledge": ("assumed_knowledge", "AssumedPriorKnowledgeRule"),
+    "no_examples": ("no_examples", "NoExamplesRule"),
+    "overpromising": ("overpromising", "OverpromisingScopeRule"),
+    "unclear_audience": ("unclear_audience", "UnclearAudienceRule"),
+    "no_troubleshooting": ("no_troubleshooting", "NoTroubleshootingRule"),
+    "missing_limitations": ("missing_limitations", "MissingLimitationsRule"),
 }
+_BY_CLASS = {cls_name: rule_id for rule_id, (_, cls_name) in _REGISTRY.items()}
+
+
+def rule_ids() -> List[str]:
+    return list(_REGISTRY)
+
+
+def load_rule(rule_id: str) -> Type[Rule]:
+    module, cls_name = _REGISTRY[rule_id]
+    return getattr(importlib.import_module(f".{module}", __name__), cls_name)  # type: ignore[no-any-return]
 
 
 def list_rules() -> Dict[str, Type[Rule]]:
-    return dict(RULES)
+    return {rid: load_rule(rid) for rid in _REGISTRY}
+
+
+def __getattr__(name: str) -> object:
+    # Keep `from readme_auditor.rules import VagueClaimsRule` (and RULES) working.
+    if name == "RULES":
+        return list_rules()
+    if name == "Rule":
+        from .base import Rule
+
+        return Rule
+    if name in _BY_CLASS:
+        return load_rule(_BY_CLASS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Hit = Tuple[int, str, "re.Match[str]"]
 
 
 def iter_matching_lines(
@@ -10,7 +12,7 @@ def iter_matching_lines(
     *,
     start_line: int = 1,
     end_line: Optional[int] = None,
-) -> Iterable[Tuple[int, str, re.Match[str]]]:
+) -> Iterable[Hit]:
     if end_line is None:
         end_line = len(lines)
     for lineno in range(start_line, end_line + 1):
@@ -20,3 +22,51 @@ def iter_matching_lines(
         m = pattern.search(text)
         if m:
             yield lineno, text, m
+
+
+def _inline(pattern: re.Pattern[str]) -> Optional[str]:
+    # Only IGNORECASE can be carried into a scoped group; anything else
+    # (MULTILINE, VERBOSE, ...) makes the combined prefilter unsafe.
+    flags = pattern.flags & ~re.UNICODE
+    if flags & ~re.IGNORECASE:
+        return None
+    prefix = "(?i:" if flags & re.IGNORECASE else "(?:"
+    return prefix + pattern.pattern + ")"
+
+
+class LineScanner:
+    """Walk document lines once and route matches to every registered pattern.
+
+    A combined alternation of all patterns acts as a prefilter: a line that it
+    does not match cannot match any individual pattern, so only candidate lines
+    are searched again per pattern. Hits are identical to calling
+    ``iter_matching_lines`` once per pattern.
+    """
+
+    def __init__(self, patterns: Dict[str, re.Pattern[str]]):
+        self._patterns = list(patterns.items())
+        self._prefilter: Optional[re.Pattern[str]] = None
+        parts = [_inline(p) for _, p in self._patterns]
+        if parts and all(part is not None for part in parts):
+            try:
+                self._prefilter = re.compile("|".join(parts))  # type: ignore[arg-type]
+            except re.error:
+                self._prefilter = None
+
+    def __bool__(self) -> bool:
+        return bool(self._patterns)
+
+    def scan(self, lines: List[str]) -> Dict[str, List[Hit]]:
+        hits: Dict[str, List[Hit]] = {key: [] for key, _ in self._patterns}
+        if not self._patterns:
+            return hits
+        prefilter = self._prefilter.search if self._prefilter is not None else None
+        patterns = [(hits[key], p.search) for key, p in self._patterns]
+        for lineno, text in enumerate(lines, start=1):
+            if prefilter is not None and prefilter(text) is None:
+                continue
+            for bucket, search in patterns:
+                m = search(text)
+                if m:
+                    bucket.append((lineno, text, m))
+        return hits
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
 from ..parser import find_section
-from ._utils import iter_matching_lines
 from .base import Rule
 
 
@@ -20,10 +19,13 @@ class AssumedPriorKnowledgeRule(Rule):
         severity="info",
         description="Flags imperative setup steps that omit prerequisites or context.",
     )
+    line_pattern = _IMPERATIVE
+    scope = "section"
+    section_keywords = ("installation", "setup", "getting started")
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
         lines = context["lines"]
-        install = find_section(context, ["installation", "setup", "getting started"])
+        install = find_section(context, list(self.section_keywords))
         if not install:
             return []
         heading, start, end = install
@@ -31,7 +33,7 @@ class AssumedPriorKnowledgeRule(Rule):
 
         issues: List[Issue] = []
         has_prereq_section = bool(_PREREQ.search("\n".join(body_lines)))
-        for lineno, line, _ in iter_matching_lines(lines, _IMPERATIVE, start_line=start, end_line=end):
+        for lineno, line, _ in self.line_hits(context, start_line=start, end_line=end):
             if has_prereq_section:
                 continue
             issues.append(
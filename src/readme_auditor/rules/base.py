@@ -1,19 +1,50 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable, List, Literal, Mapping, Optional, Tuple
 
 from ..models import Issue, RuleMeta, Severity
+from ._utils import Hit, iter_matching_lines
+
+Scope = Literal["document", "section", "line"]
 
 
 class Rule(ABC):
-    """Abstract base class for all audit rules."""
+    """Abstract base class for all audit rules.
+
+    ``check`` returns issues without a filename; the engine fills it in on a
+    copy, so a rule may return the same (frozen) ``Issue`` for every document.
+    """
 
     meta: RuleMeta
+    # Bump when a rule's logic changes so cached results from older runs are not reused.
+    version: int = 1
+    # Line-oriented rules set this so the engine can fold them into one shared
+    # pass over the document (see ``LineScanner``).
+    line_pattern: Optional[re.Pattern[str]] = None
+    # What a rule's findings depend on, so an incremental engine knows when it
+    # can reuse the previous run's results for a file:
+    #   "document" - anything in the document (rerun on any change)
+    #   "section"  - only the section found by ``section_keywords`` (or its absence)
+    #   "line"     - only ``line_hits`` entries and, for each hit, its line and the next
+    scope: Scope = "document"
+    section_keywords: Tuple[str, ...] = ()
+    # Severities a rule may emit besides its effective one (escalations), so
+    # the engine can skip rules that cannot reach the severity threshold.
+    extra_severities: Tuple[Severity, ...] = ()
 
     def __init__(self, *, severity_override: Severity | None = None, options: Dict[str, object] | None = None):
         self._severity_override = severity_override
         self.options: Dict[str, object] = options or {}
+        self._severity: Severity = severity_override or self.meta.severity
+        self.prepare()
+
+    def prepare(self) -> None:  # noqa: B027 - optional hook, most rules have nothing to prepare
+        """Resolve options into ready-to-use state (compiled patterns, keyword lists).
+
+        Called once at construction so that ``check`` only does per-document work.
+        """
 
     @property
     def id(self) -> str:
@@ -29,8 +60,26 @@ class Rule(ABC):
 
     @property
     def severity(self) -> Severity:
-        return self._severity_override or self.meta.severity
+        return self._severity
+
+    def line_hits(
+        self,
+        context: Mapping[str, object],
+        *,
+        start_line: int = 1,
+        end_line: Optional[int] = None,
+    ) -> Iterable[Hit]:
+        """Lines matching ``line_pattern``, from the shared scan when the engine ran one."""
+        assert self.line_pattern is not None
+        shared = context.get("line_hits")
+        if isinstance(shared, dict) and self.id in shared:
+            hits: List[Hit] = shared[self.id]
+            if start_line <= 1 and end_line is None:
+                return hits
+            return [h for h in hits if h[0] >= start_line and (end_line is None or h[0] <= end_line)]
+        lines: List[str] = context["lines"]  # type: ignore[assignment]
+        return iter_matching_lines(lines, self.line_pattern, start_line=start_line, end_line=end_line)
 
     @abstractmethod
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
         raise NotImplementedError  # pragma: no cover
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
-from ..parser import find_section
+from ..parser import code_index_of, find_section
 from .base import Rule
 
 
@@ -19,10 +19,11 @@ class LinkOnlySetupRule(Rule):
         severity="warning",
         description="Flags installation sections that only point to external docs without concrete steps.",
     )
+    scope = "section"
+    section_keywords = ("installation", "setup", "getting started")
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        code_blocks = context["code_blocks"]
-        section = find_section(context, ["installation", "setup", "getting started"])
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
+        section = find_section(context, list(self.section_keywords))
         if not section:
             return []
         heading, start, end = section
@@ -30,7 +31,7 @@ class LinkOnlySetupRule(Rule):
         body = "\n".join(lines[start - 1 : end])
 
         has_link = bool(_LINK.search(body)) and bool(_DOC_PHRASES.search(body))
-        has_code = any((cb.start_line >= start and cb.end_line <= end) for cb in code_blocks)
+        has_code = code_index_of(context).any_within(start, end)
 
         if has_link and not has_code:
             return [
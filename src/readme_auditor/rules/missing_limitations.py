@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
 from ..parser import find_section
@@ -14,9 +14,11 @@ class MissingLimitationsRule(Rule):
         severity="warning",
         description="Checks for Limitations, Non-goals, or Known Issues section.",
     )
+    scope = "section"
+    section_keywords = ("limitations", "non goals", "non-goals", "known issues", "caveats")
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        section = find_section(context, ["limitations", "non goals", "non-goals", "known issues", "caveats"])
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
+        section = find_section(context, list(self.section_keywords))
         if section:
             return []
         return [
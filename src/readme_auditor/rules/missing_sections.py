@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import List, Mapping, Optional, Tuple
 
 from ..models import Issue, RuleMeta
-from ..parser import normalize_heading
+from ..parser import find_section
 from .base import Rule
 
 
@@ -14,19 +15,13 @@ class MissingRequiredSectionsRule(Rule):
         severity="warning",
         description="Checks for common README sections such as Installation and Usage.",
     )
+    # Missing Installation or Usage is always an error.
+    extra_severities = ("error",)
 
-    def _has_section(self, headings: List[object], keyword: str) -> bool:
-        for h in headings:
-            text = getattr(h, "text", "")
-            level = getattr(h, "level", 0)
-            if level < 2:
-                continue
-            if keyword in normalize_heading(str(text)):
-                return True
-        return False
+    def _has_section(self, context: Mapping[str, object], keyword: str) -> bool:
+        return find_section(context, [keyword]) is not None
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        headings = context["headings"]
+    def prepare(self) -> None:
         # Defaults and config overrides
         required = ["installation", "usage", "license"]
         optional = ["contributing"]
@@ -36,11 +31,14 @@ class MissingRequiredSectionsRule(Rule):
             required = [str(x).strip().lower() for x in req_cfg if str(x).strip()]
         if isinstance(opt_cfg, list):
             optional = [str(x).strip().lower() for x in opt_cfg if str(x).strip()]
+        self._required = required
+        self._optional = optional
 
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
         issues: List[Issue] = []
 
-        for kw in required:
-            if not self._has_section(headings, kw):
+        for kw in self._required:
+            if not self._has_section(context, kw):
                 sev = "error" if kw in {"installation", "usage"} else self.severity
                 issues.append(
                     Issue(
@@ -48,31 +46,31 @@ class MissingRequiredSectionsRule(Rule):
                         severity=sev,  # type: ignore[arg-type]
                         line=None,
                         text=f"Missing section: {kw}",
-                        explanation=f"README is missing a '## {kw.title()}' section.",
-                        suggestion=f"Add a '## {kw.title()}' section with concrete content.",
+                        explanation=sys.intern(f"README is missing a '## {kw.title()}' section."),
+                        suggestion=sys.intern(f"Add a '## {kw.title()}' section with concrete content."),
                     )
                 )
 
-        for kw in optional:
-            if not self._has_section(headings, kw):
+        for kw in self._optional:
+            if not self._has_section(context, kw):
                 issues.append(
                     Issue(
                         rule_id=self.id,
                         severity=self.severity,
                         line=None,
                         text=f"Missing optional section: {kw}",
-                        explanation=f"README does not include a '## {kw.title()}' section.",
-                        suggestion=f"Consider adding '## {kw.title()}' to set expectations and help contributors.",
+                        explanation=sys.intern(f"README does not include a '## {kw.title()}' section."),
+                        suggestion=sys.intern(f"Consider adding '## {kw.title()}' to set expectations and help contributors."),
                     )
                 )
 
         # API Reference is conditional: required if README indicates it is a library.
         # Heuristic: contains 'pip install' or 'import ' and mentions 'library' or 'package'
-        lowered = content.lower()
+        lowered = context["lowered"]
         looks_like_library = any(x in lowered for x in ["import ", "from "]) and any(
             x in lowered for x in ["library", "package", "python"]
         )
-        if looks_like_library and not self._has_section(headings, "api") and not self._has_section(headings, "reference"):
+        if looks_like_library and not self._has_section(context, "api") and not self._has_section(context, "reference"):
             issues.append(
                 Issue(
                     rule_id=self.id,
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
-from ..parser import find_section, normalize_heading
+from ..parser import code_index_of, find_section, normalize_heading
 from .base import Rule
 
 
@@ -14,11 +14,12 @@ class NoExamplesRule(Rule):
         severity="warning",
         description="Checks that Usage or Examples includes at least one code block.",
     )
+    scope = "section"
+    section_keywords = ("usage", "examples")
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
         lines = context["lines"]
-        code_blocks = context["code_blocks"]
-        section = find_section(context, ["usage", "examples"])
+        section = find_section(context, list(self.section_keywords))
         if not section:
             return [
                 Issue(
@@ -33,7 +34,7 @@ class NoExamplesRule(Rule):
 
         heading, start, end = section
 
-        has_code = any((cb.start_line >= start and cb.end_line <= end) for cb in code_blocks)
+        has_code = code_index_of(context).any_within(start, end)
         if has_code:
             return []
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
 from ..parser import find_section
@@ -14,9 +14,11 @@ class NoTroubleshootingRule(Rule):
         severity="info",
         description="Checks for Troubleshooting, FAQ, or Common Issues section.",
     )
+    scope = "section"
+    section_keywords = ("troubleshooting", "faq", "common issues", "common problems")
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        section = find_section(context, ["troubleshooting", "faq", "common issues", "common problems"])
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
+        section = find_section(context, list(self.section_keywords))
         if section:
             return []
         return [
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
-from ._utils import iter_matching_lines
 from .base import Rule
 
 
@@ -22,11 +21,12 @@ class OverpromisingScopeRule(Rule):
         severity="warning",
         description="Flags universal claims about scope without constraints.",
     )
+    line_pattern = _OVERPROMISE
+    scope = "line"
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        lines = context["lines"]
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
         issues: List[Issue] = []
-        for lineno, line, match in iter_matching_lines(lines, _OVERPROMISE):
+        for lineno, line, match in self.line_hits(context):
             if _BOUNDS.search(line):
                 continue
             issues.append(
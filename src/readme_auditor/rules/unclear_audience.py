@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
 from .base import Rule
@@ -14,8 +14,8 @@ class UnclearAudienceRule(Rule):
         description="Checks whether the README clearly states the target audience and artifact type.",
     )
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        lowered = content.lower()
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
+        lowered = context["lowered"]
         mentions = [
             "cli",
             "command line",
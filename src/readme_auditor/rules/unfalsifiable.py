@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+import sys
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
-from ._utils import iter_matching_lines
 from .base import Rule
 
 
@@ -22,11 +22,12 @@ class UnfalsifiableClaimsRule(Rule):
         severity="warning",
         description="Flags absolute language that cannot be realistically guaranteed.",
     )
+    line_pattern = _ABSOLUTES
+    scope = "line"
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        lines = context["lines"]
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
         issues: List[Issue] = []
-        for lineno, line, match in iter_matching_lines(lines, _ABSOLUTES):
+        for lineno, line, match in self.line_hits(context):
             if _CAVEAT.search(line):
                 continue
             phrase = match.group(0)
@@ -36,7 +37,7 @@ class UnfalsifiableClaimsRule(Rule):
                     severity=self.severity,
                     line=lineno,
                     text=line.strip(),
-                    explanation=f"Absolute phrase {phrase!r} is not realistically falsifiable or supportable in a README.",
+                    explanation=sys.intern(f"Absolute phrase {phrase!r} is not realistically falsifiable or supportable in a README."),
                     suggestion="Replace absolutes with bounded claims and describe known failure modes or constraints.",
                 )
             )
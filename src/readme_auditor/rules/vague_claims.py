@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+import sys
+from typing import List, Mapping
 
 from ..models import Issue, RuleMeta
-from ._utils import iter_matching_lines
 from .base import Rule
 
 DEFAULT_ADJECTIVES = ["fast", "simple", "powerful", "scalable"]
@@ -20,19 +20,21 @@ class VagueClaimsRule(Rule):
         severity="warning",
         description="Flags vague adjectives like 'fast' or 'simple' when not supported by evidence.",
     )
+    scope = "line"
 
-    def check(self, content: str, context: Dict[str, object]) -> List[Issue]:
-        lines = context["lines"]
+    def prepare(self) -> None:
         custom = self.options.get("custom_adjectives")
         adjectives = list(DEFAULT_ADJECTIVES)
         if isinstance(custom, list):
             adjectives.extend([str(x).strip() for x in custom if str(x).strip()])
 
         words = "|".join(re.escape(a) for a in sorted(set(adjectives), key=len, reverse=True))
-        pattern = re.compile(_WORD.format(words=words), re.IGNORECASE)
+        self.line_pattern = re.compile(_WORD.format(words=words), re.IGNORECASE)
 
+    def check(self, content: str, context: Mapping[str, object]) -> List[Issue]:
+        lines = context["lines"]
         issues: List[Issue] = []
-        for lineno, line, match in iter_matching_lines(lines, pattern):
+        for lineno, line, match in self.line_hits(context):
             # Require absence of numeric evidence on same line and nearby (one line forward)
             window = line
             if lineno < len(lines):
@@ -47,7 +49,7 @@ class VagueClaimsRule(Rule):
                     severity=self.severity,
                     line=lineno,
                     text=line.strip(),
-                    explanation=f"Adjective {word!r} lacks evidence or context (numbers, benchmarks, or comparisons).",
+                    explanation=sys.intern(f"Adjective {word!r} lacks evidence or context (numbers, benchmarks, or comparisons)."),
                     suggestion="Add benchmarks, comparisons, or specific examples that justify the claim.",
                 )
             )
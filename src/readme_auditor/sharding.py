@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from .engine import merge_summaries
+from .models import AuditSummary
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse ``INDEX/COUNT`` (1-based, e.g. ``3/16``) into a 0-based index and a count."""
+    index, sep, count = value.partition("/")
+    try:
+        i, n = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"shard must look like INDEX/COUNT, got {value!r}") from None
+    if not sep or n < 1 or not 1 <= i <= n:
+        raise ValueError(f"shard index must be between 1 and COUNT, got {value!r}")
+    return i - 1, n
+
+
+def shard_of(rel: str, count: int) -> int:
+    """Stable 0-based shard for a relative path: same on every machine and Python run."""
+    digest = hashlib.blake2b(rel.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count
+
+
+def select_shard(paths: Iterable[Path], root: Path, index: int, count: int) -> Iterator[Path]:
+    """The paths that belong to shard ``index`` of ``count``, keyed on their path relative to ``root``."""
+    for p in paths:
+        try:
+            rel = p.relative_to(root).as_posix()
+        except ValueError:
+            rel = p.as_posix()
+        if shard_of(rel, count) == index:
+            yield p
+
+
+def iter_reports(text: str) -> Iterator[Dict[str, Any]]:
+    """Report dicts from ``--format ndjson`` output or from one or more ``--format json`` reports.
+
+    NDJSON summary records are skipped; totals are recomputed from the reports.
+    """
+    decoder = json.JSONDecoder()
+    pos = 0
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            return
+        record, pos = decoder.raw_decode(text, pos)
+        if isinstance(record, dict) and record.get("type", "report") == "report":
+            yield record
+
+
+def merge_outputs(paths: Iterable[Path]) -> Tuple[AuditSummary, int, bool]:
+    """Combine sharded outputs into ``(summary, files, passed)``.
+
+    A file reported by more than one input is counted once (the last one wins),
+    so re-running a failed shard and merging both outputs is harmless.
+    """
+    reports: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        for record in iter_reports(path.read_text(encoding="utf-8")):
+            reports[str(record["filename"])] = record
+    summary = merge_summaries(AuditSummary(**r["summary"]) for r in reports.values())
+    return summary, len(reports), all(bool(r["passed"]) for r in reports.values())
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import csv
+from array import array
+from collections import Counter
+from typing import IO, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import AuditReport, Issue, Severity
+
+SEVERITIES: Tuple[Severity, ...] = ("info", "warning", "error")
+_SEV_CODE: Dict[str, int] = {s: code for code, s in enumerate(SEVERITIES)}
+
+# Column names accepted by ``IssueTable.count``.
+COLUMNS = ("rule", "severity", "file")
+
+_NO_LINE = -1
+
+
+class _Codes:
+    """Dictionary encoding: each distinct string gets the next small int."""
+
+    __slots__ = ("values", "_index")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class IssueTable:
+    """Findings of many reports stored column by column for corpus-level aggregation.
+
+    Rule ids and filenames are dictionary-encoded, severities are small-int
+    codes (ordered like the severities themselves) and line numbers live in an
+    ``array('i')``, so a million findings cost a few bytes each plus their
+    text. Counting runs over the int columns without materializing ``Issue``
+    objects. Fill it from streaming audits with ``add_report``.
+    """
+
+    def __init__(self) -> None:
+        self._rules = _Codes()
+        self._files = _Codes()
+        self._rule = array("H")
+        self._severity = array("B")
+        self._file = array("I")
+        self._line = array("i")
+        self._text: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._rule)
+
+    def add(self, issue: Issue, filename: Optional[str] = None) -> None:
+        self._rule.append(self._rules.code(issue.rule_id))
+        self._severity.append(_SEV_CODE[issue.severity])
+        self._file.append(self._files.code(filename or issue.filename or ""))
+        self._line.append(_NO_LINE if issue.line is None else issue.line)
+        self._text.append(issue.text)
+
+    def add_report(self, report: AuditReport) -> None:
+        for issue in report.issues:
+            self.add(issue, report.filename)
+
+    @classmethod
+    def from_reports(cls, reports: Iterable[AuditReport]) -> IssueTable:
+        table = cls()
+        for report in reports:
+            table.add_report(report)
+        return table
+
+    def _decode(self, column: str, code: int) -> str:
+        if column == "rule":
+            return self._rules.values[code]
+        if column == "severity":
+            return SEVERITIES[code]
+        return self._files.values[code]
+
+    def _column(self, column: str) -> array[int]:
+        if column not in COLUMNS:
+            raise ValueError(f"unknown column {column!r}; expected one of {', '.join(COLUMNS)}")
+        return {"rule": self._rule, "severity": self._severity, "file": self._file}[column]
+
+    def count(self, *by: str) -> Dict[Tuple[str, ...], int]:
+        """Number of findings per combination of ``by`` columns (``rule``, ``severity``, ``file``)."""
+        columns = [self._column(c) for c in by]
+        raw: Counter[Tuple[int, ...]] = Counter(zip(*columns))
+        return {
+            tuple(self._decode(c, code) for c, code in zip(by, key)): n for key, n in raw.items()
+        }
+
+    def count_by_file_group(self, group: Callable[[str], str]) -> Dict[str, int]:
+        """Findings per ``group(filename)``, e.g. the repository a file belongs to.
+
+        ``group`` is called once per distinct filename, not once per finding.
+        """
+        per_file = Counter(self._file)
+        out: Counter[str] = Counter()
+        for code, n in per_file.items():
+            out[group(self._files.values[code])] += n
+        return dict(out)
+
+    def top_files(self, n: int = 10, *, min_severity: Severity = "info") -> List[Tuple[str, int]]:
+        """The ``n`` files with the most findings at or above ``min_severity``."""
+        floor = _SEV_CODE[min_severity]
+        if floor == 0:
+            counts = Counter(self._file)
+        else:
+            counts = Counter(f for f, s in zip(self._file, self._severity) if s >= floor)
+        return [(self._files.values[code], k) for code, k in counts.most_common(n)]
+
+    def write_csv(self, fh: IO[str]) -> None:
+        writer = csv.writer(fh)
+        writer.writerow(["filename", "line", "rule_id", "severity", "text"])
+        files, rules = self._files.values, self._rules.values
+        for f, line, r, s, text in zip(
+            self._file, self._line, self._rule, self._severity, self._text
+        ):
+            writer.writerow(
+                [files[f], "" if line == _NO_LINE else line, rules[r], SEVERITIES[s], text]
+            )
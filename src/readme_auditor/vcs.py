@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import subprocess
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Set, Tuple
+
+
+class GitError(RuntimeError):
+    """A git command failed or git is not available."""
+
+
+def _command(repo: Path, *args: str) -> List[str]:
+    return ["git", "-C", str(repo), *args]
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run a git command in ``repo`` and return its stdout."""
+    try:
+        done = subprocess.run(_command(repo, *args), capture_output=True, text=True)
+    except OSError as e:
+        raise GitError(f"cannot run git: {e}") from e
+    if done.returncode != 0:
+        raise GitError(done.stderr.strip() or f"git {args[0]} failed")
+    return done.stdout
+
+
+def changed_paths(path: Path, *, since: Optional[str] = None, staged: bool = False) -> Set[Path]:
+    """Resolved paths of files changed in the repository containing ``path``.
+
+    ``since`` covers everything changed after the merge base of that ref and
+    HEAD, uncommitted edits included (what a pull request touches);
+    ``staged`` covers the index (what a pre-commit hook sees). Both may be
+    given. Deleted files are left out.
+    """
+    cwd = path if path.is_dir() else path.parent
+    top = Path(git(cwd, "rev-parse", "--show-toplevel").strip())
+    names: List[str] = []
+    if since is not None:
+        base = git(cwd, "merge-base", since, "HEAD").strip()
+        names += git(cwd, "diff", "--name-only", "-z", "--diff-filter=d", base, "--").split("\0")
+    if staged:
+        names += git(cwd, "diff", "--cached", "--name-only", "-z", "--diff-filter=d", "--").split(
+            "\0"
+        )
+    return {(top / name).resolve() for name in names if name}
+
+
+def rev_list(repo: Path, rev_range: Optional[str] = None) -> Iterator[Tuple[str, int]]:
+    """Yield ``(commit, committer_timestamp)`` oldest first, streamed from ``git rev-list``."""
+    try:
+        proc = subprocess.Popen(
+            _command(repo, "rev-list", "--reverse", "--timestamp", rev_range or "HEAD", "--"),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except OSError as e:
+        raise GitError(f"cannot run git: {e}") from e
+    assert proc.stdout is not None and proc.stderr is not None
+    with proc:
+        for line in proc.stdout:
+            stamp, _, commit = line.strip().partition(" ")
+            yield commit, int(stamp)
+        err = proc.stderr.read()
+    if proc.returncode != 0:
+        raise GitError(err.strip() or "git rev-list failed")
+
+
+class CatFile:
+    """One long-lived ``git cat-file`` process answering object queries over its pipes.
+
+    With ``contents=False`` it runs ``--batch-check`` (object id, type and size
+    only); otherwise ``--batch``, which also streams the object bytes.
+    Queries are answered one at a time, so no pipe ever fills up.
+    """
+
+    def __init__(self, repo: Path, *, contents: bool = True):
+        self.contents = contents
+        mode = "--batch" if contents else "--batch-check"
+        try:
+            self._proc = subprocess.Popen(
+                _command(repo, "cat-file", mode), stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+        except OSError as e:
+            raise GitError(f"cannot run git: {e}") from e
+
+    def _ask(self, spec: str) -> Optional[Tuple[str, str, int]]:
+        stdin: IO[bytes] = self._proc.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = self._proc.stdout  # type: ignore[assignment]
+        try:
+            stdin.write(spec.encode("utf-8") + b"\n")
+            stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise GitError("git cat-file exited") from e
+        header = stdout.readline()
+        if not header:
+            raise GitError("git cat-file exited")
+        parts = header.decode("utf-8").split()
+        if len(parts) != 3:
+            # "<spec> missing" or "<spec> ambiguous"
+            return None
+        oid, kind, size = parts
+        return oid, kind, int(size)
+
+    def info(self, spec: str) -> Optional[Tuple[str, str]]:
+        """``(object_id, type)`` for ``spec`` (e.g. ``<commit>:README.md``), or None if missing."""
+        found = self._ask(spec)
+        if found is None:
+            return None
+        if self.contents:
+            self._proc.stdout.read(found[2] + 1)  # type: ignore[union-attr]
+        return found[0], found[1]
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """Raw bytes of the object named by ``spec``, or None if it does not exist."""
+        assert self.contents, "read() needs a --batch process"
+        found = self._ask(spec)
+        if found is None:
+            return None
+        data = self._proc.stdout.read(found[2] + 1)  # type: ignore[union-attr]
+        return data[:-1]
+
+    def close(self) -> None:
+        if self._proc.stdin is not None and not self._proc.stdin.closed:
+            with suppress(BrokenPipeError):
+                self._proc.stdin.close()
+        self._proc.wait()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+
+    def __enter__(self) -> CatFile:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
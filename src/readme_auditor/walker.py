@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from pathlib import Path
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Vendored / tool directories that are never descended into.
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".nox",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "node_modules",
+        "bower_components",
+        "site-packages",
+        "vendor",
+    }
+)
+
+README_NAMES = frozenset({"readme.md"})
+
+
+def _compile(globs: List[str]) -> Optional[Pattern[str]]:
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(g)})" for g in globs))
+
+
+class IgnoreRules:
+    """A small subset of ``.gitignore`` semantics, compiled for fast matching.
+
+    - blank lines and ``#`` comments are skipped
+    - a trailing ``/`` restricts a pattern to directories
+    - a pattern containing ``/`` is matched against the path relative to the root
+      (a leading ``/`` is dropped), anything else against the entry name at any depth
+    - negated patterns (``!pattern``) are not supported and are ignored
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        name_any: List[str] = []
+        path_any: List[str] = []
+        name_dir: List[str] = []
+        path_dir: List[str] = []
+        for raw in patterns:
+            pat = raw.strip()
+            if not pat or pat.startswith(("#", "!")):
+                continue
+            dir_only = pat.endswith("/")
+            pat = pat.rstrip("/")
+            anchored = "/" in pat
+            pat = pat.lstrip("/")
+            if not pat:
+                continue
+            if anchored:
+                (path_dir if dir_only else path_any).append(pat)
+            else:
+                (name_dir if dir_only else name_any).append(pat)
+        self._name_any = _compile(name_any)
+        self._path_any = _compile(path_any)
+        self._name_dir = _compile(name_dir)
+        self._path_dir = _compile(path_dir)
+
+    @classmethod
+    def from_file(cls, path: Path, extra: Iterable[str] = ()) -> IgnoreRules:
+        lines: List[str] = []
+        if path.is_file():
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        return cls([*lines, *extra])
+
+    def match(self, rel: str, name: str, *, is_dir: bool) -> bool:
+        checks: Tuple[Tuple[Optional[Pattern[str]], str], ...] = (
+            (self._name_any, name),
+            (self._path_any, rel),
+        )
+        if is_dir:
+            checks += ((self._name_dir, name), (self._path_dir, rel))
+        return any(pat is not None and pat.match(value) for pat, value in checks)
+
+
+def _wanted(name: str, names: FrozenSet[str], suffixes: Tuple[str, ...]) -> bool:
+    lowered = name.lower()
+    return lowered in names or lowered.endswith(suffixes)
+
+
+def iter_markdown(
+    root: Path,
+    *,
+    ignore: Optional[IgnoreRules] = None,
+    skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+    names: Iterable[str] = README_NAMES,
+    suffixes: Tuple[str, ...] = (),
+) -> Iterator[Path]:
+    """Yield README files (and files ending in one of ``suffixes``) under ``root`` as they are found.
+
+    Built on ``os.scandir`` so directory entries come with their type and no
+    extra ``stat`` calls are needed. Skipped and ignored directories are pruned
+    before descending. Within a directory, files come before subdirectories and
+    both are sorted by name, so the order is deterministic.
+    """
+    ignore = ignore or IgnoreRules()
+    skip = frozenset(skip_dirs)
+    wanted = frozenset(n.lower() for n in names)
+    stack: List[Tuple[str, str]] = [(str(root), "")]
+    while stack:
+        dirpath, rel_dir = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: List[Tuple[str, str]] = []
+        for entry in entries:
+            name = entry.name
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:  # pragma: no cover - entry vanished mid-walk
+                continue
+            if is_dir:
+                if name in skip or ignore.match(rel, name, is_dir=True):
+                    continue
+                subdirs.append((entry.path, rel))
+            elif (
+                _wanted(name, wanted, suffixes)
+                and entry.is_file()
+                and not ignore.match(rel, name, is_dir=False)
+            ):
+                yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+def select_markdown(
+    root: Path,
+    paths: Iterable[Path],
+    *,
+    ignore: Optional[IgnoreRules] = None,
+    skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+    names: Iterable[str] = README_NAMES,
+    suffixes: Tuple[str, ...] = (),
+) -> List[Path]:
+    """The subset of ``paths`` that ``iter_markdown(root, ...)`` would yield, without walking.
+
+    Used when the candidate files are already known (e.g. the files changed
+    in a git diff), so the cost depends on the change rather than the tree.
+    """
+    ignore = ignore or IgnoreRules()
+    skip = frozenset(skip_dirs)
+    wanted = frozenset(n.lower() for n in names)
+    base = root.resolve()
+    selected: List[Tuple[Tuple[Tuple[int, str], ...], Path]] = []
+    for path in paths:
+        try:
+            parts = path.resolve().relative_to(base).parts
+        except ValueError:
+            continue
+        if not parts or not _wanted(parts[-1], wanted, suffixes) or not path.is_file():
+            continue
+        dirs = parts[:-1]
+        if any(
+            d in skip or ignore.match("/".join(dirs[: i + 1]), d, is_dir=True)
+            for i, d in enumerate(dirs)
+        ):
+            continue
+        if ignore.match("/".join(parts), parts[-1], is_dir=False):
+            continue
+        # Same order as the walk: files in a directory before its subdirectories.
+        selected.append((tuple((1, d) for d in dirs) + ((0, parts[-1]),), root.joinpath(*parts)))
+    return [p for _, p in sorted(selected, key=lambda item: item[0])]
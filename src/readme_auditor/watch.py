@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import os
+import select
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .engine import AuditEngine
+from .models import AuditReport, Issue
+
+Fingerprint = Tuple[int, int]  # (mtime_ns, size)
+FindingKey = Tuple[str, str, str]
+
+
+def _finding_key(issue: Issue) -> FindingKey:
+    # Line numbers shift whenever text is inserted above a finding, so they
+    # are not part of its identity.
+    return (issue.rule_id, issue.severity, issue.text)
+
+
+@dataclass(frozen=True)
+class FindingsDiff:
+    filename: str
+    report: AuditReport
+    added: List[Issue] = field(default_factory=list)
+    resolved: List[Issue] = field(default_factory=list)
+
+    def as_json_dict(self) -> Dict[str, object]:
+        def _brief(i: Issue) -> Dict[str, object]:
+            return {"rule_id": i.rule_id, "severity": i.severity, "line": i.line, "text": i.text}
+
+        return {
+            "type": "diff",
+            "filename": self.filename,
+            "added": [_brief(i) for i in self.added],
+            "resolved": [_brief(i) for i in self.resolved],
+            "summary": self.report.summary.as_dict(),
+            "passed": self.report.passed,
+        }
+
+
+def diff_reports(old: Optional[AuditReport], new: AuditReport) -> FindingsDiff:
+    """Findings that appeared or disappeared between two audits of the same file."""
+    before = Counter(_finding_key(i) for i in old.issues) if old is not None else Counter()
+    after = Counter(_finding_key(i) for i in new.issues)
+    added_keys = after - before
+    resolved_keys = before - after
+    added = []
+    for i in new.issues:
+        k = _finding_key(i)
+        if added_keys[k] > 0:
+            added_keys[k] -= 1
+            added.append(i)
+    resolved = []
+    for i in old.issues if old is not None else ():
+        k = _finding_key(i)
+        if resolved_keys[k] > 0:
+            resolved_keys[k] -= 1
+            resolved.append(i)
+    return FindingsDiff(filename=new.filename, report=new, added=added, resolved=resolved)
+
+
+class _InotifyWaker:
+    """Sleep until a watched directory reports a change (Linux inotify via ctypes).
+
+    Only used to wake up early; what changed is still decided by stat polling.
+    """
+
+    # IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _MASK = 0x2 | 0x8 | 0x80 | 0x100 | 0x200
+
+    def __init__(self, dirs: Iterable[Path]):
+        import ctypes
+
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:  # pragma: no cover - inotify limits exhausted
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+        for d in set(dirs):
+            libc.inotify_add_watch(fd, os.fsencode(str(d)), self._MASK)
+
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _make_waker(dirs: Iterable[Path]) -> Optional[_InotifyWaker]:
+    if not sys.platform.startswith("linux"):  # pragma: no cover
+        return None
+    try:
+        return _InotifyWaker(dirs)
+    except (OSError, AttributeError):  # pragma: no cover - no inotify in this libc
+        return None
+
+
+class Watcher:
+    """Re-audit files whose mtime/size changed and report the difference in findings.
+
+    The engine stays warm between polls. A file whose stat changed but whose
+    content did not (touch, editor save without edits) keeps its last report
+    and is not parsed again.
+    """
+
+    def __init__(self, engine: AuditEngine, paths: Iterable[Path], *, interval: float = 0.5):
+        self.engine = engine
+        self.paths = list(paths)
+        self.interval = interval
+        self._stats: Dict[Path, Optional[Fingerprint]] = {}
+        self._contents: Dict[Path, str] = {}
+        self._reports: Dict[Path, AuditReport] = {}
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Optional[Fingerprint]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def poll(self) -> List[FindingsDiff]:
+        """Check every path once; return diffs for files whose findings changed."""
+        diffs: List[FindingsDiff] = []
+        for path in self.paths:
+            fp = self._fingerprint(path)
+            if path in self._stats and self._stats[path] == fp:
+                continue
+            self._stats[path] = fp
+            if fp is None:
+                continue  # deleted or mid-save; picked up again once it reappears
+            try:
+                content = path.read_text(encoding="utf-8")
+            except OSError:  # pragma: no cover - vanished between stat and read
+                continue
+            previous = self._reports.get(path)
+            if previous is not None and self._contents.get(path) == content:
+                continue
+            report = self.engine.audit_content(filename=str(path), content=content)
+            self._contents[path] = content
+            self._reports[path] = report
+            diff = diff_reports(previous, report)
+            if previous is None or diff.added or diff.resolved:
+                diffs.append(diff)
+        return diffs
+
+    def run(
+        self, emit: Callable[[FindingsDiff], None], *, max_cycles: Optional[int] = None
+    ) -> None:
+        waker = _make_waker(p.parent for p in self.paths)
+        cycles = 0
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                for diff in self.poll():
+                    emit(diff)
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                if waker is not None:
+                    waker.wait(self.interval)
+                else:  # pragma: no cover
+                    time.sleep(self.interval)
+        finally:
+            if waker is not None:
+                waker.close()
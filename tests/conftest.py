@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
+from typing import Any, Callable, List
 
 import pytest
 
@@ -8,3 +10,48 @@ import pytest
 @pytest.fixture()
 def fixtures_dir() -> Path:
     return Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture()
+def worker_state(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """Isolate ``parallel._ENGINE`` for tests that run worker entry points in-process.
+
+    ``multiprocessing.util.Finalize`` is replaced so no exit-time rule stats
+    save is registered; the returned list collects the callbacks instead.
+    """
+    from readme_auditor import parallel
+
+    registered: List[Any] = []
+    monkeypatch.setattr(parallel, "_ENGINE", None)
+    monkeypatch.setattr(
+        "multiprocessing.util.Finalize", lambda obj, callback, **kw: registered.append(callback)
+    )
+    return registered
+
+
+def git(repo: Path, *args: str) -> str:
+    """Run git in ``repo`` with a throwaway identity and return its stripped stdout."""
+    cmd = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com", *args]
+    return subprocess.run(cmd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture()
+def tmp_corpus(tmp_path: Path) -> Callable[..., List[Path]]:
+    """Factory for ``count`` small READMEs under ``root`` (default: ``tmp_path``).
+
+    Each one is ``pkgNN/README.md``, or ``pkgNN.md`` directly in ``root`` with
+    ``flat=True``. Even-numbered documents have a vague claim, odd-numbered
+    ones a usage example, so reports differ from file to file.
+    """
+
+    def make(count: int, root: Path = tmp_path, *, flat: bool = False) -> List[Path]:
+        paths = []
+        for idx in range(count):
+            p = root / f"pkg{idx:02d}.md" if flat else root / f"pkg{idx:02d}" / "README.md"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            body = "A fast tool.\n" if idx % 2 == 0 else "## Usage\n\n```bash\nx\n```\n"
+            p.write_text(f"# Pkg {idx}\n\n{body}", encoding="utf-8")
+            paths.append(p)
+        return paths
+
+    return make
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+import zipfile
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+import pytest
+
+from readme_auditor.archives import ArchiveError, is_archive, iter_archive, long_description
+from readme_auditor.cli import app
+
+runner = CliRunner()
+
+README = "# Pkg\n\nA fast tool.\n"
+PKG_INFO = "Metadata-Version: 2.1\nName: pkg\nDescription-Content-Type: text/markdown\n\n# Pkg\n\nIt never crashes.\n"
+FOLDED = (
+    "Metadata-Version: 2.0\nName: pkg\nDescription-Content-Type: text/markdown; charset=UTF-8\n"
+    "Description: # Pkg\n        |\n        |A simple tool.\n        \n"
+)
+
+
+def _sdist(path: Path) -> Path:
+    with tarfile.open(path, "w:gz") as tf:
+        for name, text in {
+            "pkg-1.0/README.md": README,
+            "pkg-1.0/PKG-INFO": PKG_INFO,
+            "pkg-1.0/pkg.egg-info/PKG-INFO": PKG_INFO,
+            "pkg-1.0/docs/guide.md": "# Guide\n",
+            "pkg-1.0/setup.py": "",
+        }.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+        tf.addfile(_dir("pkg-1.0/notes.md"))
+    return path
+
+
+def _dir(name: str) -> tarfile.TarInfo:
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.DIRTYPE
+    return info
+
+
+def _wheel(path: Path, metadata: str) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("pkg/__init__.py", "")
+        zf.writestr("pkg/", "")
+        zf.writestr("pkg-1.0.dist-info/METADATA", metadata)
+    return path
+
+
+def test_iter_archive_reads_readmes_markdown_and_long_description(tmp_path: Path):
+    sdist = _sdist(tmp_path / "pkg-1.0.tar.gz")
+    names = [name for name, _ in iter_archive(sdist)]
+    assert names == [
+        f"{sdist}!/pkg-1.0/README.md",
+        f"{sdist}!/pkg-1.0/PKG-INFO",
+        f"{sdist}!/pkg-1.0/docs/guide.md",
+    ]
+    assert dict(iter_archive(sdist))[f"{sdist}!/pkg-1.0/PKG-INFO"] == "# Pkg\n\nIt never crashes.\n"
+
+    wheel = _wheel(tmp_path / "pkg-1.0-py3-none-any.whl", FOLDED)
+    assert list(iter_archive(wheel)) == [
+        (f"{wheel}!/pkg-1.0.dist-info/METADATA", "# Pkg\n\nA simple tool.\n\n")
+    ]
+
+
+def test_long_description_needs_markdown_content_type():
+    assert long_description("Metadata-Version: 2.1\nName: x\n\nSome reST\n") is None
+    assert (
+        long_description("Metadata-Version: 2.1\nDescription-Content-Type: text/markdown\n\n")
+        is None
+    )
+    assert is_archive(Path("a/B-1.0.TAR.GZ")) and not is_archive(Path("README.md"))
+
+
+def test_cli_audits_archives_in_a_directory(tmp_path: Path):
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    (mirror / "README.md").write_text(README, encoding="utf-8")
+    _sdist(mirror / "pkg-1.0.tar.gz")
+    _wheel(mirror / "pkg-1.0-py3-none-any.whl", PKG_INFO)
+    (mirror / "sub").mkdir()
+    _wheel(mirror / "sub" / "other-2.0-py3-none-any.whl", FOLDED)
+
+    result = runner.invoke(app, [str(mirror), "--archives", "--format", "ndjson", "--jobs", "2"])
+    names = [json.loads(line)["filename"] for line in result.stdout.splitlines()[:-1]]
+    assert names[0] == str(mirror / "README.md")
+    assert f"{mirror / 'pkg-1.0.tar.gz'}!/pkg-1.0/README.md" in names
+    assert f"{mirror / 'pkg-1.0-py3-none-any.whl'}!/pkg-1.0.dist-info/METADATA" in names
+    assert len(names) == 5
+
+    result = runner.invoke(app, [str(mirror), "--recursive", "--archives", "--format", "ndjson"])
+    names = [json.loads(line)["filename"] for line in result.stdout.splitlines()[:-1]]
+    assert (
+        names[-1] == f"{mirror / 'sub' / 'other-2.0-py3-none-any.whl'}!/pkg-1.0.dist-info/METADATA"
+    )
+
+    result = runner.invoke(app, [str(mirror / "pkg-1.0.tar.gz"), "--format", "ndjson"])
+    assert len(result.stdout.splitlines()) == 4
+
+
+def test_damaged_archives_raise_archive_error_after_readable_members(tmp_path: Path):
+    wheel = _wheel(tmp_path / "pkg-1.0-py3-none-any.whl", PKG_INFO)
+    data = bytearray(wheel.read_bytes())
+    start = data.index(b"Metadata-Version")
+    data[start : start + 8] = b"XXXXXXXX"  # member bytes no longer match their CRC
+    wheel.write_bytes(bytes(data))
+    with pytest.raises(ArchiveError, match="cannot read"):
+        list(iter_archive(wheel))
+
+    sdist = _sdist(tmp_path / "pkg-1.0.tar.gz")
+    truncated = tmp_path / "cut-1.0.tar.gz"
+    truncated.write_bytes(sdist.read_bytes()[:-40])
+    with pytest.raises(ArchiveError):
+        list(iter_archive(truncated))
+
+
+def test_cli_warns_about_a_corrupt_archive_and_audits_the_rest(tmp_path: Path):
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    good = _sdist(mirror / "pkg-1.0.tar.gz")
+    (mirror / "bad-1.0.tar.gz").write_bytes(good.read_bytes()[:100])
+    (mirror / "junk-1.0-py3-none-any.whl").write_bytes(b"not a zip")
+
+    result = runner.invoke(app, [str(mirror), "--archives", "--format", "ndjson", "--jobs", "1"])
+    names = [json.loads(line)["filename"] for line in result.stdout.splitlines()[:-1]]
+    assert names == [name for name, _ in iter_archive(good)]
+    assert "bad-1.0.tar.gz" in result.stderr and "junk-1.0-py3-none-any.whl" in result.stderr
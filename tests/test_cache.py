@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+import readme_auditor.engine as engine_mod
+from readme_auditor.cache import ResultCache
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.models import Config, Issue, RuleConfig
+
+runner = CliRunner()
+
+CONTENT = "# T\n\nA fast tool that never crashes.\n"
+
+
+def test_cache_hit_skips_parsing_and_rules(tmp_path: Path, monkeypatch):
+    cache = ResultCache(tmp_path / "c")
+    first = AuditEngine(Config(), cache=cache).audit_content(filename="a.md", content=CONTENT)
+
+    def _boom(content: str) -> dict:
+        raise AssertionError("parse_markdown should not run on a cache hit")
+
+    monkeypatch.setattr(engine_mod, "parse_markdown", _boom)
+    second = AuditEngine(Config(), cache=cache).audit_content(filename="b.md", content=CONTENT)
+    assert [(i.rule_id, i.line, i.text) for i in second.issues] == [
+        (i.rule_id, i.line, i.text) for i in first.issues
+    ]
+    assert all(i.filename == "b.md" for i in second.issues)
+    assert second.passed == first.passed
+
+
+def test_cache_key_depends_on_effective_config(tmp_path: Path):
+    cache = ResultCache(tmp_path / "c")
+    base = AuditEngine(Config(), cache=cache)
+    cfg = Config()
+    cfg.rules["vague_claims"] = RuleConfig(enabled=False)
+    other = AuditEngine(cfg, cache=cache)
+    assert base._digest != other._digest
+    base.audit_content(filename="a.md", content=CONTENT)
+    report = other.audit_content(filename="a.md", content=CONTENT)
+    assert all(i.rule_id != "vague_claims" for i in report.issues)
+
+
+def test_cache_ignores_corrupt_entries(tmp_path: Path):
+    cache = ResultCache(tmp_path / "c")
+    key = cache.key(CONTENT, "d")
+    path = cache._path(key)
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert cache.get(key) is None
+    cache.put(
+        key,
+        [Issue(rule_id="r", severity="info", line=1, text="t", explanation="e", suggestion="s")],
+    )
+    assert cache.get(key)[0].rule_id == "r"
+
+
+def test_cache_prune_evicts_least_recently_used(tmp_path: Path):
+    cache = ResultCache(tmp_path / "c", max_bytes=10**9)
+    keys = [cache.key(f"doc {n}", "d") for n in range(6)]
+    for n, key in enumerate(keys):
+        cache.put(key, [])
+        os.utime(cache._path(key), (n, n))
+    entry = cache._path(keys[0]).stat().st_size
+    (cache.root / "stray-file").write_text("x", encoding="utf-8")
+
+    cache.max_bytes = entry * 4
+    cache.prune()
+    assert cache.size() <= entry * 4
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) == []
+
+    cache.max_bytes = 1
+    cache.put(cache.key("new", "d"), [])
+    assert cache.size() == 0
+
+
+def test_cache_tolerates_unwritable_root(tmp_path: Path):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    cache = ResultCache(blocker)
+    cache.put(cache.key(CONTENT, "d"), [])
+    assert cache.get(cache.key(CONTENT, "d")) is None
+    assert cache.size() == 0
+
+
+def test_cli_cache_flag_populates_cache_dir(tmp_path: Path, fixtures_dir: Path):
+    cache_dir = tmp_path / "cache"
+    args = [str(fixtures_dir / "good_readme.md"), "--cache", "--cache-dir", str(cache_dir)]
+    first = runner.invoke(app, args)
+    second = runner.invoke(app, args)
+    assert first.exit_code == second.exit_code == 0
+    assert any(cache_dir.rglob("*.json"))
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from readme_auditor import daemon
+from readme_auditor.cli import app
+from readme_auditor.config import config_from_dict, config_to_dict
+from readme_auditor.daemon import (
+    DaemonClient,
+    DaemonError,
+    audit_paths_via_daemon,
+    make_server,
+    parse_address,
+)
+from readme_auditor.engine import AuditEngine
+from readme_auditor.models import AuditReport, Config, RuleConfig
+
+runner = CliRunner()
+
+CONTENT = "# T\n\nA fast tool that never crashes.\n"
+
+
+@pytest.fixture()
+def running_server():
+    servers = []
+
+    def start(address: str = "127.0.0.1:0"):
+        server = make_server(address, Config())
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append(server)
+        addr = server.server_address
+        return f"unix:{addr}" if isinstance(addr, str) else f"{addr[0]}:{addr[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_parse_address_forms():
+    assert parse_address("unix:/tmp/a.sock") == "/tmp/a.sock"
+    assert parse_address("localhost:9000") == ("localhost", 9000)
+    assert parse_address("9000") == ("127.0.0.1", 9000)
+
+
+def test_bad_daemon_address_is_a_usage_error(fixtures_dir: Path):
+    with pytest.raises(ValueError, match="host:port"):
+        parse_address("localhost")
+    result = runner.invoke(app, [str(fixtures_dir / "good_readme.md"), "--daemon", "localhost"])
+    assert result.exit_code == 2
+    assert "host:port" in result.output
+
+
+def test_config_dict_round_trip():
+    cfg = Config(severity_threshold="info", max_issues=7, fail_on="warning")
+    cfg.rules["vague_claims"] = RuleConfig(
+        enabled=True, severity="error", options={"custom_adjectives": ["blazing"]}
+    )
+    cfg.rules["no_examples"] = RuleConfig(enabled=False)
+    assert config_from_dict(config_to_dict(cfg)) == cfg
+
+
+def test_daemon_round_trip_matches_in_process(running_server):
+    address = running_server()
+    cfg = Config()
+    cfg.rules["vague_claims"] = RuleConfig(enabled=False)
+    client = DaemonClient(address)
+    try:
+        remote = client.audit(filename="a.md", content=CONTENT, config=config_to_dict(cfg))
+        again = client.audit(filename="b.md", content=CONTENT)
+    finally:
+        client.close()
+    local = AuditEngine(cfg).audit_content(filename="a.md", content=CONTENT)
+    assert isinstance(remote, AuditReport)
+    assert [(i.rule_id, i.line, i.filename) for i in remote.issues] == [
+        (i.rule_id, i.line, i.filename) for i in local.issues
+    ]
+    assert any(i.rule_id == "vague_claims" for i in again.issues)
+
+
+def test_daemon_reports_bad_requests(running_server):
+    address = running_server()
+    host, port = parse_address(address)
+    with socket.create_connection((host, port)) as sock:
+        sock.sendall(b"\n{not json}\n")
+        assert b"error" in sock.makefile("rb").readline()
+    client = DaemonClient(address)
+    with pytest.raises(DaemonError):
+        client.audit(
+            filename="a.md", content=CONTENT, config={"general": {"severity_threshold": "fatal"}}
+        )
+    client.close()
+
+
+def test_daemon_over_unix_socket(running_server, tmp_path: Path):
+    sock_path = tmp_path / "auditor.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()  # leaves the socket file behind with nobody listening
+    address = running_server(f"unix:{sock_path}")
+    client = DaemonClient(address)
+    assert client.audit(filename="a.md", content=CONTENT).filename == "a.md"
+    client.close()
+
+    with pytest.raises(FileExistsError, match="already listening"):
+        make_server(address, Config())
+
+
+def test_unix_address_never_replaces_other_files(tmp_path: Path):
+    precious = tmp_path / "precious.txt"
+    precious.write_text("keep me", encoding="utf-8")
+    with pytest.raises(FileExistsError, match="not a socket"):
+        make_server(f"unix:{precious}", Config())
+    assert precious.read_text(encoding="utf-8") == "keep me"
+
+    result = runner.invoke(app, ["serve", "--address", f"unix:{precious}"])
+    assert result.exit_code == 2
+    assert "not a socket" in result.output
+    assert precious.read_text(encoding="utf-8") == "keep me"
+
+
+def test_engine_pool_evicts_least_recently_used():
+    pool = daemon._EnginePool(Config())
+    first = pool.get({"general": {"max_issues": 1}})
+    for n in range(2, 2 + daemon._MAX_ENGINES):
+        pool.get({"general": {"max_issues": n}})
+    assert pool.get({"general": {"max_issues": 2}}) is not None
+    assert pool.get({"general": {"max_issues": 1}}) is not first
+
+
+def test_falls_back_in_process_when_no_daemon(tmp_path: Path):
+    paths = []
+    for n in range(2):
+        p = tmp_path / f"doc{n}.md"
+        p.write_text(CONTENT, encoding="utf-8")
+        paths.append(p)
+    client = DaemonClient(f"127.0.0.1:{_free_port()}", timeout=1)
+    reports = list(audit_paths_via_daemon(client, AuditEngine(Config()), paths, None))
+    assert [r.filename for r in reports] == [str(p) for p in paths]
+
+
+def test_falls_back_in_process_on_error_replies_and_garbage(running_server, tmp_path: Path):
+    path = tmp_path / "README.md"
+    path.write_text(CONTENT, encoding="utf-8")
+    engine = AuditEngine(Config())
+    expected = engine.audit_file(path).issues
+
+    bad_config = {"general": {"max_issues": "many"}}
+    client = DaemonClient(running_server(), timeout=5)
+    reports = list(audit_paths_via_daemon(client, engine, [path, path], bad_config))
+    assert [r.issues for r in reports] == [expected, expected]
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+
+    def reply_garbage() -> None:
+        conn, _ = listener.accept()
+        conn.recv(65536)
+        conn.sendall(b"<html>not the daemon</html>\n")
+        conn.close()
+
+    thread = threading.Thread(target=reply_garbage, daemon=True)
+    thread.start()
+    reports = list(
+        audit_paths_via_daemon(DaemonClient(f"127.0.0.1:{port}", timeout=5), engine, [path], None)
+    )
+    assert [r.issues for r in reports] == [expected]
+    thread.join()
+    listener.close()
+
+
+def test_client_raises_when_daemon_hangs_up():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+
+    def accept_and_close() -> None:
+        conn, _ = listener.accept()
+        conn.recv(65536)
+        conn.close()
+
+    thread = threading.Thread(target=accept_and_close, daemon=True)
+    thread.start()
+    client = DaemonClient(f"127.0.0.1:{port}", timeout=5)
+    with pytest.raises(ConnectionError):
+        client.audit(filename="a.md", content=CONTENT)
+    thread.join()
+    listener.close()
+
+
+def test_cli_forwards_to_daemon(running_server, fixtures_dir: Path):
+    address = running_server()
+    result = runner.invoke(
+        app, [str(fixtures_dir / "good_readme.md"), "--daemon", address, "--format", "json"]
+    )
+    assert result.exit_code == 0
+    assert '"filename"' in result.stdout
+
+
+def test_cli_serve_command_runs_until_interrupted(monkeypatch):
+    seen = {}
+
+    def fake_serve(address: str, cfg: Config) -> None:
+        seen["address"] = address
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(daemon, "serve", fake_serve)
+    result = runner.invoke(app, ["serve"])
+    assert result.exit_code == 0
+    assert seen["address"] == daemon.DEFAULT_ADDRESS
+
+
+def test_serve_cleans_up_unix_socket(tmp_path: Path, monkeypatch):
+    sock_path = tmp_path / "s.sock"
+
+    def stop(self) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(daemon.socketserver.BaseServer, "serve_forever", stop)
+    with pytest.raises(KeyboardInterrupt):
+        daemon.serve(f"unix:{sock_path}", Config())
+    assert not sock_path.exists()
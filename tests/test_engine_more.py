@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from readme_auditor.engine import AuditEngine
 from readme_auditor.models import Config, RuleConfig
+from readme_auditor.parser import parse_markdown
 
 
 def test_engine_can_disable_rule_via_config():
@@ -22,3 +23,118 @@ def test_engine_max_issues_limits_and_breaks():
     content = "# T\n\nA fast and simple tool.\n"
     report = engine.audit_content(filename="README.md", content=content)
     assert len(report.issues) == 1
+
+
+def test_engine_builds_rule_plan_once():
+    engine = AuditEngine(Config())
+    plan = engine._plan
+    engine.audit_content(filename="a.md", content="# A\n\nA fast tool.\n")
+    engine.audit_content(filename="b.md", content="# B\n\nA simple tool.\n")
+    assert engine._plan is plan
+
+
+def test_engine_rebuilds_plan_when_config_changes():
+    engine = AuditEngine(Config())
+    assert any(r.id == "missing_limitations" for r in engine._plan)
+
+    cfg = Config()
+    cfg.rules["missing_limitations"] = RuleConfig(enabled=False)
+    engine.cfg = cfg
+    assert all(r.id != "missing_limitations" for r in engine._plan)
+
+    cfg.rules["missing_limitations"] = RuleConfig(enabled=True, severity="error")
+    engine.reload()
+    rule = next(r for r in engine._plan if r.id == "missing_limitations")
+    assert rule.severity == "error"
+
+
+def test_engine_shared_line_scan_matches_direct_rule_checks(fixtures_dir):
+    cfg = Config()
+    cfg.severity_threshold = "info"
+    cfg.max_issues = 1000
+    engine = AuditEngine(cfg)
+    for path in sorted(fixtures_dir.glob("*.md")):
+        content = path.read_text(encoding="utf-8")
+        report = engine.audit_content(filename=path.name, content=content)
+        expected = []
+        for rule in engine._plan:
+            expected.extend(
+                (i.rule_id, i.line, i.text) for i in rule.check(content, parse_markdown(content))
+            )
+        assert [(i.rule_id, i.line, i.text) for i in report.issues] == expected
+
+
+def test_issues_are_compact_and_share_rule_text(tmp_path):
+    import pickle
+    import sys
+
+    import pytest
+
+    from readme_auditor.cache import ResultCache
+    from readme_auditor.models import Issue
+
+    content = "# A\n\nA fast tool.\nA FAST path.\n"
+    report = AuditEngine(Config()).audit_content(filename="a.md", content=content)
+    issue = report.issues[0]
+    assert issue.filename == "a.md" and issue.context is None
+    assert pickle.loads(pickle.dumps(issue)) == issue
+    if sys.version_info >= (3, 11):
+        assert not hasattr(issue, "__dict__")
+    with pytest.raises(AttributeError):
+        issue.line = 3  # type: ignore[misc]
+
+    cache = ResultCache(tmp_path / "cache")
+    AuditEngine(Config(), cache=cache).audit_content(filename="a.md", content=content)
+    a = AuditEngine(Config(), cache=cache).audit_content(filename="b.md", content=content)
+    b = AuditEngine(Config(), cache=cache).audit_content(filename="c.md", content=content)
+    assert [i.filename for i in b.issues] == ["c.md"] * len(b.issues)
+    assert all(x.suggestion is y.suggestion for x, y in zip(a.issues, b.issues))
+    assert Issue("r", "info", None, "t", "e", "s", context={"k": "v"}).context == {"k": "v"}
+
+
+def test_rules_below_threshold_are_not_planned():
+    planned = {r.id for r in AuditEngine(Config())._plan}
+    assert not planned & {"assumed_knowledge", "unclear_audience", "no_troubleshooting"}
+    assert "missing_sections" in planned
+
+    cfg = Config()
+    cfg.severity_threshold = "error"
+    cfg.rules["missing_sections"] = RuleConfig(severity="info")
+    # Still planned: it may escalate to "error".
+    assert [r.id for r in AuditEngine(cfg)._plan] == ["missing_sections"]
+
+    cfg = Config()
+    cfg.severity_threshold = "info"
+    assert {"assumed_knowledge", "no_troubleshooting"} <= {r.id for r in AuditEngine(cfg)._plan}
+
+
+def test_max_issues_counts_only_visible_issues():
+    cfg = Config()
+    cfg.max_issues = 1
+    cfg.rules["missing_limitations"] = RuleConfig(enabled=False)
+    cfg.rules["missing_sections"] = RuleConfig(
+        severity="info", options={"required": ["license", "installation"]}
+    )
+    report = AuditEngine(cfg).audit_content(filename="README.md", content="# T\n")
+    assert [(i.rule_id, i.severity, i.text) for i in report.issues] == [
+        ("missing_sections", "error", "Missing section: installation")
+    ]
+
+
+def test_shared_rule_issues_are_never_modified():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from readme_auditor.models import Issue
+
+    shared = Issue("missing_sections", "error", None, "t", "e", "s")
+    engine = AuditEngine(Config())
+    for rule in engine._plan:
+        rule.check = lambda content, context: [shared]  # type: ignore[method-assign]
+
+    names = [f"doc{n}.md" for n in range(200)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        reports = list(pool.map(lambda n: engine.audit_content(filename=n, content="# T\n"), names))
+    assert all({i.filename for i in r.issues} == {r.filename} for r in reports)
+    assert shared.filename is None and hash(shared) == hash(
+        Issue("missing_sections", "error", None, "t", "e", "s")
+    )
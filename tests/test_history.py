@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from readme_auditor import vcs
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.history import audit_history
+from readme_auditor.models import Config
+from readme_auditor.vcs import CatFile, GitError
+
+from .conftest import git
+
+runner = CliRunner()
+
+
+def _commit(repo: Path, name: str, text: str, message: str) -> str:
+    (repo / name).write_text(text, encoding="utf-8")
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    git(root, "init", "-q")
+    _commit(root, "other.txt", "x\n", "start")
+    _commit(root, "README.md", "# A\n\nA fast tool.\n", "add readme")
+    _commit(root, "other.txt", "y\n", "unrelated")
+    _commit(root, "README.md", "# A\n\nA fast tool.\n\nIt never crashes.\n", "claims")
+    return root
+
+
+def test_audit_history_one_record_per_commit_and_blobs_audited_once(repo: Path, monkeypatch):
+    engine = AuditEngine(Config())
+    audited = []
+    original = engine.audit_content
+
+    def counting(*, filename, content):
+        audited.append(content)
+        return original(filename=filename, content=content)
+
+    monkeypatch.setattr(engine, "audit_content", counting)
+    records = list(audit_history(engine, repo, path="./README.md"))
+
+    assert [r.blob is None for r in records] == [True, False, False, False]
+    assert records[1].blob == records[2].blob and records[1].report is records[2].report
+    assert len(audited) == 2
+    assert [i.rule_id for i in records[3].report.issues] == [
+        i.rule_id
+        for i in AuditEngine(Config())
+        .audit_content(filename="README.md", content=audited[1])
+        .issues
+    ]
+    data = records[0].as_json_dict()
+    assert (
+        data["type"] == "commit" and data["report"] is None and data["committed_utc"].endswith("Z")
+    )
+
+
+def test_history_cli_streams_ndjson_for_a_range(repo: Path, tmp_path: Path):
+    first = git(repo, "rev-list", "--max-parents=0", "HEAD")
+    out = tmp_path / "history.ndjson"
+    result = runner.invoke(
+        app, ["history", str(repo), "--rev-range", f"{first}..HEAD", "--output", str(out)]
+    )
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 3
+    assert lines[-1]["report"]["summary"]["total"] >= 2
+
+    result = runner.invoke(app, ["history", str(repo)])
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 4
+
+
+def test_history_cli_reports_git_errors(tmp_path: Path):
+    result = runner.invoke(app, ["history", str(tmp_path)])
+    assert result.exit_code != 0
+    assert "Invalid value" in result.output
+
+
+def test_cat_file_batch_info_skips_contents_and_detects_exit(repo: Path):
+    with CatFile(repo) as cat:
+        oid, kind = cat.info("HEAD:README.md")
+        assert kind == "blob"
+        assert cat.info("HEAD:missing.md") is None
+        assert cat.read("HEAD:missing.md") is None
+        assert cat.read(oid).startswith(b"# A")
+        cat._proc.stdin.close()
+        with pytest.raises(GitError):
+            cat.info("HEAD")
+
+    cat = CatFile(repo, contents=False)
+    real_stdout, cat._proc.stdout = cat._proc.stdout, io.BytesIO(b"")
+    with pytest.raises(GitError):
+        cat.info("HEAD")
+    cat._proc.stdout = real_stdout
+    cat.close()
+
+    cat = CatFile(repo)
+    cat._proc.kill()
+    cat._proc.wait()
+    with pytest.raises(GitError):
+        while True:
+            cat.info("HEAD")
+    cat.close()
+
+
+def test_missing_git_binary_is_a_git_error(repo: Path, monkeypatch):
+    monkeypatch.setattr(vcs, "_command", lambda repo, *args: ["/nonexistent/git", *args])
+    with pytest.raises(GitError):
+        CatFile(repo)
+    with pytest.raises(GitError):
+        list(vcs.rev_list(repo))
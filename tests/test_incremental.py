@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+
+from readme_auditor.engine import AuditEngine
+from readme_auditor.incremental import IncrementalState, _Overlay
+from readme_auditor.models import Config
+
+BASE = (
+    "# Tool\n\nA fast tool.\n\n"
+    "## Installation\n\nJust run make.\n\n"
+    "## Usage\n\nRun it.\n\n"
+    "## Notes\n\nIt never crashes.\nA simple\nfast path.\n"
+)
+
+EDITS = [
+    BASE,
+    BASE.replace("Run it.", "Run it on a fast machine."),
+    "Intro line.\n\n" + BASE,
+    BASE.replace("## Usage\n\nRun it.\n\n", ""),
+    BASE.replace("Just run make.", "Requires Python 3.9. Just run make."),
+    BASE + "\n## Limitations\n\nNone.\n\n## Troubleshooting\n\nA scalable\nfix in 10 ms.\n",
+    BASE.replace("## Notes\n\n", "## Usage\n\n```bash\ntool\n```\n\n## Notes\n\n"),
+    BASE.replace("A simple\nfast path.", "A simple\n3x faster path."),
+    "",
+    BASE,
+]
+
+
+def _issues(report):
+    return [(i.rule_id, i.severity, i.line, i.text) for i in report.issues]
+
+
+def test_incremental_matches_full_audit_across_edits():
+    incremental = AuditEngine(Config(), incremental=True)
+    for content in EDITS:
+        got = incremental.audit_content(filename="README.md", content=content)
+        want = AuditEngine(Config()).audit_content(filename="README.md", content=content)
+        assert _issues(got) == _issues(want)
+
+
+def test_unchanged_sections_reuse_results_and_follow_line_shifts():
+    engine = AuditEngine(Config(), incremental=True)
+    first = engine.audit_content(filename="README.md", content=BASE)
+    with engine.incremental.file("README.md", BASE) as state:
+        state.reused = 0
+
+    shifted = engine.audit_content(filename="README.md", content="Intro.\n\nMore intro.\n\n" + BASE)
+    assert state.reused > 0
+    lines = {(i.rule_id, i.text): i.line for i in first.issues if i.line is not None}
+    for iss in shifted.issues:
+        if iss.line is not None and (iss.rule_id, iss.text) in lines:
+            assert iss.line == lines[(iss.rule_id, iss.text)] + 4
+
+
+def test_duplicate_sections_are_reported_at_their_own_lines():
+    doc = "# T\n\n## A\n\nA fast tool.\n\n## A\n\nA fast tool.\n"
+    engine = AuditEngine(Config(), incremental=True)
+    engine.audit_content(filename="a.md", content=doc)
+    again = engine.audit_content(filename="a.md", content="x\n" + doc)
+    assert [i.line for i in again.issues if i.rule_id == "vague_claims"] == [6, 10]
+
+
+def test_state_is_bounded_and_cleared_on_reload():
+    engine = AuditEngine(Config(), incremental=True)
+    engine.incremental.max_files = 2
+    for name in ("a.md", "b.md", "a.md", "c.md"):
+        engine.audit_content(filename=name, content=BASE)
+    assert len(engine.incremental) == 2
+    with engine.incremental.file("a.md", BASE) as state:
+        assert state.rules
+
+    engine.reload()
+    assert len(engine.incremental) == 0
+    assert AuditEngine(Config()).incremental is None
+
+
+def test_overlay_reads_through_to_base():
+    view = _Overlay({"a": 1, "b": 2}, {"b": 3, "c": 4})
+    assert dict(view) == {"a": 1, "b": 3, "c": 4}
+    assert len(view) == 3
+
+
+def test_state_without_line_hits_falls_back_to_document_scope():
+    from readme_auditor.parser import parse_markdown
+    from readme_auditor.rules.vague_claims import VagueClaimsRule
+
+    rule = VagueClaimsRule()
+    with IncrementalState().file("a.md", BASE) as state:
+        first = state.check(rule, BASE, parse_markdown(BASE))
+        again = state.check(rule, BASE, parse_markdown(BASE))
+    assert again == first and state.reused == 1
+
+
+def test_concurrent_audits_of_one_file_match_a_fresh_audit():
+    engine = AuditEngine(Config(), incremental=True)
+    contents = [EDITS[1], EDITS[5]]
+    want = {
+        c: _issues(AuditEngine(Config()).audit_content(filename="R.md", content=c))
+        for c in contents
+    }
+    mismatches = []
+
+    def worker(offset: int) -> None:
+        for n in range(100):
+            content = contents[(n + offset) % 2]
+            got = engine.audit_content(filename="R.md", content=content)
+            if _issues(got) != want[content]:
+                mismatches.append(content)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert mismatches == []
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from readme_auditor import parallel
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.journal import Journal
+from readme_auditor.models import Config
+
+runner = CliRunner()
+
+
+def test_journal_reuses_matching_content_and_survives_a_torn_line(tmp_path: Path):
+    log = tmp_path / "run.journal"
+    report = AuditEngine(Config()).audit_content(filename="a.md", content="# A\n")
+    with Journal(log) as journal:
+        journal.record("a.md", Journal.digest("# A\n"), report)
+    with log.open("a", encoding="utf-8") as fh:
+        fh.write('{"path": "b.md", "sha')
+
+    with Journal(log, resume=True) as journal:
+        assert len(journal) == 1
+        assert journal.lookup("a.md", Journal.digest("# A\n")).issues == report.issues
+        assert journal.lookup("a.md", Journal.digest("# A changed\n")) is None
+        assert journal.lookup("b.md", "x") is None
+        journal.record("c.md", "0" * 64, report)
+    with Journal(log, resume=True) as journal:
+        assert len(journal) == 2
+
+    with Journal(log) as journal:
+        assert len(journal) == 0
+    assert log.read_text(encoding="utf-8") == ""
+    with Journal(tmp_path / "new.journal", resume=True) as journal:
+        assert len(journal) == 0
+
+
+def test_audit_paths_skips_journaled_files(tmp_path: Path, monkeypatch, tmp_corpus):
+    paths = tmp_corpus(6, tmp_path / "c")
+    engine = AuditEngine(Config())
+    log = tmp_path / "run.journal"
+    with Journal(log) as journal:
+        first = list(parallel.audit_paths(engine, paths[:3], readers=1, journal=journal))
+    paths[1].write_text("# P1\n\nChanged.\n", encoding="utf-8")
+
+    audited = []
+    original = engine.audit_prefetched
+
+    def counting(filename, content, seconds=0.0):
+        audited.append(filename)
+        return original(filename, content, seconds)
+
+    monkeypatch.setattr(engine, "audit_prefetched", counting)
+    with Journal(log, resume=True) as journal:
+        again = list(parallel.audit_paths(engine, paths, readers=1, journal=journal))
+    assert audited == [str(paths[i]) for i in (1, 3, 4, 5)]
+    assert again[0].issues == first[0].issues
+    assert [r.filename for r in again] == [str(p) for p in paths]
+
+    with Journal(log, resume=True) as journal:
+        pooled = list(parallel.audit_paths(engine, paths, jobs=2, journal=journal))
+    assert [r.issues for r in pooled] == [r.issues for r in again]
+
+    with Journal(tmp_path / "fresh.journal") as journal:
+        pooled = list(parallel.audit_paths(engine, paths, jobs=2, journal=journal))
+    assert len(Journal._load(tmp_path / "fresh.journal")[0]) == 6
+
+
+def test_cli_resume_produces_the_same_summary(tmp_path: Path, tmp_corpus):
+    root = tmp_path / "corpus"
+    tmp_corpus(5, root)
+    log = tmp_path / "run.journal"
+    full = runner.invoke(
+        app, [str(root), "-r", "--format", "ndjson", "--journal", str(log), "--jobs", "1"]
+    )
+    lines = log.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+    log.write_text("\n".join(lines[:2]) + "\n", encoding="utf-8")
+
+    resumed = runner.invoke(
+        app, [str(root), "-r", "--format", "ndjson", "--journal", str(log), "--resume"]
+    )
+    assert json.loads(resumed.stdout.splitlines()[-1]) == json.loads(full.stdout.splitlines()[-1])
+    assert resumed.exit_code == full.exit_code
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 5
+
+
+def test_cli_resume_ignores_entries_made_with_other_settings(tmp_path: Path, fixtures_dir: Path):
+    root = tmp_path / "corpus"
+    for idx in range(3):
+        (root / f"p{idx}").mkdir(parents=True)
+        (root / f"p{idx}" / "README.md").write_text(
+            (fixtures_dir / "good_readme.md").read_text(encoding="utf-8"), encoding="utf-8"
+        )
+    log = tmp_path / "run.journal"
+    lenient = runner.invoke(
+        app, [str(root), "-r", "--journal", str(log), "--fail-on", "error", "--format", "json"]
+    )
+    strict = [
+        str(root),
+        "-r",
+        "--journal",
+        str(log),
+        "--resume",
+        "--fail-on",
+        "warning",
+        "--format",
+        "json",
+    ]
+    resumed = runner.invoke(app, strict)
+    fresh = runner.invoke(app, [str(root), "-r", "--fail-on", "warning", "--format", "json"])
+    assert lenient.exit_code == 0 and resumed.exit_code == fresh.exit_code == 1
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 6
+
+    with Journal(log, resume=True, settings="other") as journal:
+        assert len(journal) == 0
+
+
+def test_cli_journal_option_validation(tmp_path: Path):
+    (tmp_path / "README.md").write_text("# A\n", encoding="utf-8")
+    assert runner.invoke(app, [str(tmp_path), "--resume"]).exit_code == 2
+    result = runner.invoke(app, [str(tmp_path), "--journal", str(tmp_path / "j"), "--watch"])
+    assert result.exit_code == 2
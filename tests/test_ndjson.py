@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine, merge_summaries
+from readme_auditor.formatters import NdjsonFormatter
+from readme_auditor.models import AuditSummary, Config
+
+runner = CliRunner()
+
+
+def test_merge_summaries_adds_counts():
+    a = AuditSummary(total=3, errors=1, warnings=1, info=1)
+    b = AuditSummary(total=2, errors=0, warnings=2, info=0)
+    assert merge_summaries([a, b]).as_dict() == {"total": 5, "errors": 1, "warnings": 3, "info": 1}
+
+
+def test_cli_ndjson_stdout_one_record_per_line(fixtures_dir: Path):
+    result = runner.invoke(
+        app, [str(fixtures_dir / "vague_readme.md"), "--format", "ndjson", "--fail-on", "warning"]
+    )
+    assert result.exit_code == 1
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["type"] for r in records] == ["report", "summary"]
+    assert records[1]["files"] == 1
+    assert records[1]["passed"] is False
+    assert records[1]["summary"] == records[0]["summary"]
+
+
+def test_cli_ndjson_output_file_streams_all_reports(fixtures_dir: Path, tmp_path: Path):
+    out = tmp_path / "report.ndjson"
+    result = runner.invoke(
+        app, [str(fixtures_dir), "--format", "ndjson", "--jobs", "1", "--output", str(out)]
+    )
+    assert result.stdout == ""
+    lines = out.read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    reports = [r for r in records if r["type"] == "report"]
+    assert len(reports) == len(list(fixtures_dir.glob("*.md")))
+    assert records[-1]["type"] == "summary"
+    assert records[-1]["summary"]["total"] == sum(r["summary"]["total"] for r in reports)
+    assert result.exit_code == (0 if records[-1]["passed"] else 1)
+
+
+def test_ndjson_formatter_print_is_single_line(capsys):
+    report = AuditEngine(Config()).audit_content(filename="a.md", content="# A\n\nA fast tool.\n")
+    NdjsonFormatter().print(report)
+    out = capsys.readouterr().out
+    assert out.count("\n") == 1
+    assert json.loads(out)["filename"] == "a.md"
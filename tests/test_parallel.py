@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from readme_auditor import parallel
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.models import Config
+
+runner = CliRunner()
+
+
+def test_audit_paths_pool_preserves_input_order(tmp_path: Path, tmp_corpus):
+    paths = tmp_corpus(12, tmp_path / "docs", flat=True)
+    engine = AuditEngine(Config())
+    serial = list(parallel.audit_paths(engine, paths, jobs=1))
+    pooled = list(parallel.audit_paths(engine, iter(paths), jobs=2))
+    assert [r.filename for r in pooled] == [str(p) for p in paths]
+    assert [r.issues for r in pooled] == [r.issues for r in serial]
+
+
+def test_worker_entry_points_use_warm_engine(tmp_path: Path, tmp_corpus, worker_state):
+    (p,) = tmp_corpus(1, tmp_path / "one", flat=True)
+    parallel._init_worker(Config())
+    engine = parallel._ENGINE
+    report = parallel._audit_prefetched(str(p), p.read_text(encoding="utf-8"), 0.0)
+    assert parallel._ENGINE is engine
+    assert report.filename == str(p)
+
+
+def test_cli_jobs_combines_exit_code_in_order(tmp_path: Path, tmp_corpus):
+    d = tmp_path / "proj"
+    paths = tmp_corpus(4, d, flat=True)
+    result = runner.invoke(app, [str(d), "--jobs", "2", "--format", "json", "--fail-on", "warning"])
+    assert result.exit_code == 1
+    order = [result.stdout.index(str(p)) for p in paths]
+    assert order == sorted(order)
+
+
+def test_audit_paths_async_yields_every_report(tmp_path: Path, tmp_corpus):
+    import asyncio
+
+    paths = tmp_corpus(6, tmp_path / "docs", flat=True)
+    engine = AuditEngine(Config())
+
+    async def collect(**kwargs):
+        return [r async for r in engine.audit_paths_async(iter(paths), **kwargs)]
+
+    reports = asyncio.run(collect(max_in_flight=2))
+    assert sorted(r.filename for r in reports) == sorted(str(p) for p in paths)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        pooled = asyncio.run(collect(executor=pool))
+    by_name = {r.filename: r.issues for r in reports}
+    assert {r.filename: r.issues for r in pooled} == by_name
+
+
+def test_audit_paths_async_cancels_pending_when_closed_early(tmp_path: Path, tmp_corpus):
+    import asyncio
+    import time
+
+    paths = tmp_corpus(6, tmp_path / "docs", flat=True)
+    engine = AuditEngine(Config())
+    audit_file = engine.audit_file
+
+    def slow_after_first(path):
+        if path != paths[0]:
+            time.sleep(0.2)
+        return audit_file(path)
+
+    engine.audit_file = slow_after_first  # type: ignore[method-assign]
+
+    async def first():
+        agen = engine.audit_paths_async(paths, max_in_flight=3)
+        report = await agen.__anext__()
+        await agen.aclose()
+        return report
+
+    assert asyncio.run(first()).filename == str(paths[0])
+
+
+def test_content_worker_rebuilds_engine_only_for_new_config(worker_state):
+    parallel._audit_content(Config(), None, False, "a.md", "# A\n")
+    engine = parallel._ENGINE
+    parallel._audit_content(Config(), None, False, "b.md", "# B\n")
+    assert parallel._ENGINE is engine
+    cfg = Config()
+    cfg.max_issues = 3
+    report = parallel._audit_content(cfg, None, False, "c.md", "# C\n")
+    assert parallel._ENGINE is not engine and report.filename == "c.md"
+
+
+def test_prefetch_reads_ahead_in_input_order(tmp_path: Path, tmp_corpus):
+    paths = tmp_corpus(10, tmp_path / "docs", flat=True)
+    got = list(parallel.prefetch(iter(paths), readers=3, depth=2))
+    assert [name for name, _, _ in got] == [str(p) for p in paths]
+    assert all(content == Path(name).read_text(encoding="utf-8") for name, content, _ in got)
+
+    reader = parallel.prefetch(paths, readers=3, depth=4)
+    next(reader)
+    reader.close()
+
+
+def test_audit_paths_records_prefetch_read_time(tmp_path: Path, tmp_corpus):
+    paths = tmp_corpus(3, tmp_path / "docs", flat=True)
+    reports = list(parallel.audit_paths(AuditEngine(Config(), profile=True), paths, readers=2))
+    assert all(r.timings["read"]["calls"] == 1 for r in reports)
+
+
+def test_write_in_order_emits_on_one_thread_and_reraises(tmp_path: Path):
+    import threading
+
+    seen: list[tuple[int, str]] = []
+
+    def emit(report):
+        seen.append((report, threading.current_thread().name))
+
+    parallel.write_in_order(iter(range(50)), emit, depth=4)  # type: ignore[arg-type]
+    assert [r for r, _ in seen] == list(range(50))
+    assert {name for _, name in seen} == {"readme-auditor-write"}
+
+    def boom(report):
+        raise ValueError(report)
+
+    with pytest.raises(ValueError, match="0"):
+        parallel.write_in_order(iter(range(50)), boom, depth=1)  # type: ignore[arg-type]
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from readme_auditor.parser import find_section, iter_sections, parse_markdown
+import pytest
+
+from readme_auditor.parser import (
+    CodeBlockIndex,
+    code_index_of,
+    find_section,
+    iter_sections,
+    parse_markdown,
+)
 
 
 def test_find_section_returns_none_when_missing():
@@ -21,3 +29,81 @@ def test_find_section_respects_min_level():
     ctx = parse_markdown("# T\n\n## Installation\n\nText\n\n### Deep\n\nText\n")
     # min_level=3 should skip the level-2 Installation heading
     assert find_section(ctx, ["installation"], min_level=3) is None
+
+
+def test_parsed_document_views_are_lazy_and_memoized():
+    doc = parse_markdown("# T\n\nSee [docs](https://example.com).\n\n## A\n\n```bash\nx\n```\n")
+    assert doc._tokens is None
+    assert doc["lines"][0] == "# T"
+    assert doc._tokens is None  # lines do not need the token stream
+    assert doc["lowered"].startswith("# t")
+    assert doc["headings"] is doc.headings
+    assert doc.code_blocks[0].start_line == 7
+    assert [(link.href, link.line) for link in doc.links] == [("https://example.com", 3)]
+    assert not hasattr(doc, "__dict__")
+
+
+def test_parsed_document_mapping_interface():
+    doc = parse_markdown("")
+    assert doc.get("missing") is None
+    assert doc["section_ranges"] == []
+    doc["line_hits"] = {}
+    assert doc["line_hits"] == {}
+    assert list(doc)[-1] == "line_hits"
+    assert len(doc) == len(doc.VIEWS) + 1
+    with pytest.raises(KeyError):
+        doc["lines"] = []
+
+
+def test_section_index_matches_linear_scan():
+    doc = parse_markdown(
+        "# T\n\n## Quick Setup\n\nx\n\n### Usage notes\n\nx\n\n## Installation\n\nx\n\n## API reference\n\nx\n"
+    )
+    plain = {"section_ranges": doc["section_ranges"]}
+    queries = [
+        ["installation", "setup"],
+        ["usage"],
+        ["api", "reference"],
+        ["missing"],
+        ["notes"],
+        [""],
+    ]
+    for keywords in queries:
+        for min_level in (2, 3):
+            assert find_section(doc, keywords, min_level=min_level) == find_section(
+                plain, keywords, min_level=min_level
+            )
+    index = doc["section_index"]
+    assert index.normalized[0] == "quick setup"
+    assert index.has("usage") and not index.has("usage", min_level=4)
+    assert index.first("usage") == index.first("usage")
+
+
+def test_section_index_empty_document():
+    doc = parse_markdown("no headings\n")
+    assert doc["section_index"].first("") is None
+    assert find_section(doc, ["installation"]) is None
+
+
+def test_code_index_range_and_line_queries():
+    md = "# T\n\n```\na\n```\n\ntext\n\n- item\n\n  ```py\n  b\n  ```\n\n```\nc\n```\n"
+    doc = parse_markdown(md)
+    blocks = doc["code_blocks"]
+    index = doc["code_index"]
+    for a in range(0, 20):
+        for b in range(a, 20):
+            expected = [cb for cb in blocks if cb.start_line >= a and cb.end_line <= b]
+            assert index.within(a, b) == expected
+            assert index.any_within(a, b) == bool(expected)
+    for line in range(0, 20):
+        expected = next((cb for cb in blocks if cb.start_line <= line <= cb.end_line), None)
+        assert index.block_at(line) == expected
+        assert index.in_fence(line) == (expected is not None)
+
+
+def test_code_index_of_parsed_and_plain_contexts():
+    doc = parse_markdown("# T\n\n```bash\nx\n```\n")
+    assert code_index_of(doc) is doc.code_index and code_index_of(doc).any_within(1, 5)
+    plain = code_index_of({"code_blocks": doc.code_blocks})
+    assert isinstance(plain, CodeBlockIndex) and plain.any_within(1, 5)
+    assert not code_index_of({}).any_within(1, 5)
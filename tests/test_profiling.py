@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.models import Config
+from readme_auditor.profiling import NULL_TIMER, PhaseTimer, Profiler
+
+runner = CliRunner()
+
+
+def test_engine_records_per_phase_timings(fixtures_dir: Path):
+    engine = AuditEngine(Config(), profile=True)
+    report = engine.audit_file(fixtures_dir / "vague_readme.md")
+    phases = set(report.timings or {})
+    assert {"read", "parse", "scan", "filter", "rule:vague_claims"} <= phases
+    assert all(entry["calls"] >= 1 for entry in report.timings.values())
+    assert json.loads(json.dumps(report.as_json_dict()))["timings"]["read"]["calls"] == 1
+
+
+def test_engine_without_profile_has_no_timings():
+    report = AuditEngine(Config()).audit_content(filename="a.md", content="# A\n")
+    assert report.timings is None
+    assert "timings" not in report.as_json_dict()
+    with NULL_TIMER("parse"):
+        pass
+    assert NULL_TIMER.timings == {}
+
+
+def test_profiler_aggregates_and_ranks_phases():
+    timer = PhaseTimer()
+    timer.add("parse", 0.5)
+    timer.add("parse", 0.25)
+    profiler = Profiler()
+    profiler.add("parse", 0.75, calls=2, filename="a.md")
+    profiler.add("render", 0.1, filename="b.md")
+    profiler.add("render", 0.3, filename="c.md")
+    assert timer.timings["parse"] == {"seconds": 0.75, "calls": 2}
+    rows = profiler.rows()
+    assert rows[0][:3] == ("parse", 2, 0.75)
+    assert rows[1][0] == "render" and rows[1][-1] == "c.md"
+    assert profiler.table().row_count == 2
+
+
+def test_cli_profile_prints_table_and_json_timings(fixtures_dir: Path):
+    result = runner.invoke(
+        app, [str(fixtures_dir / "good_readme.md"), "--format", "json", "--profile"]
+    )
+    assert result.exit_code == 0
+    assert '"timings"' in result.stdout
+    assert "rule:vague_claims" in result.output
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from readme_auditor import rule_stats
+from readme_auditor.cache import ResultCache
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.models import Config
+from readme_auditor.rule_stats import RULE_STATS_FILE, RuleStats
+
+runner = CliRunner()
+
+NOISY = "# T\n\nA fast, simple and powerful tool. It always works and never fails.\n"
+
+
+def test_order_puts_unmeasured_then_high_yield_rules_first():
+    plan = AuditEngine(Config())._plan
+    stats = RuleStats()
+    for rule in plan:
+        stats.record(rule.id, 0.01, 0)
+    stats.record("vague_claims", 0.01, 5)
+    stats.record("overpromising", 0.002, 1)
+    del stats._totals["unfalsifiable"]
+
+    ordered = [rule.id for _, rule in stats.order(list(enumerate(plan)))]
+    assert ordered[:3] == ["unfalsifiable", "vague_claims", "overpromising"]
+    assert ordered[3:] == [r.id for r in plan if r.id not in ordered[:3]]
+    assert stats.average("vague_claims") == (0.01, 2.5)
+    assert stats.average("nope") is None
+
+
+def test_save_merges_measurements_of_several_processes(tmp_path: Path):
+    path = tmp_path / "cache" / RULE_STATS_FILE
+    a, b = RuleStats(path), RuleStats(path)
+    a.record("vague_claims", 0.5, 2)
+    b.record("vague_claims", 1.5, 0)
+    b.record("overpromising", 1.0, 1)
+    a.save()
+    b.save()
+    b.save()
+
+    merged = RuleStats(path)
+    assert len(merged) == 2
+    assert merged.average("vague_claims") == (1.0, 1.0)
+    assert b.average("vague_claims") == (1.0, 1.0)
+
+    path.write_text("not json", encoding="utf-8")
+    assert len(RuleStats(path)) == 0
+
+
+def _record_and_save(path: Path, times: int) -> None:
+    stats = RuleStats(path)
+    for _ in range(times):
+        stats.record("vague_claims", 0.001, 1)
+        stats.save()
+
+
+def test_concurrent_saves_from_several_processes_lose_nothing(tmp_path: Path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = tmp_path / RULE_STATS_FILE
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_record_and_save, [path] * 4, [25] * 4))
+    assert RuleStats(path)._totals["vague_claims"][0] == 100
+
+
+def test_stats_flush_on_their_own_and_tolerate_unwritable_dirs(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(rule_stats, "FLUSH_EVERY", 2)
+    path = tmp_path / RULE_STATS_FILE
+    stats = RuleStats(path)
+    stats.record("vague_claims", 0.1, 1)
+    assert not path.exists()
+    stats.record("vague_claims", 0.1, 1)
+    assert RuleStats(path).average("vague_claims") == (0.1, 1.0)
+
+    (tmp_path / "file").write_text("", encoding="utf-8")
+    blocked = RuleStats(tmp_path / "file" / RULE_STATS_FILE)
+    blocked.record("vague_claims", 0.1, 1)
+    blocked.save()
+    assert blocked._pending
+
+
+def test_capped_audit_runs_high_yield_rules_first_but_reports_in_rule_order(tmp_path: Path):
+    cfg = Config()
+    cfg.severity_threshold = "info"
+    cache_dir = tmp_path / "cache"
+    baseline = AuditEngine(cfg).audit_content(filename="README.md", content=NOISY)
+
+    engine = AuditEngine(cfg, cache=ResultCache(cache_dir))
+    assert engine.rule_stats is not None
+    first = engine.audit_content(filename="README.md", content=NOISY)
+    assert [i.text for i in first.issues] == [i.text for i in baseline.issues]
+    assert engine.rule_stats.average("vague_claims")[1] > 0  # type: ignore[index]
+
+    cfg.max_issues = 3
+    engine.cfg = cfg
+    calls = []
+    for rule in engine._plan:
+        check = rule.check
+        rule.check = lambda content, context, _id=rule.id, _check=check: (
+            calls.append(_id) or _check(content, context)
+        )  # type: ignore[method-assign]
+    capped = engine.audit_content(filename="README.md", content=NOISY + "\n")
+    assert len(capped.issues) == 3
+    assert len(calls) < len(engine._plan)
+    assert calls[0] in {i.rule_id for i in first.issues}
+    order = [r.id for r in engine._plan]
+    assert [order.index(i.rule_id) for i in capped.issues] == sorted(
+        order.index(i.rule_id) for i in capped.issues
+    )
+
+
+def test_learned_order_never_decides_whether_a_capped_audit_passes(tmp_path: Path):
+    content = "# T\n\nA fast tool.\n"
+    cfg = Config()
+    cfg.max_issues = 1
+    expected = AuditEngine(cfg).audit_content(filename="README.md", content=content)
+    assert not expected.passed
+
+    for favourite in ("missing_sections", "vague_claims"):
+        engine = AuditEngine(cfg, cache=ResultCache(tmp_path / favourite))
+        assert engine.rule_stats is not None
+        for rule in engine._plan:
+            engine.rule_stats.record(rule.id, 1.0, 100 if rule.id == favourite else 0)
+        report = engine.audit_content(filename="README.md", content=content)
+        assert report.passed == expected.passed
+        assert [i.severity for i in report.issues] == ["error"]
+
+    cfg.fail_on = "warning"
+    assert AuditEngine(cfg)._config_digest() != AuditEngine(Config())._config_digest()
+
+
+def test_parsing_is_not_billed_to_the_first_rule(tmp_path: Path):
+    engine = AuditEngine(Config(), cache=ResultCache(tmp_path / "cache"))
+    seen = []
+    for rule in engine._plan:
+        check = rule.check
+        rule.check = lambda content, context, _check=check: (
+            seen.append(context._tokens is not None) or _check(content, context)
+        )  # type: ignore[method-assign]
+    engine.audit_content(filename="README.md", content=NOISY)
+    assert seen and all(seen)
+
+
+def test_cli_persists_rule_stats_in_the_cache_dir(tmp_path: Path):
+    readme = tmp_path / "README.md"
+    readme.write_text(NOISY, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    runner.invoke(app, [str(readme), "--cache", "--cache-dir", str(cache_dir)])
+    stats = RuleStats(cache_dir / RULE_STATS_FILE)
+    assert stats.average("vague_claims") is not None
+    assert ResultCache(cache_dir).size() > 0
+
+
+def test_pool_workers_register_a_stats_save_for_exit(tmp_path: Path, worker_state):
+    from readme_auditor import parallel
+
+    parallel._init_worker(Config(), ResultCache(tmp_path / "worker-cache"))
+    assert parallel._ENGINE is not None and parallel._ENGINE.rule_stats is not None
+    assert worker_state == [parallel._ENGINE.rule_stats.save]
+
+
+def test_cli_jobs_persists_rule_stats_from_the_workers(tmp_path: Path, tmp_corpus):
+    root = tmp_path / "corpus"
+    tmp_corpus(3, root)
+    cache_dir = tmp_path / "cache"
+    runner.invoke(app, [str(root), "-r", "--cache", "--cache-dir", str(cache_dir), "--jobs", "2"])
+    stats = RuleStats(cache_dir / RULE_STATS_FILE)
+    assert stats.average("vague_claims") is not None
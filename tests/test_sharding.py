@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from readme_auditor.cli import app
+from readme_auditor.sharding import merge_outputs, parse_shard, select_shard, shard_of
+
+runner = CliRunner()
+
+
+def test_parse_shard_is_one_based_and_validated():
+    assert parse_shard("1/4") == (0, 4)
+    assert parse_shard("4/4") == (3, 4)
+    for bad in ("0/4", "5/4", "2", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_shards_partition_paths_stably(tmp_path: Path, tmp_corpus):
+    paths = tmp_corpus(20, tmp_path)
+    slices = [list(select_shard(paths, tmp_path, i, 3)) for i in range(3)]
+    assert sorted(p for s in slices for p in s) == sorted(paths)
+    assert all(slices)
+    assert shard_of("pkg00/README.md", 3) == shard_of("pkg00/README.md", 3)
+    assert list(
+        select_shard(
+            [Path("/elsewhere/README.md")], tmp_path, shard_of("/elsewhere/README.md", 2), 2
+        )
+    )
+
+
+def test_sharded_runs_merge_to_the_full_run(tmp_path: Path, tmp_corpus):
+    root = tmp_path / "corpus"
+    tmp_corpus(12, root)
+    outputs = []
+    for i, fmt in ((1, "ndjson"), (2, "json"), (3, "ndjson")):
+        out = tmp_path / f"shard{i}.out"
+        result = runner.invoke(
+            app,
+            [
+                str(root),
+                "-r",
+                "--shard",
+                f"{i}/3",
+                "--format",
+                fmt,
+                "--output",
+                str(out),
+                "--fail-on",
+                "warning",
+            ],
+        )
+        assert result.exit_code in (0, 1)
+        outputs.append(out)
+
+    full = runner.invoke(app, [str(root), "-r", "--format", "ndjson", "--fail-on", "warning"])
+    expected = json.loads(full.stdout.splitlines()[-1])
+
+    merged = runner.invoke(
+        app, ["merge", *map(str, outputs), outputs[0].as_posix(), "--format", "ndjson"]
+    )
+    record = json.loads(merged.stdout)
+    assert record["summary"] == expected["summary"] and record["files"] == expected["files"] == 12
+    assert merged.exit_code == full.exit_code == 1
+
+    summary, files, passed = merge_outputs(outputs)
+    assert (summary.as_dict(), files, passed) == (expected["summary"], 12, False)
+
+    human = runner.invoke(app, ["merge", *map(str, outputs)])
+    assert "12 files" in human.stdout and "failed" in human.stdout
+    as_json = runner.invoke(app, ["merge", str(outputs[1]), "--format", "json"])
+    assert json.loads(as_json.stdout)["files"] >= 1
+
+
+def test_merge_rejects_missing_and_malformed_inputs(tmp_path: Path):
+    assert runner.invoke(app, ["merge", str(tmp_path / "missing.ndjson")]).exit_code == 2
+    bad = tmp_path / "bad.ndjson"
+    bad.write_text("{not json", encoding="utf-8")
+    assert runner.invoke(app, ["merge", str(bad)]).exit_code == 2
+    empty = tmp_path / "empty.ndjson"
+    empty.write_text("", encoding="utf-8")
+    result = runner.invoke(app, ["merge", str(empty)])
+    assert result.exit_code == 0 and "0 files" in result.stdout
+
+
+def test_shard_option_validation_and_empty_shards(tmp_path: Path):
+    assert runner.invoke(app, [str(tmp_path), "--shard", "9/2"]).exit_code == 2
+    readme = tmp_path / "README.md"
+    readme.write_text("# A\n", encoding="utf-8")
+    owner = shard_of("README.md", 2)
+    result = runner.invoke(app, [str(tmp_path), "--shard", f"{2 - owner}/2", "--format", "json"])
+    assert result.exit_code == 0
+    assert "this shard" in result.output
+
+
+def test_empty_shard_writes_an_output_that_merges(tmp_path: Path, tmp_corpus):
+    root = tmp_path / "corpus"
+    (readme,) = tmp_corpus(1, root)
+    owner = shard_of(readme.relative_to(root).as_posix(), 2)
+    outputs = []
+    for i in (1, 2):
+        out = tmp_path / f"s{i}.ndjson"
+        runner.invoke(
+            app, [str(root), "-r", "--shard", f"{i}/2", "--format", "ndjson", "--output", str(out)]
+        )
+        outputs.append(str(out))
+    assert json.loads((tmp_path / f"s{2 - owner}.ndjson").read_text(encoding="utf-8"))["files"] == 0
+
+    result = runner.invoke(app, ["merge", *outputs, "--format", "json"])
+    assert result.exit_code in (0, 1)
+    assert json.loads(result.stdout)["files"] == 1
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import readme_auditor.formatters as formatters
+import readme_auditor.rules as rules
+
+# Total `-X importtime` self time for a JSON audit, in milliseconds. Generous on
+# purpose: it catches an eager Rich or rule import creeping back in, not noise.
+IMPORT_BUDGET_MS = float(os.environ.get("README_AUDITOR_IMPORT_BUDGET_MS", "600"))
+
+
+def _importtime(fixture: Path) -> tuple[float, list[str]]:
+    code = (
+        "from readme_auditor.cli import app; "
+        f"app([{str(fixture)!r}, '--format', 'json', '--jobs', '1'], standalone_mode=False)"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    total_us = 0
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        total_us += int(self_us)
+        modules.append(name.strip())
+    return total_us / 1000, modules
+
+
+def test_json_path_skips_rich_and_stays_within_import_budget(fixtures_dir: Path):
+    total_ms, modules = _importtime(fixtures_dir / "good_readme.md")
+    assert not [m for m in modules if m == "rich" or m.startswith("rich.")]
+    assert "readme_auditor.formatters.human" not in modules
+    assert total_ms < IMPORT_BUDGET_MS, f"JSON path imports took {total_ms:.0f} ms"
+
+
+def test_rules_package_resolves_classes_lazily():
+    from readme_auditor.rules import RULES, Rule, VagueClaimsRule
+
+    assert RULES["vague_claims"] is VagueClaimsRule
+    assert issubclass(VagueClaimsRule, Rule)
+    assert rules.rule_ids()[0] == "vague_claims"
+    with pytest.raises(AttributeError):
+        rules.NotARule  # noqa: B018
+
+
+def test_formatters_package_resolves_human_lazily():
+    from readme_auditor.formatters import HumanFormatter
+    from readme_auditor.formatters.human import HumanFormatter as Direct
+
+    assert HumanFormatter is Direct
+    with pytest.raises(AttributeError):
+        formatters.NotAFormatter  # noqa: B018
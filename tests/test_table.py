@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import csv
+import io
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine, summarize
+from readme_auditor.models import Config, Issue
+from readme_auditor.table import IssueTable
+
+runner = CliRunner()
+
+
+def _reports():
+    cfg = Config()
+    cfg.severity_threshold = "info"
+    engine = AuditEngine(cfg)
+    return [
+        engine.audit_content(
+            filename="repo-a/README.md", content="# A\n\nA fast tool.\nIt never crashes.\n"
+        ),
+        engine.audit_content(filename="repo-a/docs/README.md", content="# D\n\nA simple tool.\n"),
+        engine.audit_content(filename="repo-b/README.md", content="# B\n"),
+    ]
+
+
+def test_counts_match_the_issue_objects():
+    reports = _reports()
+    table = IssueTable.from_reports(reports)
+    issues = [i for r in reports for i in r.issues]
+    assert len(table) == len(issues)
+
+    by_rule = table.count("rule")
+    assert sum(by_rule.values()) == len(issues)
+    assert by_rule[("vague_claims",)] == sum(1 for i in issues if i.rule_id == "vague_claims")
+
+    by_sev = {k[0]: n for k, n in table.count("severity").items()}
+    s = summarize(issues)
+    assert (by_sev.get("error", 0), by_sev.get("warning", 0), by_sev.get("info", 0)) == (
+        s.errors,
+        s.warnings,
+        s.info,
+    )
+
+    pairs = table.count("file", "severity")
+    assert sum(pairs.values()) == len(issues)
+    assert all(len(key) == 2 for key in pairs)
+
+    by_repo = table.count_by_file_group(lambda f: f.split("/", 1)[0])
+    assert by_repo == {
+        "repo-a": len(reports[0].issues) + len(reports[1].issues),
+        "repo-b": len(reports[2].issues),
+    }
+
+    with pytest.raises(ValueError):
+        table.count("repo")
+
+
+def test_top_files_and_csv_export():
+    reports = _reports()
+    table = IssueTable.from_reports(reports)
+    top = table.top_files(1)
+    assert top == [max(((r.filename, len(r.issues)) for r in reports), key=lambda x: x[1])]
+    errors = dict(table.top_files(5, min_severity="error"))
+    expected = {r.filename: sum(i.severity == "error" for i in r.issues) for r in reports}
+    assert errors == {name: n for name, n in expected.items() if n}
+
+    table.add(Issue("custom", "info", None, "no line", "e", "s"), "x.md")
+    buf = io.StringIO()
+    table.write_csv(buf)
+    rows = list(csv.reader(io.StringIO(buf.getvalue())))
+    assert rows[0] == ["filename", "line", "rule_id", "severity", "text"]
+    assert rows[-1] == ["x.md", "", "custom", "info", "no line"]
+    assert len(rows) == len(table) + 1
+
+
+def test_cli_issues_csv(tmp_path: Path):
+    readme = tmp_path / "README.md"
+    readme.write_text("# A\n\nA fast tool.\n", encoding="utf-8")
+    out = tmp_path / "issues.csv"
+    runner.invoke(app, [str(readme), "--format", "json", "--issues-csv", str(out)])
+    rows = list(csv.DictReader(out.open(encoding="utf-8")))
+    assert {r["rule_id"] for r in rows} >= {"vague_claims"}
+    assert all(r["filename"] == str(readme) for r in rows)
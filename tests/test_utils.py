@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 
-from readme_auditor.rules._utils import iter_matching_lines
+from readme_auditor.rules._utils import LineScanner, iter_matching_lines
 
 
 def test_iter_matching_lines_end_line_none_uses_full_length():
@@ -18,3 +18,31 @@ def test_iter_matching_lines_skips_out_of_bounds_lines():
     # start_line 0 produces an out of bounds lineno (0) and end_line beyond length
     matches = list(iter_matching_lines(lines, pat, start_line=0, end_line=3))
     assert matches and matches[0][0] == 1
+
+
+def test_line_scanner_matches_per_pattern_iteration():
+    lines = ["A fast tool", "it never crashes", "nothing here", "Fast and NEVER CRASHES"]
+    patterns = {
+        "a": re.compile(r"\bfast\b", re.IGNORECASE),
+        "b": re.compile(r"never\s+crash(?:es)?"),
+    }
+    hits = LineScanner(patterns).scan(lines)
+    for key, pat in patterns.items():
+        expected = [(n, t, m.group(0)) for n, t, m in iter_matching_lines(lines, pat)]
+        assert [(n, t, m.group(0)) for n, t, m in hits[key]] == expected
+
+
+def test_line_scanner_without_prefilter_for_unsupported_flags():
+    pat = re.compile(r"^two", re.MULTILINE)
+    scanner = LineScanner({"m": pat})
+    assert scanner._prefilter is None
+    assert [n for n, _, _ in scanner.scan(["one", "two"])["m"]] == [2]
+    assert not LineScanner({})
+    assert LineScanner({}).scan(["x"]) == {}
+
+
+def test_line_scanner_falls_back_when_combination_fails():
+    # Two patterns reusing the same group name cannot be joined into one regex.
+    scanner = LineScanner({"a": re.compile(r"(?P<w>x)"), "b": re.compile(r"(?P<w>y)")})
+    assert scanner._prefilter is None
+    assert scanner.scan(["y"])["b"][0][0] == 1
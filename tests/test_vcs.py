@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from readme_auditor import vcs
+from readme_auditor.cli import app
+from readme_auditor.vcs import GitError, changed_paths
+from readme_auditor.walker import IgnoreRules, iter_markdown, select_markdown
+
+from .conftest import git
+
+runner = CliRunner()
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    for rel in ("README.md", "a/README.md", "b/README.md", "b/gone/README.md"):
+        _write(root / rel, "# Doc\n\nA fast tool.\n")
+    git(root, "init", "-q", "-b", "main")
+    git(root, "add", ".")
+    git(root, "commit", "-q", "-m", "base")
+    git(root, "checkout", "-q", "-b", "feature")
+    _write(root / "a" / "README.md", "# Doc\n\nA fast tool, 10 ms per file.\n")
+    git(root, "rm", "-q", "b/gone/README.md")
+    git(root, "commit", "-q", "-am", "change")
+    _write(root / "b" / "README.md", "# Doc\n\nA simple tool.\n")
+    return root
+
+
+def test_changed_paths_since_ref_and_staged(repo: Path):
+    assert changed_paths(repo, since="main") == {
+        (repo / "a" / "README.md").resolve(),
+        (repo / "b" / "README.md").resolve(),
+    }
+    assert changed_paths(repo / "README.md", staged=True) == set()
+    git(repo, "add", "b/README.md")
+    assert changed_paths(repo, staged=True) == {(repo / "b" / "README.md").resolve()}
+    with pytest.raises(GitError):
+        changed_paths(repo, since="no-such-ref")
+
+
+def test_select_markdown_matches_the_walk(tmp_path: Path):
+    root = tmp_path / "tree"
+    files = [
+        _write(root / rel, "# x\n")
+        for rel in (
+            "z/README.md",
+            "README.md",
+            "a/b/README.md",
+            "a/README.md",
+            "node_modules/x/README.md",
+            "skip/README.md",
+            "a/notes.md",
+        )
+    ]
+    ignore = IgnoreRules(["skip/"])
+    outside = _write(tmp_path / "elsewhere" / "README.md", "# y\n")
+    got = select_markdown(root, [*files, outside, root / "missing" / "README.md"], ignore=ignore)
+    assert got == list(iter_markdown(root, ignore=ignore))
+    assert select_markdown(root, [root / "README.md"], ignore=IgnoreRules(["README.md"])) == []
+
+
+def test_cli_since_audits_only_changed_files(repo: Path):
+    result = runner.invoke(app, [str(repo), "--recursive", "--since", "main", "--format", "ndjson"])
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [Path(r["filename"]).parent.name for r in records if r["type"] == "report"] == ["a", "b"]
+
+    result = runner.invoke(app, [str(repo / "b"), "--since", "main", "--format", "json"])
+    assert str(repo / "b" / "README.md") in result.stdout
+
+
+def test_cli_changed_only_with_nothing_to_audit_passes(repo: Path, tmp_path: Path):
+    out, csv_out = tmp_path / "out.json", tmp_path / "issues.csv"
+    args = [
+        str(repo),
+        "--staged",
+        "--format",
+        "json",
+        "--output",
+        str(out),
+        "--issues-csv",
+        str(csv_out),
+    ]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "No changed" in result.output
+    assert out.read_text(encoding="utf-8") == ""
+    assert csv_out.read_text(encoding="utf-8").startswith("filename,line,rule_id")
+
+    result = runner.invoke(app, [str(repo), "-r", "--staged", "--format", "ndjson"])
+    assert json.loads(result.stdout.splitlines()[-1]) == {
+        "type": "summary",
+        "files": 0,
+        "summary": {"total": 0, "errors": 0, "warnings": 0, "info": 0},
+        "passed": True,
+    }
+
+
+def test_cli_since_outside_a_repository_is_a_usage_error(tmp_path: Path, monkeypatch):
+    _write(tmp_path / "README.md", "# x\n")
+    monkeypatch.setattr(vcs, "_command", lambda repo, *args: ["/nonexistent/git", *args])
+    result = runner.invoke(app, [str(tmp_path), "--since", "main"])
+    assert result.exit_code == 2
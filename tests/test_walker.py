@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from readme_auditor.cli import app
+from readme_auditor.walker import IgnoreRules, iter_markdown
+
+runner = CliRunner()
+
+GOOD = (
+    "# T\n\n## Installation\n\n```bash\nx\n```\n\n## Usage\n\n```bash\nx\n```\n\n"
+    "## Troubleshooting\n\nText\n\n## Limitations\n\nText\n\n## Contributing\n\nText\n\n## License\n\nMIT\n"
+)
+
+
+def _tree(root: Path) -> None:
+    for rel in (
+        "README.md",
+        "pkgs/a/README.md",
+        "pkgs/b/readme.md",
+        "pkgs/b/notes.md",
+        "pkgs/c/build/README.md",
+        "node_modules/dep/README.md",
+        ".git/README.md",
+        "docs/generated/README.md",
+    ):
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(GOOD, encoding="utf-8")
+
+
+def test_iter_markdown_skips_vendored_and_ignored(tmp_path: Path):
+    _tree(tmp_path)
+    ignore = IgnoreRules(["# comment", "", "!keep", "build/", "/docs/generated", "/"])
+    found = [p.relative_to(tmp_path).as_posix() for p in iter_markdown(tmp_path, ignore=ignore)]
+    assert found == ["README.md", "pkgs/a/README.md", "pkgs/b/readme.md"]
+
+
+def test_iter_markdown_is_lazy_and_tolerates_missing_root(tmp_path: Path):
+    _tree(tmp_path)
+    walker = iter_markdown(tmp_path)
+    assert next(walker) == tmp_path / "README.md"
+    assert list(iter_markdown(tmp_path / "missing")) == []
+
+
+def test_ignore_rules_file_patterns(tmp_path: Path):
+    gi = tmp_path / ".gitignore"
+    gi.write_text("*.tmp.md\npkgs/b/*.md\n", encoding="utf-8")
+    rules = IgnoreRules.from_file(gi, ["extra/"])
+    assert rules.match("x/y.tmp.md", "y.tmp.md", is_dir=False)
+    assert rules.match("pkgs/b/readme.md", "readme.md", is_dir=False)
+    assert rules.match("a/extra", "extra", is_dir=True)
+    assert not rules.match("a/extra", "extra", is_dir=False)
+    assert not IgnoreRules.from_file(tmp_path / "absent").match("a", "a", is_dir=False)
+
+
+def test_cli_recursive_audits_every_package(tmp_path: Path):
+    _tree(tmp_path)
+    result = runner.invoke(
+        app,
+        [str(tmp_path), "--recursive", "--exclude", "build/", "--jobs", "1", "--format", "json"],
+    )
+    assert result.exit_code == 0
+    assert str(tmp_path / "pkgs" / "a" / "README.md") in result.stdout
+    assert "node_modules" not in result.stdout
+    assert "build" not in result.stdout
+
+
+def test_cli_recursive_without_readmes_errors(tmp_path: Path):
+    (tmp_path / "docs").mkdir()
+    result = runner.invoke(app, [str(tmp_path), "--recursive"])
+    assert result.exit_code != 0
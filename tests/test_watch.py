@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from readme_auditor import watch
+from readme_auditor.cli import app
+from readme_auditor.engine import AuditEngine
+from readme_auditor.models import Config
+from readme_auditor.watch import Watcher, diff_reports
+
+runner = CliRunner()
+
+
+def _write(path: Path, text: str, stamp: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_diff_reports_ignores_line_shifts():
+    engine = AuditEngine(Config())
+    old = engine.audit_content(filename="a.md", content="# A\n\nA fast tool.\n")
+    new = engine.audit_content(
+        filename="a.md", content="# A\n\nIntro.\n\nA fast tool.\nIt never crashes.\n"
+    )
+    diff = diff_reports(old, new)
+    assert [i.rule_id for i in diff.added] == ["unfalsifiable"]
+    assert diff.resolved == []
+    back = diff_reports(new, old)
+    assert [i.rule_id for i in back.resolved] == ["unfalsifiable"]
+    assert back.as_json_dict()["resolved"][0]["rule_id"] == "unfalsifiable"
+
+
+def test_watcher_reaudits_only_changed_files(tmp_path: Path, monkeypatch):
+    a, b = tmp_path / "a.md", tmp_path / "b.md"
+    _write(a, "# A\n\nA fast tool.\n", 1_000_000_000)
+    _write(b, "# B\n", 1_000_000_000)
+    engine = AuditEngine(Config())
+    watcher = Watcher(engine, [a, b, tmp_path / "missing.md"])
+    first = watcher.poll()
+    assert [d.filename for d in first] == [str(a), str(b)]
+
+    audited = []
+    original = engine.audit_content
+    monkeypatch.setattr(
+        engine, "audit_content", lambda **kw: audited.append(kw["filename"]) or original(**kw)
+    )
+    assert watcher.poll() == []
+
+    _write(b, "# B\n", 2_000_000_000)  # touched, same content
+    assert watcher.poll() == []
+    _write(a, "# A\n\nA fast tool.\nIt never crashes.\n", 3_000_000_000)
+    (diff,) = watcher.poll()
+    assert [i.rule_id for i in diff.added] == ["unfalsifiable"]
+    assert audited == [str(a)]
+
+
+def test_watcher_run_wakes_on_change(tmp_path: Path):
+    a = tmp_path / "a.md"
+    _write(a, "# A\n", 1_000_000_000)
+    seen = []
+    Watcher(AuditEngine(Config()), [a], interval=0.01).run(seen.append, max_cycles=2)
+    assert [d.filename for d in seen] == [str(a)]
+
+    waker = watch._make_waker([tmp_path])
+    if waker is not None:
+        a.write_text("# A changed\n", encoding="utf-8")
+        waker.wait(1.0)
+        waker.wait(0.0)
+        waker.close()
+
+
+def _fake_run(path: Path, new_text: str):
+    def run(self: Watcher, emit, *, max_cycles=None) -> None:
+        for diff in self.poll():
+            emit(diff)
+        _write(path, new_text, 5_000_000_000)
+        for diff in self.poll():
+            emit(diff)
+        raise KeyboardInterrupt
+
+    return run
+
+
+def test_cli_watch_prints_full_report_then_diffs(tmp_path: Path, monkeypatch):
+    a = tmp_path / "README.md"
+    _write(a, "# A\n\nA fast tool.\n", 1_000_000_000)
+    monkeypatch.setattr(Watcher, "run", _fake_run(a, "# A\n\nIt never crashes.\n"))
+    result = runner.invoke(app, [str(a), "--watch", "--format", "human"])
+    assert result.exit_code == 0
+    assert "Found" in result.stdout
+    assert "+1 new, -1 resolved" in result.stdout
+
+
+def test_cli_watch_json_emits_diff_records(tmp_path: Path, monkeypatch):
+    a = tmp_path / "README.md"
+    _write(a, "# A\n\nA fast tool.\n", 1_000_000_000)
+    monkeypatch.setattr(Watcher, "run", _fake_run(a, "# A\n\nIt never crashes.\n"))
+    result = runner.invoke(app, [str(a), "--watch", "--format", "json"])
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["type"] for r in records] == ["report", "diff"]
+
+
+def test_cli_watch_rejects_output(tmp_path: Path, fixtures_dir: Path):
+    result = runner.invoke(
+        app, [str(fixtures_dir / "good_readme.md"), "--watch", "--output", str(tmp_path / "o")]
+    )
+    assert result.exit_code != 0